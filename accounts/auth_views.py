@@ -2,7 +2,6 @@ import logging
 import uuid
 
 from django.conf import settings
-from django.core.cache import cache
 from django.core.mail import send_mail
 from django.utils import timezone
 from rest_framework import status
@@ -16,8 +15,10 @@ from rest_framework_simplejwt.views import TokenObtainPairView
 from .models import User
 from audit.models import ActionType
 from audit.utils import log_action
+from core.cache import NamespacedCache
 
 logger = logging.getLogger(__name__)
+auth_cache = NamespacedCache("accounts")
 
 try:
     from django_ratelimit.decorators import ratelimit
@@ -96,11 +97,12 @@ class RateLimitedTokenObtainPairView(TokenObtainPairView):
 
     def _is_rate_limited(self, request):
         key = f"login_rate_limit:{self._client_ip(request)}"
-        count = cache.get(key, 0)
-        if count >= 5:
-            return True
-        cache.set(key, count + 1, timeout=60)
-        return False
+        try:
+            attempts = auth_cache.incr(key, timeout=60)
+        except Exception:
+            logger.warning("login rate limit cache unavailable", exc_info=True)
+            return False
+        return attempts > 5
 
     def _log_failed_login(self, request):
         class LoginAttempt:
@@ -0,0 +1,34 @@
+# Trigram index for the senior directory's ?search= (username__icontains compiles to
+# UPPER(username) LIKE UPPER(%s)). PostgreSQL only; SQLite cannot build expression GIN indexes.
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+INDEX_NAME = "accounts_user_username_upper_trgm_idx"
+
+
+def create_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON accounts_user USING gin (UPPER("username") gin_trgm_ops)'
+    )
+
+
+def drop_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0016_remove_founding_editor_role"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(create_index, drop_index),
+    ]
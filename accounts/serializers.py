@@ -9,15 +9,21 @@ from profiles.models import VerifiedNiatStudentProfile
 
 
 def _get_senior_follower_count(user):
+    # Directory querysets annotate this from SeniorProfile.follower_count.
+    if hasattr(user, "senior_follower_count"):
+        return user.senior_follower_count
     try:
         return user.senior_profile.follower_count
     except Exception:
         return 0
 
 
-def _get_is_followed_by_me(request, user):
+def _get_is_followed_by_me(request, user, followed_ids=None):
+    """`followed_ids`: the viewer's followed senior ids, when the caller loaded them for the whole page."""
     if not request or not request.user.is_authenticated:
         return None
+    if followed_ids is not None:
+        return user.pk in followed_ids
     from verification.models import SeniorFollow
     return SeniorFollow.objects.filter(follower=request.user, senior=user).exists()
 
@@ -67,7 +73,9 @@ class PublicProfileSerializer(serializers.ModelSerializer):
         return _get_senior_follower_count(obj)
 
     def get_is_followed_by_me(self, obj):
-        return _get_is_followed_by_me(self.context.get("request"), obj)
+        return _get_is_followed_by_me(
+            self.context.get("request"), obj, self.context.get("followed_senior_ids")
+        )
 
 
 class AuthorProfileSerializer(serializers.ModelSerializer):
@@ -115,7 +123,7 @@ class AuthorProfileSerializer(serializers.ModelSerializer):
         profile = self._get_verified_profile(obj)
         if not profile or profile.campus_id is None:
             return None
-        return str(profile.campus_id_id)
+        return str(profile.campus_id)
 
     def get_campus_name(self, obj):
         profile = self._get_verified_profile(obj)
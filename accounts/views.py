@@ -24,7 +24,7 @@ from core.permissions import IsFoundingEditor
 from profiles.models import VerifiedNiatStudentProfile
 from verification.models import MagicLoginToken
 from articles.models import Article
-from articles.serializers import ArticleListSerializer
+from articles.serializers import ArticleListSerializer, with_author_linkedin
 
 def _bad_request(payload):
     return Response(payload, status=status.HTTP_400_BAD_REQUEST)
@@ -393,7 +393,7 @@ class AuthorProfileWithArticlesView(APIView):
             return Response({"code": "NOT_FOUND", "detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
 
         profile_data = AuthorProfileSerializer(user, context={"request": request}).data
-        queryset = (
+        queryset = with_author_linkedin(
             Article.objects
             .filter(author_id=user, status="published")
             .select_related("author_id", "campus_id", "category_fk")
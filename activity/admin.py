@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import EngagementLog
+from .models import EngagementDailyRollup, EngagementLog
 
 
 @admin.register(EngagementLog)
@@ -9,3 +9,10 @@ class EngagementLogAdmin(admin.ModelAdmin):
     raw_id_fields = ("user",)
     date_hierarchy = "created_at"
     readonly_fields = ("created_at",)
+
+
+@admin.register(EngagementDailyRollup)
+class EngagementDailyRollupAdmin(admin.ModelAdmin):
+    list_display = ("date", "action", "content_type", "object_id", "events", "unique_users", "total_dwell_ms")
+    list_filter = ("action", "content_type")
+    date_hierarchy = "date"
@@ -0,0 +1,160 @@
+"""
+Engagement event ingestion.
+
+The events endpoint validates a batch of client events and appends them to a
+buffer in the shared cache; nothing is written to the database in the request.
+flush_events() (Celery beat, every ENGAGEMENT_FLUSH_INTERVAL seconds) moves the
+buffer into EngagementLog with bulk_create. The buffer is a Redis list that is
+renamed aside while it is flushed, so appends never wait on a flush. It is read
+and trimmed FLUSH_BATCH_SIZE events at a time, and a flush that dies part-way is
+resumed on the next run; each event carries its primary key from ingestion, so a
+replayed chunk does not duplicate rows. Buffering needs Redis: other caches are
+per-process or discard writes, so without Redis (or with ENGAGEMENT_BUFFERING
+off, or while Redis is unreachable) each batch is handed to the
+write_engagement_events Celery task instead. The request never writes to the
+database; if the task cannot be queued either, the batch is logged and dropped.
+"""
+import json
+import logging
+import uuid
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from core.cache import NamespacedCache
+
+from .models import EngagementLog
+
+logger = logging.getLogger("activity.ingest")
+
+# Public target names accepted from clients -> model label.
+ENGAGEMENT_TARGETS = {
+    "article": "articles.Article",
+    "question": "qa.Question",
+}
+ENGAGEMENT_ACTIONS = ("view", "click", "dwell")
+MAX_EVENTS_PER_BATCH = 100
+FLUSH_BATCH_SIZE = 1000
+FLUSH_LOCK_TIMEOUT = 5 * 60
+
+event_cache = NamespacedCache("activity:events")
+
+
+def _redis():
+    """(client, pending_key, flushing_key) when the cache is Redis, else None."""
+    backend = event_cache.backend
+    client_factory = getattr(getattr(backend, "_cache", None), "get_client", None)
+    if client_factory is None:
+        return None
+    pending = backend.make_and_validate_key(event_cache.key("pending"))
+    flushing = backend.make_and_validate_key(event_cache.key("flushing"))
+    return client_factory(pending, write=True), pending, flushing
+
+
+def _occurred_at(value, now):
+    # Client clocks are untrusted: ignore timestamps in the future or more than a day old.
+    if value is None or value > now or (now - value).days >= 1:
+        return now
+    return value
+
+
+def record_events(events, user=None, session_key=""):
+    """Buffer validated events ({action, target, id, dwell_ms?, ts?}); returns how many were accepted."""
+    now = timezone.now()
+    rows = [
+        {
+            "id": uuid.uuid4().hex,
+            "action": event["action"],
+            "target": ENGAGEMENT_TARGETS[event["target"]],
+            "object_id": str(event["id"]),
+            "user_id": str(user.pk) if user is not None else None,
+            "session_key": session_key or "",
+            "dwell_ms": event.get("dwell_ms"),
+            "created_at": _occurred_at(event.get("ts"), now).isoformat(),
+        }
+        for event in events
+    ]
+    if not rows:
+        return 0
+    redis = _redis() if getattr(settings, "ENGAGEMENT_BUFFERING", True) else None
+    if redis is not None:
+        client, pending, _ = redis
+        try:
+            client.rpush(pending, *(json.dumps(row) for row in rows))
+            return len(rows)
+        except Exception:
+            logger.warning("Engagement buffer unavailable, queueing %s events", len(rows), exc_info=True)
+    return _queue(rows)
+
+
+def _queue(rows):
+    from .tasks import write_engagement_events
+
+    try:
+        write_engagement_events.delay(rows)
+    except Exception:
+        # Analytics beacons must not fail the request; losing a batch is acceptable.
+        logger.warning("Dropped %s engagement events, task queue unavailable", len(rows), exc_info=True)
+        return 0
+    return len(rows)
+
+
+def write_events(rows):
+    """Insert event rows as produced by record_events(); rows already stored are ignored."""
+    content_types = {}
+    # Accounts deleted since the event was buffered would fail the user FK.
+    user_ids = {row["user_id"] for row in rows if row["user_id"]}
+    live_users = {
+        str(pk) for pk in get_user_model().objects.filter(pk__in=user_ids).values_list("pk", flat=True)
+    } if user_ids else set()
+    logs = []
+    for row in rows:
+        label = row["target"]
+        if label not in content_types:
+            content_types[label] = ContentType.objects.get_for_model(apps.get_model(label))
+        logs.append(
+            EngagementLog(
+                id=uuid.UUID(row["id"]),
+                action=row["action"],
+                content_type=content_types[label],
+                object_id=uuid.UUID(row["object_id"]),
+                user_id=row["user_id"] if row["user_id"] in live_users else None,
+                session_key=row["session_key"],
+                dwell_ms=row["dwell_ms"],
+                created_at=parse_datetime(row["created_at"]),
+            )
+        )
+    EngagementLog.objects.bulk_create(logs, batch_size=FLUSH_BATCH_SIZE, ignore_conflicts=True)
+
+
+def flush_events():
+    """Write buffered events to EngagementLog; returns the number of events flushed."""
+    redis = _redis()
+    if redis is None or not event_cache.add("lock", 1, FLUSH_LOCK_TIMEOUT):
+        return 0
+    client, pending, flushing = redis
+    flushed = 0
+    try:
+        # Same hand-off as core.counters: finish a leftover "flushing" list first.
+        # Only appends touch "pending" and only the lock holder moves it.
+        if not client.exists(flushing):
+            if not client.exists(pending):
+                return 0
+            client.rename(pending, flushing)
+        while True:
+            lines = client.lrange(flushing, 0, FLUSH_BATCH_SIZE - 1)
+            if not lines:
+                break
+            write_events([json.loads(line) for line in lines])
+            # Trimmed only once written; a crash in between replays the chunk harmlessly.
+            client.ltrim(flushing, len(lines), -1)
+            flushed += len(lines)
+        if flushed:
+            logger.info("Flushed engagement events", extra={"events": flushed})
+        return flushed
+    finally:
+        event_cache.delete("lock")
@@ -0,0 +1,31 @@
+"""
+Flush buffered engagement events and rebuild daily rollups.
+Usage:
+  python manage.py rollup_engagement              # today and yesterday
+  python manage.py rollup_engagement --days 30    # backfill the last 30 days
+  python manage.py rollup_engagement --date 2026-01-15
+"""
+from datetime import date
+
+from django.core.management.base import BaseCommand
+
+from activity.ingest import flush_events
+from activity.rollup import rollup_day, rollup_recent
+
+
+class Command(BaseCommand):
+    help = "Flush buffered engagement events and rebuild EngagementDailyRollup rows"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--date", type=date.fromisoformat, help="Roll up only this day (YYYY-MM-DD).")
+        parser.add_argument("--days", type=int, default=2, help="Days to roll up, ending today (default: 2).")
+
+    def handle(self, *args, **options):
+        flushed = flush_events()
+        self.stdout.write(f"Flushed {flushed} buffered event(s).")
+        if options["date"]:
+            results = {options["date"]: rollup_day(options["date"])}
+        else:
+            results = rollup_recent(max(1, options["days"]))
+        for day, rows in sorted(results.items()):
+            self.stdout.write(self.style.SUCCESS(f"{day}: {rows} rollup row(s)."))
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:28
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('activity', '0001_initial'),
+        ('contenttypes', '0002_remove_content_type_name'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='engagementlog',
+            name='dwell_ms',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='engagementlog',
+            name='created_at',
+            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now, editable=False),
+        ),
+        migrations.CreateModel(
+            name='EngagementDailyRollup',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('date', models.DateField()),
+                ('object_id', models.UUIDField()),
+                ('action', models.CharField(max_length=32)),
+                ('events', models.PositiveIntegerField(default=0)),
+                ('unique_users', models.PositiveIntegerField(default=0)),
+                ('unique_sessions', models.PositiveIntegerField(default=0)),
+                ('total_dwell_ms', models.PositiveBigIntegerField(default=0)),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype')),
+            ],
+            options={
+                'verbose_name': 'Engagement daily rollup',
+                'verbose_name_plural': 'Engagement daily rollups',
+                'db_table': 'activity_engagement_daily',
+                'indexes': [models.Index(fields=['content_type', 'object_id', 'date'], name='activity_daily_target_idx')],
+                'constraints': [models.UniqueConstraint(fields=('date', 'content_type', 'object_id', 'action'), name='activity_daily_rollup_uniq')],
+            },
+        ),
+    ]
@@ -1,20 +1,23 @@
 """
-NIATReviews.com — Activity app (optional).
-Engagement logs for metrics: post/comment views, optional click events.
-Lightweight; can be aggregated or moved to Redis/analytics pipeline at scale.
+NIATReviews.com — Activity app.
+Engagement logs for metrics: article/question views, clicks and dwell time.
+Clients post batches of events to /api/activity/events/; they are buffered in the
+cache and bulk-inserted by a beat task (activity.ingest), then aggregated into
+EngagementDailyRollup rows.
 """
 import uuid
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
+from django.utils import timezone
 
 
 class EngagementLog(models.Model):
     """
     Generic log entry: user (optional), action, target object.
-    Use for view counts, clicks; keep minimal for high write volume.
-    Consider async writes or Redis for 2–3k concurrent users.
+    Use for view counts, clicks and dwell time; keep minimal for high write volume.
+    Never written in the request path: see activity.ingest.
     """
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     user = models.ForeignKey(
@@ -36,7 +39,9 @@ class EngagementLog(models.Model):
 
     # Optional: session or IP for anonymous; store hashed if needed for privacy
     session_key = models.CharField(max_length=40, blank=True, db_index=True)
-    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    dwell_ms = models.PositiveIntegerField(null=True, blank=True)
+    # When the event happened; rows are written later, in batches.
+    created_at = models.DateTimeField(default=timezone.now, editable=False, db_index=True)
 
     class Meta:
         db_table = "activity_engagement_log"
@@ -49,3 +54,32 @@ class EngagementLog(models.Model):
 
     def __str__(self):
         return f"{self.action}({self.content_type.model}:{self.object_id})"
+
+
+class EngagementDailyRollup(models.Model):
+    """Per-day totals of EngagementLog by target and action; rebuilt by activity.rollup."""
+    id = models.BigAutoField(primary_key=True)
+    date = models.DateField()
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.UUIDField()
+    action = models.CharField(max_length=32)
+    events = models.PositiveIntegerField(default=0)
+    unique_users = models.PositiveIntegerField(default=0)
+    unique_sessions = models.PositiveIntegerField(default=0)
+    total_dwell_ms = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        db_table = "activity_engagement_daily"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["date", "content_type", "object_id", "action"], name="activity_daily_rollup_uniq"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["content_type", "object_id", "date"], name="activity_daily_target_idx"),
+        ]
+        verbose_name = "Engagement daily rollup"
+        verbose_name_plural = "Engagement daily rollups"
+
+    def __str__(self):
+        return f"{self.date} {self.action}({self.content_type_id}:{self.object_id}) = {self.events}"
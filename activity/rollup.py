@@ -0,0 +1,48 @@
+"""
+Daily engagement rollups.
+
+rollup_day() recomputes one day's EngagementDailyRollup rows from EngagementLog
+with a single GROUP BY and upserts them, so it is idempotent and can be re-run
+for a day whose late events were flushed after the first pass. Days are UTC
+(TIME_ZONE). Rollups are kept after the raw events expire (core.retention).
+"""
+from datetime import datetime, time, timedelta
+
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .models import EngagementDailyRollup, EngagementLog
+
+ROLLUP_FIELDS = ["events", "unique_users", "unique_sessions", "total_dwell_ms"]
+
+
+def rollup_day(day):
+    """Rebuild the rollup rows for `day` (a date); returns the number of rows written."""
+    start = timezone.make_aware(datetime.combine(day, time.min))
+    totals = (
+        EngagementLog.objects.filter(created_at__gte=start, created_at__lt=start + timedelta(days=1))
+        .values("content_type_id", "object_id", "action")
+        .annotate(
+            events=Count("id"),
+            unique_users=Count("user", distinct=True),
+            unique_sessions=Count("session_key", distinct=True, filter=~Q(session_key="")),
+            total_dwell_ms=Coalesce(Sum("dwell_ms"), 0),
+        )
+        .order_by()
+    )
+    rows = [EngagementDailyRollup(date=day, **row) for row in totals]
+    EngagementDailyRollup.objects.bulk_create(
+        rows,
+        batch_size=1000,
+        update_conflicts=True,
+        unique_fields=["date", "content_type", "object_id", "action"],
+        update_fields=ROLLUP_FIELDS,
+    )
+    return len(rows)
+
+
+def rollup_recent(days=2):
+    """Roll up today and the previous `days - 1` days; returns {date: rows}."""
+    today = timezone.localdate()
+    return {today - timedelta(days=offset): rollup_day(today - timedelta(days=offset)) for offset in range(days)}
@@ -0,0 +1,16 @@
+from rest_framework import serializers
+
+from .ingest import ENGAGEMENT_ACTIONS, ENGAGEMENT_TARGETS, MAX_EVENTS_PER_BATCH
+
+
+class EngagementEventSerializer(serializers.Serializer):
+    action = serializers.ChoiceField(choices=ENGAGEMENT_ACTIONS)
+    target = serializers.ChoiceField(choices=sorted(ENGAGEMENT_TARGETS))
+    id = serializers.UUIDField()
+    dwell_ms = serializers.IntegerField(min_value=0, max_value=24 * 60 * 60 * 1000, required=False)
+    ts = serializers.DateTimeField(required=False)
+
+
+class EngagementBatchSerializer(serializers.Serializer):
+    events = serializers.ListField(child=EngagementEventSerializer(), allow_empty=False, max_length=MAX_EVENTS_PER_BATCH)
+    session = serializers.CharField(max_length=40, required=False, allow_blank=True)
@@ -0,0 +1,33 @@
+import logging
+
+from celery import shared_task
+
+from .ingest import flush_events, write_events
+from .rollup import rollup_recent
+
+logger = logging.getLogger("activity.tasks")
+
+
+@shared_task
+def flush_engagement_events():
+    """Beat task: bulk-insert buffered engagement events."""
+    try:
+        return flush_events()
+    except Exception:
+        # Events stay buffered and are retried on the next beat tick.
+        logger.exception("flush_engagement_events.failure")
+        raise
+
+
+@shared_task
+def write_engagement_events(rows):
+    """Insert a batch of engagement events that could not be buffered in Redis."""
+    write_events(rows)
+    return len(rows)
+
+
+@shared_task
+def rollup_engagement():
+    """Beat task: refresh today's and yesterday's daily engagement rollups."""
+    flush_events()
+    return {day.isoformat(): rows for day, rows in rollup_recent().items()}
@@ -0,0 +1,149 @@
+"""Engagement event ingestion and daily rollups."""
+import uuid
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from activity import ingest
+from activity.ingest import MAX_EVENTS_PER_BATCH, _redis, event_cache, flush_events
+from activity.models import EngagementDailyRollup, EngagementLog
+from activity.rollup import rollup_day
+from activity.tasks import write_engagement_events
+from articles.models import Article
+
+URL = "/api/activity/events/"
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+class EngagementIngestTests(TestCase):
+    def setUp(self):
+        for key in ("pending", "flushing", "lock"):
+            event_cache.delete(key)
+        self.client = APIClient()
+        self.user = User.objects.create(username="reader", email="reader@example.com")
+        self.article_id = str(uuid.uuid4())
+        # Batches that cannot be buffered go to Celery; run them in-process.
+        patcher = mock.patch.object(write_engagement_events, "delay", side_effect=write_engagement_events)
+        self.delay = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _post(self, events, **extra):
+        return self.client.post(URL, {"events": events, **extra}, format="json")
+
+    def _require_redis(self):
+        if _redis() is None:
+            self.skipTest("event buffering needs the Redis cache")
+
+    def test_events_are_buffered_without_database_writes(self):
+        self._require_redis()
+        events = [
+            {"action": "view", "target": "article", "id": self.article_id},
+            {"action": "click", "target": "article", "id": self.article_id},
+            {"action": "dwell", "target": "question", "id": str(uuid.uuid4()), "dwell_ms": 4200},
+        ]
+        with self.assertNumQueries(0):
+            response = self._post(events, session="tab-1")
+        self.assertEqual(response.status_code, 202, response.content)
+        self.assertEqual(response.json(), {"accepted": 3})
+        self.assertEqual(EngagementLog.objects.count(), 0)
+
+        self.assertEqual(flush_events(), 3)
+        self.assertEqual(flush_events(), 0)
+        self.assertEqual(EngagementLog.objects.count(), 3)
+        dwell = EngagementLog.objects.get(action="dwell")
+        self.assertEqual((dwell.dwell_ms, dwell.session_key), (4200, "tab-1"))
+        self.assertEqual(dwell.content_type.model, "question")
+
+    def test_flush_reads_the_buffer_in_chunks(self):
+        self._require_redis()
+        self._post([{"action": "view", "target": "article", "id": self.article_id}] * 5)
+        with mock.patch.object(ingest, "FLUSH_BATCH_SIZE", 2), mock.patch.object(
+            ingest, "write_events", wraps=ingest.write_events
+        ) as write:
+            self.assertEqual(flush_events(), 5)
+        self.assertEqual([len(call.args[0]) for call in write.call_args_list], [2, 2, 1])
+        self.assertEqual(EngagementLog.objects.count(), 5)
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_without_redis_batches_are_queued_not_written_inline(self):
+        self.delay.side_effect = None
+        with self.assertNumQueries(0):
+            response = self._post([{"action": "view", "target": "article", "id": self.article_id}])
+        self.assertEqual(response.json(), {"accepted": 1})
+        self.delay.assert_called_once()
+        self.assertEqual(EngagementLog.objects.count(), 0)
+
+        write_engagement_events(*self.delay.call_args.args)
+        self.assertEqual(EngagementLog.objects.count(), 1)
+        self.assertEqual(flush_events(), 0)
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_batches_are_dropped_when_the_task_queue_is_down(self):
+        self.delay.side_effect = ConnectionError("broker down")
+        with self.assertLogs("activity.ingest", "WARNING"):
+            response = self._post([{"action": "view", "target": "article", "id": self.article_id}])
+        self.assertEqual((response.status_code, response.json()), (202, {"accepted": 0}))
+        self.assertEqual(EngagementLog.objects.count(), 0)
+
+    def test_redis_outage_falls_back_to_the_task(self):
+        client = mock.Mock()
+        client.rpush.side_effect = ConnectionError("redis down")
+        with mock.patch.object(ingest, "_redis", return_value=(client, "pending", "flushing")):
+            with self.assertLogs("activity.ingest", "WARNING"):
+                response = self._post([{"action": "view", "target": "article", "id": self.article_id}])
+        self.assertEqual(response.json(), {"accepted": 1})
+        self.delay.assert_called_once()
+        self.assertEqual(EngagementLog.objects.count(), 1)
+
+    def test_authenticated_events_keep_the_user_and_client_time(self):
+        self.client.force_authenticate(self.user)
+        ts = timezone.now() - timedelta(minutes=5)
+        self._post([{"action": "view", "target": "article", "id": self.article_id, "ts": ts.isoformat()}])
+        self._post([{"action": "view", "target": "article", "id": self.article_id, "ts": "2001-01-01T00:00:00Z"}])
+        flush_events()
+        logs = list(EngagementLog.objects.order_by("created_at"))
+        self.assertEqual([log.user_id for log in logs], [self.user.pk, self.user.pk])
+        self.assertEqual(logs[0].created_at, ts)
+        # Timestamps more than a day old are replaced with the server time.
+        self.assertGreater(logs[1].created_at, ts)
+
+    def test_invalid_batches_are_rejected(self):
+        event = {"action": "view", "target": "article", "id": self.article_id}
+        self.assertEqual(self._post([{**event, "target": "campus"}]).status_code, 400)
+        self.assertEqual(self._post([{**event, "action": "scroll"}]).status_code, 400)
+        self.assertEqual(self._post([event] * (MAX_EVENTS_PER_BATCH + 1)).status_code, 400)
+        self.assertEqual(self._post([]).status_code, 400)
+
+    def test_rollup_day_is_idempotent(self):
+        article_type = ContentType.objects.get_for_model(Article)
+        today = timezone.localdate()
+        for user, session, dwell in [(self.user, "a", 1000), (self.user, "b", 500), (None, "c", None)]:
+            EngagementLog.objects.create(
+                user=user, action="view", content_type=article_type, object_id=self.article_id,
+                session_key=session, dwell_ms=dwell,
+            )
+        EngagementLog.objects.create(
+            action="view", content_type=article_type, object_id=self.article_id,
+            created_at=timezone.now() - timedelta(days=2),
+        )
+
+        self.assertEqual(rollup_day(today), 1)
+        self.assertEqual(rollup_day(today), 1)
+        rollup = EngagementDailyRollup.objects.get(date=today)
+        self.assertEqual(
+            (rollup.events, rollup.unique_users, rollup.unique_sessions, rollup.total_dwell_ms), (3, 1, 3, 1500)
+        )
+
+    def test_command_flushes_and_rolls_up(self):
+        self._post([{"action": "view", "target": "article", "id": self.article_id}])
+        out = StringIO()
+        call_command("rollup_engagement", stdout=out)
+        self.assertIn("buffered event(s).", out.getvalue())
+        self.assertEqual(EngagementDailyRollup.objects.get().events, 1)
@@ -1 +1,8 @@
 # activity API URLs
+from django.urls import path
+
+from .views import EngagementEventIngestView
+
+urlpatterns = [
+    path("events/", EngagementEventIngestView.as_view(), name="engagement-events"),
+]
@@ -0,0 +1,21 @@
+# activity API views
+from rest_framework import status
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .ingest import record_events
+from .serializers import EngagementBatchSerializer
+
+
+class EngagementEventIngestView(APIView):
+    """POST: a batch of client engagement events (views, clicks, dwell time). Anonymous allowed; buffered or queued, not written inline."""
+    permission_classes = [AllowAny]
+
+    def post(self, request):
+        ser = EngagementBatchSerializer(data=request.data)
+        ser.is_valid(raise_exception=True)
+        data = ser.validated_data
+        user = request.user if request.user.is_authenticated else None
+        accepted = record_events(data["events"], user=user, session_key=data.get("session", ""))
+        return Response({"accepted": accepted}, status=status.HTTP_202_ACCEPTED)
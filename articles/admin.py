@@ -1,6 +1,6 @@
-from django.contrib import admin
-from django.utils import timezone
+from django.contrib import admin, messages
 from .models import Article, ArticleSuggestion, ArticleUpvote, Category, Club, ClubCampus, Subcategory
+from .moderation import bulk_moderate
 
 
 class SubcategoryInline(admin.TabularInline):
@@ -96,23 +96,24 @@ class ArticleAdmin(admin.ModelAdmin):
 
     @admin.action(description="Publish selected")
     def publish_selected(self, request, queryset):
-        for obj in queryset:
-            obj.status = "published"
-            obj.published_at = timezone.now()
-            obj.reviewed_by_id = request.user
-            obj.reviewed_at = timezone.now()
-            obj.save()
-        self.message_user(request, f"Published {queryset.count()} article(s).")
+        self._bulk_moderate(request, queryset, "published")
 
     @admin.action(description="Reject selected")
     def reject_selected(self, request, queryset):
-        for obj in queryset:
-            obj.status = "rejected"
-            obj.rejection_reason = "Rejected via admin bulk action."
-            obj.reviewed_by_id = request.user
-            obj.reviewed_at = timezone.now()
-            obj.save()
-        self.message_user(request, f"Rejected {queryset.count()} article(s).")
+        self._bulk_moderate(request, queryset, "rejected", rejection_reason="Rejected via admin bulk action.")
+
+    def _bulk_moderate(self, request, queryset, new_status, rejection_reason=""):
+        result = bulk_moderate(
+            queryset.values_list("pk", flat=True), new_status, request.user, request=request, rejection_reason=rejection_reason
+        )
+        verb = "Published" if new_status == "published" else "Rejected"
+        self.message_user(request, f"{verb} {len(result['updated'])} article(s).")
+        if result["skipped"]:
+            self.message_user(
+                request,
+                f"Skipped {len(result['skipped'])} article(s) that cannot move to '{new_status}' from their current status.",
+                level=messages.WARNING,
+            )
 
 
 @admin.register(ArticleUpvote)
@@ -1,7 +1,9 @@
+import hashlib
 import json
 import logging
-import google.generativeai as genai
-from django.conf import settings
+import re
+
+from core.llm import get_llm, register_fake_responder
 
 logger = logging.getLogger(__name__)
 
@@ -152,69 +154,119 @@ Article Body:
 """
 
 
-def review_article_with_gemini(article) -> dict:
+GEMINI_REVIEW_MODEL = "gemini-2.5-pro"
+# Changes whenever the model or either prompt changes, so cached reviews made
+# with an older prompt are never reused.
+PROMPT_VERSION = hashlib.sha256(
+    "\0".join([GEMINI_REVIEW_MODEL, NIAT_SYSTEM_PROMPT, REVIEW_PROMPT_TEMPLATE]).encode("utf-8")
+).hexdigest()[:16]
+
+
+def build_review_prompt(article) -> str:
+    # Strip HTML tags from body for cleaner review
+    clean_body = re.sub(r'<[^>]+>', ' ', article.body or '')
+    clean_body = re.sub(r'\s+', ' ', clean_body).strip()
+    # Limit to 8000 chars to stay within token limits
+    clean_body = clean_body[:8000]
+
+    return REVIEW_PROMPT_TEMPLATE.format(
+        title=article.title,
+        category=article.category,
+        campus_name=article.campus_name or "Unknown",
+        author_username=article.author_username or "Unknown",
+        body=clean_body,
+    )
+
+
+def review_cache_key(prompt: str) -> str:
+    """Hash of everything sent to Gemini for one review (prompt version + rendered prompt)."""
+    return hashlib.sha256(f"{PROMPT_VERSION}\0{prompt}".encode("utf-8")).hexdigest()
+
+
+def review_article_with_gemini(article, use_cache=True) -> dict:
     """
     Send article to Gemini for review.
     Returns structured feedback dict.
+    An unchanged article (same title, category, campus, author and cleaned body)
+    reviewed under the current PROMPT_VERSION reuses the stored result instead.
     Raises exception on API failure — caller handles it.
     """
+    from .models import AIReviewCache
+
+    prompt = build_review_prompt(article)
+    content_hash = review_cache_key(prompt)
+    if use_cache:
+        cached = AIReviewCache.objects.filter(content_hash=content_hash).values_list("result", flat=True).first()
+        if cached is not None:
+            logger.info("Reusing cached AI review for article %s", article.id)
+            return cached
+
     try:
-        genai.configure(api_key=settings.GEMINI_API_KEY)
-        model = genai.GenerativeModel(
-            model_name="gemini-2.5-pro",
-            system_instruction=NIAT_SYSTEM_PROMPT,
-        )
-
-        # Strip HTML tags from body for cleaner review
-        import re
-        clean_body = re.sub(r'<[^>]+>', ' ', article.body or '')
-        clean_body = re.sub(r'\s+', ' ', clean_body).strip()
-        # Limit to 8000 chars to stay within token limits
-        clean_body = clean_body[:8000]
-
-        prompt = REVIEW_PROMPT_TEMPLATE.format(
-            title=article.title,
-            category=article.category,
-            campus_name=article.campus_name or "Unknown",
-            author_username=article.author_username or "Unknown",
-            body=clean_body,
-        )
-
-        response = model.generate_content(prompt)
-        raw = response.text.strip()
-
-        # Strip markdown code fences if Gemini wraps in ```json
-        if raw.startswith("```"):
-            raw = re.sub(r'^```(?:json)?\n?', '', raw)
-            raw = re.sub(r'\n?```$', '', raw)
-
-        result = json.loads(raw)
-
-        # Validate required keys exist
-        required_keys = [
-            "confidence_score", "brand_alignment", "content_quality",
-            "tone_score", "summary", "strengths", "concerns",
-            "status_recommendation", "status_reason", "flags"
-        ]
-        for key in required_keys:
-            if key not in result:
-                raise ValueError(f"Missing key in Gemini response: {key}")
-
-        # Validate flags block has all expected keys
-        expected_flags = ["contains_fees", "unresolved_complaint", "off_topic", "promotional", "low_quality"]
-        for flag in expected_flags:
-            if flag not in result.get("flags", {}):
-                result.setdefault("flags", {})[flag] = False
-
-        # Clamp scores between 0 and 1
-        for score_key in ["confidence_score", "brand_alignment", "content_quality", "tone_score"]:
-            result[score_key] = max(0.0, min(1.0, float(result[score_key])))
-
-        return result
+        text = get_llm("gemini").complete(prompt, system=NIAT_SYSTEM_PROMPT, model=GEMINI_REVIEW_MODEL)
+        result = parse_review_response(text)
 
     except json.JSONDecodeError as e:
         logger.error(f"Gemini returned invalid JSON for article {article.id}: {e}")
         raise
     except Exception as e:
         logger.error(f"Gemini review failed for article {article.id}: {e}")
-        raise
\ No newline at end of file
+        raise
+
+    AIReviewCache.objects.bulk_create(
+        [AIReviewCache(content_hash=content_hash, prompt_version=PROMPT_VERSION, result=result)],
+        ignore_conflicts=True,
+    )
+    return result
+
+
+def parse_review_response(text: str) -> dict:
+    """Parse and validate Gemini's JSON review; raises ValueError/JSONDecodeError if malformed."""
+    raw = text.strip()
+
+    # Strip markdown code fences if Gemini wraps in ```json
+    if raw.startswith("```"):
+        raw = re.sub(r'^```(?:json)?\n?', '', raw)
+        raw = re.sub(r'\n?```$', '', raw)
+
+    result = json.loads(raw)
+
+    # Validate required keys exist
+    required_keys = [
+        "confidence_score", "brand_alignment", "content_quality",
+        "tone_score", "summary", "strengths", "concerns",
+        "status_recommendation", "status_reason", "flags"
+    ]
+    for key in required_keys:
+        if key not in result:
+            raise ValueError(f"Missing key in Gemini response: {key}")
+
+    # Validate flags block has all expected keys
+    expected_flags = ["contains_fees", "unresolved_complaint", "off_topic", "promotional", "low_quality"]
+    for flag in expected_flags:
+        if flag not in result.get("flags", {}):
+            result.setdefault("flags", {})[flag] = False
+
+    # Clamp scores between 0 and 1
+    for score_key in ["confidence_score", "brand_alignment", "content_quality", "tone_score"]:
+        result[score_key] = max(0.0, min(1.0, float(result[score_key])))
+
+    return result
+
+
+@register_fake_responder("gemini")
+def fake_review_response(prompt, system=None, model=None) -> str:
+    """Deterministic well-formed review for the offline LLM backend; the score is derived from the prompt."""
+    score = int(hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:8], 16) / 0xFFFFFFFF
+    recommendation = "published" if score >= 0.8 else "pending_review" if score >= 0.5 else "rejected"
+    return json.dumps({
+        "confidence_score": score,
+        "brand_alignment": score,
+        "content_quality": score,
+        "tone_score": score,
+        "summary": "Offline review.",
+        "status_recommendation": recommendation,
+        "status_reason": "Generated by the fake LLM backend.",
+        "strengths": [],
+        "concerns": [],
+        "flags": {},
+    })
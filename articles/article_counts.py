@@ -0,0 +1,157 @@
+"""
+Stored published-article counters.
+
+Campus.published_article_count counts published articles per campus;
+Club.published_article_count and ClubCampus.published_article_count count published
+club-directory articles (subcategory = club slug). The campus and club directories
+read them instead of running COUNT queries. Article signals snapshot the fields
+that decide counter membership when an article is loaded, and on save/delete
+(including every Article.transition_to) move the article between counters with
+F() deltas. QuerySet.update() bypasses signals; the reconcile_article_counts
+command repairs any drift.
+"""
+from collections import defaultdict
+
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+CLUB_CATEGORY = "club-directory"
+TRACKED_FIELDS = ("status", "category", "subcategory", "campus_id_id")
+
+
+def snapshot(article):
+    """Membership-relevant field values, or None if any of them is deferred."""
+    values = {}
+    for field in TRACKED_FIELDS:
+        if field not in article.__dict__:
+            return None
+        values[field] = article.__dict__[field]
+    return values
+
+
+def load_snapshot(article):
+    from .models import Article
+
+    return Article.objects.filter(pk=article.pk).values(*TRACKED_FIELDS).first()
+
+
+def _club_keys(values):
+    """(club slug, (club slug, campus id) or None) for a published club article, else (None, None)."""
+    if not values or values["status"] != "published" or values["category"] != CLUB_CATEGORY:
+        return None, None
+    slug = values["subcategory"]
+    if not slug:
+        return None, None
+    campus_id = values["campus_id_id"]
+    return slug, (slug, campus_id) if campus_id is not None else None
+
+
+def _campus_key(values):
+    if not values or values["status"] != "published":
+        return None
+    return values["campus_id_id"]
+
+
+def apply_membership_change(old_values, new_values):
+    """Move one article's contribution from the counters of old_values to those of new_values."""
+    apply_membership_changes([(old_values, new_values)])
+
+
+def _apply_deltas(queryset_for, deltas):
+    by_amount = defaultdict(list)
+    for key, amount in deltas.items():
+        if amount:
+            by_amount[amount].append(key)
+    for amount, keys in by_amount.items():
+        queryset_for(keys).update(published_article_count=F("published_article_count") + amount)
+
+
+def apply_membership_changes(changes):
+    """
+    Apply many (old_values, new_values) moves at once: deltas are summed per counter
+    row and written with one UPDATE per distinct delta (used by bulk moderation).
+    """
+    from campuses.models import Campus
+
+    from .models import Club, ClubCampus
+
+    campus_deltas, club_deltas, chapter_deltas = defaultdict(int), defaultdict(int), defaultdict(int)
+    for old_values, new_values in changes:
+        old_campus, new_campus = _campus_key(old_values), _campus_key(new_values)
+        if old_campus != new_campus:
+            if old_campus:
+                campus_deltas[old_campus] -= 1
+            if new_campus:
+                campus_deltas[new_campus] += 1
+        old_club, old_chapter = _club_keys(old_values)
+        new_club, new_chapter = _club_keys(new_values)
+        if old_club != new_club:
+            if old_club:
+                club_deltas[old_club] -= 1
+            if new_club:
+                club_deltas[new_club] += 1
+        if old_chapter != new_chapter:
+            if old_chapter:
+                chapter_deltas[old_chapter] -= 1
+            if new_chapter:
+                chapter_deltas[new_chapter] += 1
+
+    _apply_deltas(lambda keys: Campus.objects.filter(pk__in=keys), campus_deltas)
+    _apply_deltas(lambda keys: Club.objects.filter(slug__in=keys), club_deltas)
+    for (slug, campus_id), amount in chapter_deltas.items():
+        if amount:
+            ClubCampus.objects.filter(club__slug=slug, campus_id=campus_id).update(
+                published_article_count=F("published_article_count") + amount
+            )
+
+
+def _fix_drift(queryset, counts):
+    updated = 0
+    for row in queryset.annotate(
+        actual=Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+    ).exclude(published_article_count=F("actual")):
+        updated += type(row).objects.filter(pk=row.pk).update(published_article_count=row.actual)
+    return updated
+
+
+def reconcile_campus_article_counts():
+    """Recompute every campus counter from articles; returns rows updated."""
+    from campuses.models import Campus
+
+    from .models import Article
+
+    counts = (
+        Article.objects.filter(status="published", campus_id_id=OuterRef("pk"))
+        .order_by()
+        .values("campus_id_id")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    return _fix_drift(Campus.objects.all(), counts)
+
+
+def _published_club_articles():
+    from .models import Article
+
+    return Article.objects.filter(status="published", category=CLUB_CATEGORY).order_by()
+
+
+def reconcile_club_article_counts():
+    """Recompute every club and chapter counter from articles; returns rows updated."""
+    from .models import Club, ClubCampus
+
+    club_counts = (
+        _published_club_articles()
+        .filter(subcategory=OuterRef("slug"))
+        .values("subcategory")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    chapter_counts = (
+        _published_club_articles()
+        .filter(subcategory=OuterRef("club__slug"), campus_id_id=OuterRef("campus_id"))
+        .values("subcategory")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    return _fix_drift(Club.objects.all(), club_counts) + _fix_drift(ClubCampus.objects.all(), chapter_counts)
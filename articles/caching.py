@@ -0,0 +1,74 @@
+"""
+Response cache for anonymous article list requests.
+
+Keys combine a generation counter with the normalized query string. Article
+saves and deletes bump the generation, as do campus deletes (they null the
+articles' campus_id without Article signals); that orphans every cached page at
+once and orphaned entries simply age out after LIST_CACHE_TIMEOUT. Campus saves
+do not: list payloads carry only the article's own campus fields. If the cache
+is unavailable, lists are served uncached and invalidation is skipped.
+"""
+import hashlib
+import logging
+import time
+
+from core.cache import NamespacedCache
+
+logger = logging.getLogger(__name__)
+
+LIST_CACHE_TIMEOUT = 5 * 60
+# Saves that only touch these fields do not invalidate cached lists; the lists
+# tolerate counters being up to LIST_CACHE_TIMEOUT stale.
+COUNTER_FIELDS = frozenset({"upvote_count", "view_count"})
+# Saves limited to these fields change no public page, search text or list
+# payload: counters plus the AI review bookkeeping written by the review daemon.
+REVALIDATION_IGNORED_FIELDS = COUNTER_FIELDS | {
+    "ai_confident_score",
+    "ai_feedback",
+    "ai_reviewed_at",
+    "ai_review_claimed_until",
+}
+
+list_cache = NamespacedCache("articles:list")
+
+
+def _generation():
+    generation = list_cache.get("generation")
+    if generation is None:
+        # Seed from the clock so an evicted counter never reuses an old generation.
+        list_cache.add("generation", time.time_ns(), None)
+        generation = list_cache.get("generation", 0)
+    return generation
+
+
+def list_cache_key(request):
+    """Cache key for an anonymous list request; compute once per request."""
+    params = sorted(
+        (key, value)
+        for key in request.query_params
+        for value in request.query_params.getlist(key)
+        if value != ""
+    )
+    raw = "|".join([request.get_host(), request.path, *(f"{k}={v}" for k, v in params)])
+    digest = hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    return f"{_generation()}:{digest}"
+
+
+def get_cached_list(key):
+    return list_cache.get(key)
+
+
+def cache_list(key, data):
+    list_cache.set(key, data, LIST_CACHE_TIMEOUT)
+
+
+def invalidate_article_lists():
+    """Bump the generation; runs from on_commit, so a cache outage is logged rather than raised."""
+    try:
+        try:
+            list_cache.backend.incr(list_cache.key("generation"))
+        except ValueError:
+            list_cache.add("generation", time.time_ns(), None)
+    except Exception:
+        # The write has committed; cached pages age out within LIST_CACHE_TIMEOUT.
+        logger.warning("Could not invalidate cached article lists", exc_info=True)
@@ -0,0 +1,15 @@
+"""
+Rebuild the article full-text search index (search_vector on PostgreSQL, FTS5 table on SQLite).
+Usage: python manage.py rebuild_article_search
+"""
+from django.core.management.base import BaseCommand
+
+from articles.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index for all articles"
+
+    def handle(self, *args, **options):
+        indexed = rebuild_search_index()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt search index for {indexed} article(s)."))
@@ -0,0 +1,19 @@
+"""
+Recompute stored published_article_count on campuses, clubs and club chapters and
+repair drift (e.g. after bulk QuerySet.update() on articles). Safe to run periodically.
+Usage: python manage.py reconcile_article_counts
+"""
+from django.core.management.base import BaseCommand
+
+from articles.article_counts import reconcile_campus_article_counts, reconcile_club_article_counts
+
+
+class Command(BaseCommand):
+    help = "Repair stored published article counters on campuses and clubs"
+
+    def handle(self, *args, **options):
+        campuses = reconcile_campus_article_counts()
+        clubs = reconcile_club_article_counts()
+        self.stdout.write(
+            self.style.SUCCESS(f"Fixed {campuses} campus counter(s) and {clubs} club/chapter counter(s).")
+        )
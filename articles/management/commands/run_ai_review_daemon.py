@@ -1,18 +1,21 @@
 """
 Daemon that automatically runs Gemini AI review for articles in pending_review
 that have no ai_feedback. Run once (e.g. in a separate process or systemd);
-it loops every interval and processes one batch per run.
+it claims a batch, reviews it, and sleeps for the interval once the backlog is empty.
 
   python manage.py run_ai_review_daemon
   python manage.py run_ai_review_daemon --interval 300 --batch 5
+  python manage.py run_ai_review_daemon --concurrency 8 --rate 60
 
-Reviews are saved to the article; once saved, they are never overwritten.
+Articles are claimed with a lease (SELECT ... FOR UPDATE SKIP LOCKED), so several
+daemons can run side by side. Reviews are saved to the article; once saved, they
+are never overwritten.
 """
 import logging
 import time
 from django.core.management.base import BaseCommand
-from django.utils import timezone
-from articles.models import Article
+from django.db import close_old_connections
+from articles.review_queue import DEFAULT_LEASE_SECONDS, ReviewWorkerPool
 
 logger = logging.getLogger(__name__)
 
@@ -25,13 +28,31 @@ class Command(BaseCommand):
             "--interval",
             type=int,
             default=60,
-            help="Seconds between each run (default: 60).",
+            help="Seconds to wait when there is nothing to review (default: 60).",
         )
         parser.add_argument(
             "--batch",
             type=int,
             default=3,
-            help="Max articles to review per run (default: 3).",
+            help="Max articles to claim per run (default: 3, at least --concurrency).",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=1,
+            help="Reviews running in parallel (default: 1).",
+        )
+        parser.add_argument(
+            "--rate",
+            type=int,
+            default=30,
+            help="Max Gemini calls per minute for this process, 0 for no limit (default: 30).",
+        )
+        parser.add_argument(
+            "--lease",
+            type=int,
+            default=DEFAULT_LEASE_SECONDS,
+            help=f"Seconds a claimed article stays reserved for this worker (default: {DEFAULT_LEASE_SECONDS}).",
         )
         parser.add_argument(
             "--once",
@@ -41,62 +62,47 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         interval = max(10, options["interval"])
-        batch = max(1, options["batch"])
+        concurrency = max(1, options["concurrency"])
+        batch = max(1, options["batch"], concurrency)
         once = options["once"]
-
-        from articles.ai_review import review_article_with_gemini
+        pool = ReviewWorkerPool(
+            concurrency=concurrency,
+            rate_per_minute=max(0, options["rate"]),
+            lease_seconds=max(60, options["lease"]),
+        )
 
         self.stdout.write(
             self.style.SUCCESS(
-                f"AI review daemon started (interval={interval}s, batch={batch}). "
-                "Ctrl+C to stop."
+                f"AI review daemon started (interval={interval}s, batch={batch}, "
+                f"concurrency={concurrency}, rate={options['rate']}/min). Ctrl+C to stop."
             )
         )
 
         while True:
             try:
-                qs = Article.objects.filter(
-                    status="pending_review", ai_feedback__isnull=True
-                )[:batch]
-                articles = list(qs)
-                if not articles:
-                    if once:
-                        self.stdout.write("No articles to review. Exiting.")
-                        return
-                    time.sleep(interval)
-                    continue
-
-                for article in articles:
-                    try:
-                        self.stdout.write(
-                            f"Reviewing {article.id} — {article.title[:50]}…"
-                        )
-                        result = review_article_with_gemini(article)
-                        article.ai_confident_score = result["confidence_score"]
-                        article.ai_feedback = result
-                        article.ai_reviewed_at = timezone.now()
-                        article.save(
-                            update_fields=[
-                                "ai_confident_score",
-                                "ai_feedback",
-                                "ai_reviewed_at",
-                            ]
-                        )
-                        self.stdout.write(
-                            self.style.SUCCESS(
-                                f"  ✓ {result.get('status_recommendation', '?')}"
-                            )
-                        )
-                    except Exception as e:
-                        logger.exception("AI review failed for %s", article.id)
-                        self.stdout.write(self.style.ERROR(f"  ✗ {e}"))
-
+                claimed = pool.run_batch(batch)
+                if claimed:
+                    metrics = pool.metrics.summary()
+                    logger.info("AI review throughput", extra=metrics)
+                    self.stdout.write(
+                        f"Reviewed {metrics['reviewed']} (failed {metrics['failed']}) in {metrics['elapsed_s']}s — "
+                        f"{metrics['per_minute']}/min, p50 {metrics['p50_s']}s, p95 {metrics['p95_s']}s"
+                    )
                 if once:
-                    self.stdout.write("Run once complete. Exiting.")
+                    self.stdout.write("Run once complete. Exiting." if claimed else "No articles to review. Exiting.")
                     return
-
+                if claimed == batch:
+                    # Backlog: claim the next batch straight away.
+                    continue
             except KeyboardInterrupt:
                 self.stdout.write("\nStopped.")
                 return
+            except Exception as e:
+                # E.g. the database is unreachable: keep the daemon alive and retry after the interval.
+                logger.exception("AI review batch failed")
+                self.stdout.write(self.style.ERROR(f"Batch failed: {e}"))
+                close_old_connections()
+                if once:
+                    return
 
             time.sleep(interval)
@@ -0,0 +1,69 @@
+# Full-text search for articles: search_vector + GIN indexes on PostgreSQL,
+# FTS5 virtual table on SQLite (local/dev).
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import migrations
+
+
+FTS_TABLE = "articles_article_search"
+FTS_COLUMNS = "title, excerpt, body, campus_name, subcategory, subcategory_other"
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    Article = apps.get_model("articles", "Article")
+    if vendor == "postgresql":
+        from django.contrib.postgres.search import SearchVector
+
+        Article.objects.update(
+            search_vector=SearchVector("title", weight="A", config="english")
+            + SearchVector("excerpt", weight="B", config="english")
+            + SearchVector("campus_name", "subcategory", "subcategory_other", weight="C", config="english")
+            + SearchVector("body", weight="D", config="english")
+        )
+        return
+    if vendor != "sqlite":
+        return
+    # Rows are keyed by the article's UUID (not rowid, which SQLite table rebuilds do not preserve)
+    # and kept in sync by articles.signals.
+    pk_column = Article._meta.pk.column
+    table = Article._meta.db_table
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(article_id UNINDEXED, {FTS_COLUMNS})"
+        )
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE}(article_id, {FTS_COLUMNS}) SELECT {pk_column}, {FTS_COLUMNS} FROM {table}"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0037_club_schema_align_data_json"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="search_vector",
+            field=SearchVectorField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=GinIndex(fields=["search_vector"], name="article_search_vector_gin_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=GinIndex(fields=["title"], name="article_title_trgm_idx", opclasses=["gin_trgm_ops"]),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:03
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_counts(apps, schema_editor):
+    Article = apps.get_model("articles", "Article")
+    Club = apps.get_model("articles", "Club")
+    ClubCampus = apps.get_model("articles", "ClubCampus")
+    published = Article.objects.filter(status="published", category="club-directory").exclude(subcategory="")
+    by_club = dict(published.values_list("subcategory").annotate(total=Count("pk")).order_by())
+    by_chapter = {
+        (slug, campus_id): total
+        for slug, campus_id, total in published.exclude(campus_id__isnull=True)
+        .values_list("subcategory", "campus_id_id")
+        .annotate(total=Count("pk"))
+        .order_by()
+    }
+    for club in Club.objects.filter(slug__in=list(by_club)):
+        Club.objects.filter(pk=club.pk).update(published_article_count=by_club[club.slug])
+    for chapter in ClubCampus.objects.select_related("club"):
+        total = by_chapter.get((chapter.club.slug, chapter.campus_id))
+        if total:
+            ClubCampus.objects.filter(pk=chapter.pk).update(published_article_count=total)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0038_article_search_vector"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="club",
+            name="published_article_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="clubcampus",
+            name="published_article_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_counts, migrations.RunPython.noop),
+    ]
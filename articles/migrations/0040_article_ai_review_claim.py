@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0039_club_published_article_count'),
+        ('campuses', '0007_campus_published_article_count'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='ai_review_claimed_until',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(condition=models.Q(('ai_feedback__isnull', True), ('status', 'pending_review')), fields=['created_at'], name='article_ai_review_queue_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0040_article_ai_review_claim'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AIReviewCache',
+            fields=[
+                ('content_hash', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('prompt_version', models.CharField(db_index=True, max_length=16)),
+                ('result', models.JSONField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'articles_aireviewcache',
+            },
+        ),
+    ]
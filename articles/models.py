@@ -1,5 +1,7 @@
 import uuid
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils import timezone
@@ -33,6 +35,8 @@ class Club(models.Model):
     logo_url = models.URLField(blank=True)
     cover_image = models.URLField(blank=True)
     is_active = models.BooleanField(default=True, db_index=True)
+    # Published club-directory articles across all campuses; see articles.article_counts.
+    published_article_count = models.IntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -74,6 +78,8 @@ class ClubCampus(models.Model):
     chapter_description = models.TextField(blank=True)
     contact_email = models.EmailField(blank=True)
     is_active = models.BooleanField(default=True)
+    # Published club-directory articles for this club at this campus.
+    published_article_count = models.IntegerField(default=0)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
@@ -237,10 +243,13 @@ class Article(models.Model):
     ai_confident_score = models.FloatField(null = True, blank=True)
     ai_feedback = models.JSONField(null = True, blank=True)
     ai_reviewed_at = models.DateTimeField(null = True, blank=True)
+    # Lease taken by an AI review worker (articles.review_queue); expired leases are reclaimable.
+    ai_review_claimed_until = models.DateTimeField(null=True, blank=True)
     reviewed_at = models.DateTimeField(null=True, blank=True)
     published_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    search_vector = SearchVectorField(null=True, blank=True)
 
     class Meta:
         app_label = "articles"
@@ -251,6 +260,13 @@ class Article(models.Model):
             models.Index(fields=["status", "category"]),
             models.Index(fields=["author_id"]),
             models.Index(fields=["campus_id", "category", "subcategory", "status"], name="art_camp_cat_sub_st_idx"),
+            GinIndex(fields=["search_vector"], name="article_search_vector_gin_idx"),
+            GinIndex(fields=["title"], name="article_title_trgm_idx", opclasses=["gin_trgm_ops"]),
+            models.Index(
+                fields=["created_at"],
+                condition=models.Q(status="pending_review", ai_feedback__isnull=True),
+                name="article_ai_review_queue_idx",
+            ),
         ]
 
     def __str__(self):
@@ -399,3 +415,15 @@ class ArticleSuggestion(models.Model):
             models.Index(fields=["reviewed", "created_at"], name="articles_sugg_rev_created_idx"),
         ]
 
+
+
+class AIReviewCache(models.Model):
+    """Gemini review result keyed by a hash of the exact prompt sent; see articles.ai_review."""
+    content_hash = models.CharField(max_length=64, primary_key=True)
+    prompt_version = models.CharField(max_length=16, db_index=True)
+    result = models.JSONField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        app_label = "articles"
+        db_table = "articles_aireviewcache"
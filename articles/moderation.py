@@ -0,0 +1,131 @@
+"""
+Bulk moderation.
+
+bulk_moderate() moves many articles to "published" or "rejected" at once. The
+allowed source statuses come from VALID_TRANSITIONS and are part of the UPDATE's
+WHERE clause, so an article that is not in a valid state (or changed state under
+us) is skipped rather than transitioned. The update is one statement and the audit
+rows are one INSERT. QuerySet.update() sends no signals, so the work the Article
+signals do per save is done here once for the whole batch: published counters,
+list cache invalidation and Next.js revalidation. Authors' status emails are
+queued in the transactional email outbox with one INSERT.
+"""
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from audit.models import ActionType, AuditLog
+from audit.utils import get_client_ip
+from notifications.outbox import enqueue_emails
+
+from . import article_counts
+from .caching import invalidate_article_lists
+from .models import VALID_TRANSITIONS, Article
+from .revalidation import queue_revalidation
+
+MAX_BULK_MODERATION = 500
+
+AUDIT_ACTIONS = {
+    "published": ActionType.ARTICLE_PUBLISHED,
+    "rejected": ActionType.ARTICLE_REJECTED,
+}
+
+
+def source_statuses(new_status):
+    """Statuses an article may be moved to `new_status` from."""
+    return sorted(status for status, targets in VALID_TRANSITIONS.items() if new_status in targets)
+
+
+def _revalidation_paths(rows):
+    paths = set()
+    for row in rows:
+        campus_slug = row["campus_id__slug"]
+        if campus_slug is None or row["slug"] is None:
+            continue
+        paths.update(
+            [
+                f"/campus/{campus_slug}/article/{row['slug']}",
+                f"/campus/{campus_slug}",
+                f"/campus/{campus_slug}/articles",
+            ]
+        )
+    return sorted(paths)
+
+
+def _status_emails(rows, new_status):
+    return [
+        (
+            f"Article status updated: {new_status}",
+            f"Hi {row['author_username']},\n\nYour article '{row['title']}' is now '{new_status}'.",
+            [row["author_id__email"]],
+        )
+        for row in rows
+    ]
+
+
+def bulk_moderate(article_ids, new_status, actor, request=None, rejection_reason=""):
+    """
+    Move the given articles to `new_status` ("published" or "rejected").
+    Returns {"updated": [ids], "skipped": [ids]}; ids are strings.
+    """
+    if new_status not in AUDIT_ACTIONS:
+        raise ValueError(f"Bulk moderation cannot move articles to '{new_status}'.")
+    requested = list(dict.fromkeys(str(article_id) for article_id in article_ids))
+    now = timezone.now()
+
+    with transaction.atomic():
+        rows = list(
+            Article.objects.filter(pk__in=requested, status__in=source_statuses(new_status))
+            .select_for_update(of=("self",))
+            .values(
+                "id",
+                "slug",
+                "title",
+                "author_id",
+                "author_username",
+                "author_id__email",
+                "campus_id__slug",
+                *article_counts.TRACKED_FIELDS,
+            )
+        )
+        ids = [row["id"] for row in rows]
+        if ids:
+            changes = {"status": new_status, "reviewed_by_id": actor, "reviewed_at": now, "updated_at": now}
+            if new_status == "published":
+                changes.update(rejection_reason="", published_at=Coalesce(F("published_at"), now))
+            else:
+                changes["rejection_reason"] = rejection_reason
+            Article.objects.filter(pk__in=ids, status__in=source_statuses(new_status)).update(**changes)
+
+            ip_address = get_client_ip(request) if request else None
+            AuditLog.objects.bulk_create(
+                [
+                    AuditLog(
+                        actor=actor,
+                        action=AUDIT_ACTIONS[new_status],
+                        entity_type=Article.__name__,
+                        entity_id=str(row["id"]),
+                        target_user_id=row["author_id"],
+                        metadata={"from_status": row["status"], "to_status": new_status},
+                        ip_address=ip_address,
+                    )
+                    for row in rows
+                ]
+            )
+            article_counts.apply_membership_changes(
+                (
+                    {field: row[field] for field in article_counts.TRACKED_FIELDS},
+                    {**{field: row[field] for field in article_counts.TRACKED_FIELDS}, "status": new_status},
+                )
+                for row in rows
+            )
+            updated = [str(article_id) for article_id in ids]
+            transaction.on_commit(invalidate_article_lists)
+            queue_revalidation(_revalidation_paths(rows))
+            enqueue_emails(_status_emails(rows, new_status))
+        else:
+            updated = []
+
+    updated_set = set(updated)
+    return {"updated": updated, "skipped": [article_id for article_id in requested if article_id not in updated_set]}
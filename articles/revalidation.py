@@ -0,0 +1,115 @@
+"""
+Next.js on-demand revalidation.
+
+Signals call queue_revalidation() with the frontend paths a change affects. Paths
+are handed to the dispatcher only after the surrounding transaction commits, so
+rolled-back saves never revalidate. The dispatcher collects paths for
+REVALIDATION_WINDOW seconds and then sends each distinct path once, in a few
+POSTs over a pooled requests.Session, from a background thread. A burst of saves
+(bulk commands, an article and its campus saved together) therefore costs one
+HTTP call instead of one per save, and none of it runs in the request/response
+cycle. With REVALIDATION_ASYNC off (tests) paths are sent on commit in the
+calling thread.
+"""
+import atexit
+import logging
+import os
+import threading
+import time
+
+import requests
+from django.conf import settings
+from django.db import transaction
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+NEXT_BASE_URL = os.environ.get("NEXT_BASE_URL", "").rstrip("/")
+REVALIDATION_SECRET = os.environ.get("REVALIDATION_SECRET", "")
+REVALIDATION_TIMEOUT = 5
+MAX_PATHS_PER_REQUEST = 100
+
+
+def _enabled():
+    return bool(NEXT_BASE_URL and REVALIDATION_SECRET)
+
+
+class RevalidationDispatcher:
+    """Coalesces paths and posts them to the Next.js revalidate endpoint."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = set()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._session = None
+
+    @property
+    def session(self):
+        if self._session is None:
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+            session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+            self._session = session
+        return self._session
+
+    def enqueue(self, paths):
+        with self._lock:
+            self._pending.update(paths)
+        if not getattr(settings, "REVALIDATION_ASYNC", True):
+            self.flush()
+            return
+        self._ensure_worker()
+        self._wakeup.set()
+
+    def _ensure_worker(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name="revalidation-dispatcher", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait()
+            # Let the burst that woke us finish before sending.
+            time.sleep(getattr(settings, "REVALIDATION_WINDOW", 1.0))
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Revalidation dispatch failed")
+
+    def flush(self):
+        """Send every pending path now; returns the number of paths sent."""
+        with self._lock:
+            paths = sorted(self._pending)
+            self._pending.clear()
+        for start in range(0, len(paths), MAX_PATHS_PER_REQUEST):
+            self._post(paths[start:start + MAX_PATHS_PER_REQUEST])
+        return len(paths)
+
+    def _post(self, paths):
+        try:
+            response = self.session.post(
+                f"{NEXT_BASE_URL}/api/revalidate",
+                json={"secret": REVALIDATION_SECRET, "paths": paths},
+                timeout=REVALIDATION_TIMEOUT,
+            )
+            response.raise_for_status()
+            logger.info("Revalidated paths: %s", paths)
+        except requests.exceptions.RequestException as e:
+            logger.warning("Revalidation failed for paths %s: %s", paths, e)
+
+
+dispatcher = RevalidationDispatcher()
+# Short-lived processes (management commands) exit before the window elapses.
+atexit.register(dispatcher.flush)
+
+
+def queue_revalidation(paths):
+    """Revalidate `paths` once the current transaction (if any) commits."""
+    if not _enabled() or not paths:
+        return
+    paths = list(paths)
+    transaction.on_commit(lambda: dispatcher.enqueue(paths))
@@ -0,0 +1,157 @@
+"""
+AI review queue: pending_review articles that have no ai_feedback yet.
+
+Workers claim articles by setting a lease (ai_review_claimed_until) inside a
+SELECT ... FOR UPDATE SKIP LOCKED transaction, so daemons on several nodes never
+review the same article. A lease left behind by a crashed or failed review expires
+and the article becomes claimable again. Gemini calls are I/O-bound, so a batch is
+reviewed on a thread pool, throttled by a shared TokenBucket.
+"""
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from core.ratelimit import TokenBucket
+
+from .models import Article
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEASE_SECONDS = 10 * 60
+REVIEW_FIELDS = ["ai_confident_score", "ai_feedback", "ai_reviewed_at", "ai_review_claimed_until"]
+# Percentiles cover the most recent reviews only, so a long-running daemon's memory stays flat.
+LATENCY_WINDOW = 1000
+
+
+def review_backlog():
+    return Article.objects.filter(status="pending_review", ai_feedback__isnull=True)
+
+
+def claim_articles(limit, lease_seconds=DEFAULT_LEASE_SECONDS):
+    """Lease up to `limit` unclaimed articles (oldest first) to this worker and return them."""
+    now = timezone.now()
+    with transaction.atomic():
+        ids = list(
+            review_backlog()
+            .filter(Q(ai_review_claimed_until__isnull=True) | Q(ai_review_claimed_until__lt=now))
+            .order_by("created_at")
+            .select_for_update(skip_locked=True)
+            .values_list("pk", flat=True)[:limit]
+        )
+        if ids:
+            Article.objects.filter(pk__in=ids).update(
+                ai_review_claimed_until=now + timedelta(seconds=lease_seconds)
+            )
+    return list(Article.objects.filter(pk__in=ids).order_by("created_at"))
+
+
+class ReviewMetrics:
+    """Throughput of one worker process, and latency over its last LATENCY_WINDOW reviews."""
+
+    def __init__(self, window=LATENCY_WINDOW):
+        self.reviewed = 0
+        self.failed = 0
+        self.latencies = deque(maxlen=window)
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def record(self, latency, ok):
+        with self._lock:
+            self.latencies.append(latency)
+            if ok:
+                self.reviewed += 1
+            else:
+                self.failed += 1
+
+    def _percentile(self, latencies, fraction):
+        if not latencies:
+            return 0.0
+        return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))]
+
+    def summary(self):
+        with self._lock:
+            latencies = sorted(self.latencies)
+            reviewed, failed = self.reviewed, self.failed
+        elapsed = time.monotonic() - self.started
+        return {
+            "reviewed": reviewed,
+            "failed": failed,
+            "elapsed_s": round(elapsed, 1),
+            "per_minute": round((reviewed + failed) * 60 / elapsed, 2) if elapsed else 0.0,
+            "p50_s": round(self._percentile(latencies, 0.5), 2),
+            "p95_s": round(self._percentile(latencies, 0.95), 2),
+        }
+
+
+class ReviewWorkerPool:
+    """
+    Claims and reviews articles `concurrency` at a time, at most `rate_per_minute`
+    Gemini calls per minute (0 = unlimited). `review` defaults to
+    articles.ai_review.review_article_with_gemini.
+    """
+
+    def __init__(self, concurrency=1, rate_per_minute=0, lease_seconds=DEFAULT_LEASE_SECONDS, review=None):
+        self.concurrency = max(1, concurrency)
+        self.lease_seconds = lease_seconds
+        self.bucket = TokenBucket(rate_per_minute / 60 if rate_per_minute else 0, capacity=self.concurrency)
+        self.metrics = ReviewMetrics()
+        self._review = review
+
+    @property
+    def review(self):
+        if self._review is None:
+            from .ai_review import review_article_with_gemini
+
+            self._review = review_article_with_gemini
+        return self._review
+
+    def run_batch(self, limit):
+        """Claim up to `limit` articles and review them; returns the number claimed."""
+        articles = claim_articles(limit, self.lease_seconds)
+        if self.concurrency == 1 or len(articles) <= 1:
+            for article in articles:
+                self.review_one(article)
+        else:
+            with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="ai-review") as pool:
+                list(pool.map(self._review_in_thread, articles))
+        return len(articles)
+
+    def _review_in_thread(self, article):
+        try:
+            return self.review_one(article)
+        finally:
+            # Worker threads open their own connection; don't leak it when the pool exits.
+            connection.close()
+
+    def review_one(self, article):
+        """Review one claimed article and store the result; returns the result or None on failure."""
+        self.bucket.acquire()
+        started = time.monotonic()
+        try:
+            result = self.review(article)
+            article.ai_confident_score = result["confidence_score"]
+            article.ai_feedback = result
+            article.ai_reviewed_at = timezone.now()
+            article.ai_review_claimed_until = None
+            article.save(update_fields=REVIEW_FIELDS)
+        except Exception:
+            # The lease is kept, so the article is retried once it expires rather than immediately.
+            self.metrics.record(time.monotonic() - started, ok=False)
+            logger.exception("AI review failed for %s", article.pk, extra={"article_id": str(article.pk)})
+            return None
+        latency = time.monotonic() - started
+        self.metrics.record(latency, ok=True)
+        logger.info(
+            "AI review complete for %s in %.2fs",
+            article.pk,
+            latency,
+            extra={"article_id": str(article.pk), "latency_s": round(latency, 3)},
+        )
+        return result
@@ -0,0 +1,157 @@
+"""
+Full-text search for articles.
+
+PostgreSQL: weighted search_vector (GIN-indexed) with ranking and headlines, falling back
+to trigram similarity on title and then icontains. SQLite (local/dev): FTS5 table
+articles_article_search keyed by article id. Both are kept in sync by articles.signals.
+"""
+import re
+
+from django.db import connection
+from django.db.models import F, FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+
+FTS_TABLE = "articles_article_search"
+FTS_COLUMNS = ("title", "excerpt", "body", "campus_name", "subcategory", "subcategory_other")
+# bm25 weights for (article_id, *FTS_COLUMNS); article_id is UNINDEXED.
+FTS_BM25_WEIGHTS = "0.0, 10.0, 4.0, 1.0, 2.0, 2.0, 2.0"
+
+
+def article_search_vector():
+    from django.contrib.postgres.search import SearchVector
+
+    return (
+        SearchVector("title", weight="A", config="english")
+        + SearchVector("excerpt", weight="B", config="english")
+        + SearchVector("campus_name", "subcategory", "subcategory_other", weight="C", config="english")
+        + SearchVector("body", weight="D", config="english")
+    )
+
+
+def update_search_index(article):
+    """Refresh the search index entry for one article."""
+    from .models import Article
+
+    if connection.vendor == "postgresql":
+        Article.objects.filter(pk=article.pk).update(search_vector=article_search_vector())
+    elif connection.vendor == "sqlite":
+        columns = ", ".join(FTS_COLUMNS)
+        placeholders = ", ".join(["%s"] * (len(FTS_COLUMNS) + 1))
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE article_id = %s", [article.pk.hex])
+            cursor.execute(
+                f"INSERT INTO {FTS_TABLE}(article_id, {columns}) VALUES ({placeholders})",
+                [article.pk.hex, *(getattr(article, col) or "" for col in FTS_COLUMNS)],
+            )
+
+
+def remove_from_search_index(article_pk):
+    if connection.vendor == "sqlite":
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE article_id = %s", [article_pk.hex])
+
+
+def rebuild_search_index():
+    """Rebuild the whole index; returns the number of articles indexed."""
+    from .models import Article
+
+    if connection.vendor == "postgresql":
+        return Article.objects.update(search_vector=article_search_vector())
+    if connection.vendor != "sqlite":
+        return 0
+    table = Article._meta.db_table
+    pk_column = Article._meta.pk.column
+    columns = ", ".join(FTS_COLUMNS)
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE}")
+        cursor.execute(f"INSERT INTO {FTS_TABLE}(article_id, {columns}) SELECT {pk_column}, {columns} FROM {table}")
+        return cursor.rowcount
+
+
+def _icontains(queryset, q):
+    return queryset.filter(
+        Q(title__icontains=q)
+        | Q(excerpt__icontains=q)
+        | Q(body__icontains=q)
+        | Q(campus_name__icontains=q)
+        | Q(subcategory__icontains=q)
+        | Q(subcategory_other__icontains=q)
+    ).annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+
+def _search_postgres(queryset, q):
+    from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank, TrigramSimilarity
+
+    search_query = SearchQuery(q, search_type="websearch", config="english")
+    qs = queryset.filter(search_vector=search_query).annotate(
+        search_rank=SearchRank(
+            F("search_vector"),
+            search_query,
+            weights=[0.1, 0.2, 0.4, 1.0],
+            normalization=2,
+            cover_density=True,
+        ),
+        headline=SearchHeadline(
+            "body",
+            search_query,
+            config="english",
+            start_sel="<mark>",
+            stop_sel="</mark>",
+            max_words=50,
+            min_words=15,
+            max_fragments=3,
+        ),
+        title_headline=SearchHeadline(
+            "title",
+            search_query,
+            config="english",
+            start_sel="<mark>",
+            stop_sel="</mark>",
+        ),
+    )
+    if qs.exists():
+        return qs
+    qs = queryset.annotate(search_rank=TrigramSimilarity("title", q)).filter(search_rank__gte=0.15)
+    if qs.exists():
+        return qs
+    return _icontains(queryset, q)
+
+
+def _fts5_query(q):
+    """Quote each word and prefix-match it, so user input can never be parsed as FTS5 syntax."""
+    tokens = re.findall(r"\w+", q)
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def _search_sqlite(queryset, q):
+    match = _fts5_query(q)
+    if not match:
+        return _icontains(queryset, q)
+    pk = f"{queryset.model._meta.db_table}.{queryset.model._meta.pk.column}"
+    per_row = f"FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s AND {FTS_TABLE}.article_id = {pk}"
+    return queryset.extra(
+        where=[f"{pk} IN (SELECT article_id FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s)"],
+        params=[match],
+    ).annotate(
+        # bm25() is lower-is-better; negate so ordering matches Postgres (-search_rank).
+        search_rank=RawSQL(f"(SELECT -bm25({FTS_TABLE}, {FTS_BM25_WEIGHTS}) {per_row})", (match,)),
+        headline=RawSQL(
+            f"(SELECT snippet({FTS_TABLE}, 3, '<mark>', '</mark>', '…', 30) {per_row})", (match,)
+        ),
+        title_headline=RawSQL(f"(SELECT highlight({FTS_TABLE}, 1, '<mark>', '</mark>') {per_row})", (match,)),
+    )
+
+
+def search_articles(queryset, query_string):
+    """
+    Filter `queryset` to articles matching `query_string` and annotate search_rank
+    (higher is better) plus headline/title_headline where the backend supports them.
+    """
+    q = (query_string or "").strip()
+    if not q:
+        return queryset
+    if connection.vendor == "postgresql":
+        return _search_postgres(queryset, q)
+    if connection.vendor == "sqlite":
+        return _search_sqlite(queryset, q)
+    return _icontains(queryset, q)
@@ -1,8 +1,10 @@
+from django.db.models import OuterRef, Subquery
 from django.utils import timezone
 from rest_framework import serializers
 from accounts.models import User
 from profiles.models import VerifiedNiatStudentProfile
 from .models import Article, Category, Club, ClubCampus, GUIDE_TOPIC_CHOICES, STATUS_CHOICES, Subcategory
+from .moderation import MAX_BULK_MODERATION
 
 def _get_category_slugs():
     """Valid category slugs from DB only (no mock/hardcoded list)."""
@@ -75,6 +77,33 @@ class CategorySerializer(serializers.ModelSerializer):
         fields = ["id", "name", "slug"]
 
 
+def _current_club_chapter(club, request):
+    """
+    The chapter a club row describes: the prefetched current_chapter (campus-scoped lists),
+    else the requested campus, else the first active chapter, else any chapter. Resolved
+    once per club from the campus_chapters prefetch and memoized on the instance.
+    """
+    if hasattr(club, "_resolved_chapter"):
+        return club._resolved_chapter
+    chapter_list = getattr(club, "current_chapter", None)
+    if isinstance(chapter_list, list) and chapter_list:
+        chapter = chapter_list[0]
+    else:
+        chapters = list(club.campus_chapters.all())
+        campus_param = None
+        if request is not None:
+            campus_param = request.query_params.get("campus") or request.query_params.get("campus_id")
+        chapter = None
+        if campus_param:
+            chapter = next((c for c in chapters if str(c.campus_id) == str(campus_param)), None)
+        if chapter is None:
+            chapter = next((c for c in chapters if c.is_active), None)
+        if chapter is None and chapters:
+            chapter = chapters[0]
+    club._resolved_chapter = chapter
+    return chapter
+
+
 class ClubListSerializer(serializers.ModelSerializer):
     campus_id = serializers.SerializerMethodField()
     campus_name = serializers.SerializerMethodField()
@@ -87,7 +116,7 @@ class ClubListSerializer(serializers.ModelSerializer):
     chapter_description = serializers.SerializerMethodField()
     contact_email = serializers.SerializerMethodField()
     chapter_is_active = serializers.SerializerMethodField()
-    article_count = serializers.IntegerField(read_only=True)
+    article_count = serializers.SerializerMethodField()
 
     class Meta:
         model = Club
@@ -114,23 +143,7 @@ class ClubListSerializer(serializers.ModelSerializer):
         ]
 
     def _current_chapter(self, obj):
-        chapter_list = getattr(obj, "current_chapter", None)
-        if isinstance(chapter_list, list) and chapter_list:
-            return chapter_list[0]
-
-        request = self.context.get("request")
-        campus_param = None
-        if request is not None:
-            campus_param = request.query_params.get("campus") or request.query_params.get("campus_id")
-        if campus_param:
-            chapter = obj.campus_chapters.filter(campus_id=campus_param).first()
-            if chapter is not None:
-                return chapter
-
-        chapter = obj.campus_chapters.filter(is_active=True).first()
-        if chapter is not None:
-            return chapter
-        return obj.campus_chapters.first()
+        return _current_club_chapter(obj, self.context.get("request"))
 
     def get_member_count(self, obj):
         chapter = self._current_chapter(obj)
@@ -176,6 +189,13 @@ class ClubListSerializer(serializers.ModelSerializer):
         chapter = self._current_chapter(obj)
         return chapter.is_active if chapter else False
 
+    def get_article_count(self, obj):
+        # Campus-scoped lists count that chapter's articles; otherwise the club's total.
+        chapter_list = getattr(obj, "current_chapter", None)
+        if isinstance(chapter_list, list):
+            return chapter_list[0].published_article_count if chapter_list else 0
+        return obj.published_article_count
+
 
 class ClubCampusSerializer(serializers.ModelSerializer):
     campus_id = serializers.UUIDField(source="campus.id", read_only=True)
@@ -218,23 +238,7 @@ class ClubDetailSerializer(serializers.ModelSerializer):
     chapter_is_active = serializers.SerializerMethodField()
 
     def _current_chapter(self, obj):
-        chapter_list = getattr(obj, "current_chapter", None)
-        if isinstance(chapter_list, list) and chapter_list:
-            return chapter_list[0]
-
-        request = self.context.get("request")
-        campus_param = None
-        if request is not None:
-            campus_param = request.query_params.get("campus") or request.query_params.get("campus_id")
-        if campus_param:
-            chapter = obj.campus_chapters.filter(campus_id=campus_param).first()
-            if chapter is not None:
-                return chapter
-
-        chapter = obj.campus_chapters.filter(is_active=True).first()
-        if chapter is not None:
-            return chapter
-        return obj.campus_chapters.first()
+        return _current_club_chapter(obj, self.context.get("request"))
 
     def get_member_count(self, obj):
         chapter = self._current_chapter(obj)
@@ -307,10 +311,20 @@ class ClubDetailSerializer(serializers.ModelSerializer):
         ]
 
 
+def with_author_linkedin(queryset):
+    """Annotate each article with its author's LinkedIn URL so list rendering needs no per-row lookup."""
+    linkedin = VerifiedNiatStudentProfile.objects.filter(
+        user__username=OuterRef("author_username")
+    ).values("linkedin_profile")[:1]
+    return queryset.annotate(author_linkedin=Subquery(linkedin))
+
+
 class ArticleListSerializer(serializers.ModelSerializer):
     updated_days = serializers.SerializerMethodField()
     category_id = serializers.SerializerMethodField()
     author_linkedin_profile = serializers.SerializerMethodField()
+    headline = serializers.CharField(read_only=True, default=None)
+    title_headline = serializers.CharField(read_only=True, default=None)
 
     class Meta:
         model = Article
@@ -341,6 +355,8 @@ class ArticleListSerializer(serializers.ModelSerializer):
             "published_at",
             "updated_at",
             "updated_days",
+            "headline",
+            "title_headline",
         ]
 
     def get_updated_days(self, obj):
@@ -351,12 +367,15 @@ class ArticleListSerializer(serializers.ModelSerializer):
         return obj.category_fk_id
 
     def get_author_linkedin_profile(self, obj):
-        linkedin = (
-            VerifiedNiatStudentProfile.objects
-            .filter(user__username=obj.author_username)
-            .values_list("linkedin_profile", flat=True)
-            .first()
-        )
+        if hasattr(obj, "author_linkedin"):
+            linkedin = obj.author_linkedin
+        else:
+            linkedin = (
+                VerifiedNiatStudentProfile.objects
+                .filter(user__username=obj.author_username)
+                .values_list("linkedin_profile", flat=True)
+                .first()
+            )
         if not linkedin:
             return None
         value = str(linkedin).strip()
@@ -540,3 +559,14 @@ class ModerationSerializer(serializers.Serializer):
         return attrs
 
 
+class BulkModerationSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.UUIDField(), allow_empty=False, max_length=MAX_BULK_MODERATION)
+    status = serializers.ChoiceField(choices=[("published", "Published"), ("rejected", "Rejected")])
+    rejection_reason = serializers.CharField(allow_blank=True, required=False)
+
+    def validate(self, attrs):
+        if attrs.get("status") == "rejected" and len(attrs.get("rejection_reason", "").strip()) < 10:
+            raise serializers.ValidationError({"rejection_reason": "Rejection reason must be at least 10 characters."})
+        return attrs
+
+
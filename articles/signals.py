@@ -1,30 +1,17 @@
 import logging
-import os
-import requests
 from django.conf import settings
-from django.db.models.signals import pre_save, post_save, post_delete
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save, pre_delete, pre_save
 from django.dispatch import receiver
 from django.utils import timezone
+from . import article_counts
+from .caching import COUNTER_FIELDS, REVALIDATION_IGNORED_FIELDS, invalidate_article_lists
 from .models import Article
+from .revalidation import queue_revalidation
+from .search import remove_from_search_index, update_search_index
 from campuses.models import Campus
 
 logger = logging.getLogger(__name__)
-NEXT_BASE_URL = os.environ.get("NEXT_BASE_URL", "").rstrip("/")
-REVALIDATION_SECRET = os.environ.get("REVALIDATION_SECRET", "")
-
-
-def _revalidate_paths(paths: list[str]) -> None:
-    if not NEXT_BASE_URL or not REVALIDATION_SECRET:
-        return
-    try:
-        requests.post(
-            f"{NEXT_BASE_URL}/api/revalidate",
-            json={"secret": REVALIDATION_SECRET, "paths": paths},
-            timeout=5,
-        )
-        logger.info("Revalidated paths: %s", paths)
-    except requests.exceptions.RequestException as e:
-        logger.warning("Revalidation failed for paths %s: %s", paths, e)
 
 
 def _sync_ai_review_enabled():
@@ -96,37 +83,92 @@ def trigger_ai_review_after_create(sender, instance, created, **kwargs):
     instance.save(update_fields=["ai_confident_score", "ai_feedback", "ai_reviewed_at"])
 
 
+@receiver(post_init, sender=Article)
+def snapshot_article_counter_fields(sender, instance, **kwargs):
+    instance._counter_snapshot = article_counts.snapshot(instance)
+
+
+@receiver(pre_save, sender=Article)
+@receiver(pre_delete, sender=Article)
+def load_article_counter_fields(sender, instance, **kwargs):
+    # Instances loaded with .only()/.defer() have no snapshot; read the stored values once.
+    if instance._counter_snapshot is None and not instance._state.adding:
+        instance._counter_snapshot = article_counts.load_snapshot(instance)
+
+
 @receiver(post_save, sender=Article)
-def revalidate_article_page(sender, instance, **kwargs):
-    if instance.campus_id is None or instance.slug is None:
-        return
-    if instance.campus_id.slug is None:
+def update_published_article_counts(sender, instance, created, update_fields=None, **kwargs):
+    if update_fields and set(update_fields) <= COUNTER_FIELDS:
         return
-    paths = [
-        f"/campus/{instance.campus_id.slug}/article/{instance.slug}",
-        f"/campus/{instance.campus_id.slug}",
-        f"/campus/{instance.campus_id.slug}/articles",
-    ]
-    _revalidate_paths(paths)
+    old = None if created else instance._counter_snapshot
+    new = article_counts.snapshot(instance) or article_counts.load_snapshot(instance)
+    article_counts.apply_membership_change(old, new)
+    instance._counter_snapshot = new
 
 
 @receiver(post_delete, sender=Article)
-def revalidate_deleted_article_page(sender, instance, **kwargs):
-    if instance.campus_id is None or instance.slug is None:
+def remove_published_article_counts(sender, instance, **kwargs):
+    article_counts.apply_membership_change(instance._counter_snapshot, None)
+
+
+@receiver(post_save, sender=Article)
+def update_article_search_index(sender, instance, update_fields=None, **kwargs):
+    """Keep search_vector (PostgreSQL) or the FTS5 row (SQLite) in sync with the article text."""
+    if update_fields and set(update_fields) <= REVALIDATION_IGNORED_FIELDS:
         return
-    if instance.campus_id.slug is None:
+    update_search_index(instance)
+
+
+@receiver(post_delete, sender=Article)
+def remove_article_search_index(sender, instance, **kwargs):
+    remove_from_search_index(instance.pk)
+
+
+@receiver(post_save, sender=Article)
+def invalidate_cached_article_lists(sender, instance, update_fields=None, **kwargs):
+    if update_fields and set(update_fields) <= REVALIDATION_IGNORED_FIELDS:
         return
-    paths = [
-        f"/campus/{instance.campus_id.slug}/article/{instance.slug}",
-        f"/campus/{instance.campus_id.slug}",
-        f"/campus/{instance.campus_id.slug}/articles",
+    transaction.on_commit(invalidate_article_lists)
+
+
+@receiver(post_delete, sender=Article)
+def invalidate_cached_article_lists_on_delete(sender, instance, **kwargs):
+    transaction.on_commit(invalidate_article_lists)
+
+
+def _article_paths(instance):
+    if instance.campus_id_id is None or instance.slug is None:
+        return []
+    campus_slug = instance.campus_id.slug
+    if campus_slug is None:
+        return []
+    return [
+        f"/campus/{campus_slug}/article/{instance.slug}",
+        f"/campus/{campus_slug}",
+        f"/campus/{campus_slug}/articles",
     ]
-    _revalidate_paths(paths)
+
+
+@receiver(post_save, sender=Article)
+def revalidate_article_page(sender, instance, update_fields=None, **kwargs):
+    if update_fields and set(update_fields) <= REVALIDATION_IGNORED_FIELDS:
+        return
+    queue_revalidation(_article_paths(instance))
+
+
+@receiver(post_delete, sender=Article)
+def revalidate_deleted_article_page(sender, instance, **kwargs):
+    queue_revalidation(_article_paths(instance))
+
+
+@receiver(post_delete, sender=Campus)
+def invalidate_cached_article_lists_on_campus_delete(sender, instance, **kwargs):
+    # SET_NULL clears articles' campus_id with an UPDATE that sends no Article signals.
+    transaction.on_commit(invalidate_article_lists)
 
 
 @receiver(post_save, sender=Campus)
-def revalidate_campus_page(sender, instance, **kwargs):
+def revalidate_campus_page(sender, instance, update_fields=None, **kwargs):
     if instance.slug is None:
         return
-    paths = [f"/campus/{instance.slug}", "/campuses"]
-    _revalidate_paths(paths)
\ No newline at end of file
+    queue_revalidation([f"/campus/{instance.slug}", "/campuses"])
@@ -0,0 +1,49 @@
+"""Gemini review results are reused for unchanged content under the same prompt version."""
+import json
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from accounts.models import User
+from articles import ai_review
+from articles.models import AIReviewCache, Article
+from core.llm import get_llm, reset_llms
+
+
+@override_settings(LLM_BACKEND="fake")
+class AIReviewCacheTests(TestCase):
+    def setUp(self):
+        self.author = User.objects.create(username="writer", email="writer@example.com")
+        self.article = Article.objects.create(
+            author_id=self.author,
+            author_username=self.author.username,
+            category="campus-life",
+            title="Hostel life",
+            excerpt="Excerpt",
+            body="<p>The   hostel food is great.</p>",
+            status="pending_review",
+        )
+        reset_llms()
+        self.llm = get_llm("gemini")
+
+    def test_unchanged_content_reuses_cached_review(self):
+        first = ai_review.review_article_with_gemini(self.article)
+        self.article.body = "<div>The hostel food is great.</div>"  # same cleaned body
+        second = ai_review.review_article_with_gemini(self.article)
+        self.assertEqual(len(self.llm.calls), 1)
+        self.assertEqual(first, second)
+        self.assertEqual(AIReviewCache.objects.get().prompt_version, ai_review.PROMPT_VERSION)
+
+    def test_changed_content_or_prompt_version_misses(self):
+        ai_review.review_article_with_gemini(self.article)
+        self.article.body = "The hostel food is terrible."
+        ai_review.review_article_with_gemini(self.article)
+        with mock.patch.object(ai_review, "PROMPT_VERSION", "new-prompt"):
+            ai_review.review_article_with_gemini(self.article)
+        self.assertEqual(len(self.llm.calls), 3)
+
+    def test_failed_reviews_are_not_cached(self):
+        self.llm.responder = lambda prompt, **kwargs: "not json"
+        with self.assertRaises(json.JSONDecodeError), self.assertLogs("articles.ai_review", "ERROR"):
+            ai_review.review_article_with_gemini(self.article)
+        self.assertFalse(AIReviewCache.objects.exists())
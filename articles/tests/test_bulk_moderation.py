@@ -0,0 +1,116 @@
+"""Bulk moderation: one UPDATE, bulk audit rows, status emails queued in the outbox."""
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from articles.models import Article, Club, ClubCampus
+from articles.moderation import bulk_moderate
+from audit.models import ActionType, AuditLog
+from campuses.models import Campus
+from notifications.models import EmailOutbox
+
+URL = "/api/articles/articles/bulk-moderate/"
+
+
+class BulkModerationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.author = User.objects.create(username="writer", email="writer@example.com")
+        self.moderator = User.objects.create(username="mod", email="mod@example.com", role=User.UserRole.MODERATOR)
+        self.campus = Campus.objects.create(
+            name="North", location="City", state="State", image_url="https://x.test/i.png", slug="north"
+        )
+        self.club = Club.objects.create(name="Robotics", slug="robotics")
+        ClubCampus.objects.create(club=self.club, campus=self.campus)
+        self.client = APIClient()
+        self.client.force_authenticate(self.moderator)
+
+    def _articles(self, count, status="pending_review", **fields):
+        return [
+            Article.objects.create(
+                author_id=self.author,
+                author_username=self.author.username,
+                category=fields.get("category", "campus-life"),
+                subcategory=fields.get("subcategory", ""),
+                campus_id=self.campus,
+                title=f"Article {index}",
+                excerpt="Excerpt",
+                body="Body",
+                status=status,
+            )
+            for index in range(count)
+        ]
+
+    def _moderate(self, articles, new_status, **kwargs):
+        with mock.patch("notifications.tasks.drain_email_outbox.delay") as delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                result = bulk_moderate([a.pk for a in articles], new_status, self.moderator, **kwargs)
+        return result, delay
+
+    def test_query_count_does_not_grow_with_batch_size(self):
+        def queries(count):
+            articles = self._articles(count)
+            with CaptureQueriesContext(connection) as ctx:
+                self._moderate(articles, "published")
+            return len(ctx.captured_queries)
+
+        self.assertEqual(queries(2), queries(20))
+
+    def test_publishes_valid_rows_and_skips_invalid_transitions(self):
+        pending = self._articles(3)
+        draft = self._articles(1, status="draft")
+        result, delay = self._moderate(pending + draft, "published")
+
+        self.assertCountEqual(result["updated"], [str(a.pk) for a in pending])
+        self.assertEqual(result["skipped"], [str(draft[0].pk)])
+        for article in Article.objects.filter(pk__in=[a.pk for a in pending]):
+            self.assertEqual(article.status, "published")
+            self.assertEqual(article.reviewed_by_id_id, self.moderator.pk)
+            self.assertIsNotNone(article.published_at)
+        self.assertEqual(Article.objects.get(pk=draft[0].pk).status, "draft")
+        delay.assert_called_once()
+        emails = EmailOutbox.objects.all()
+        self.assertEqual(emails.count(), 3)
+        self.assertEqual(emails[0].to, ["writer@example.com"])
+        self.assertEqual(emails[0].subject, "Article status updated: published")
+
+        logs = AuditLog.objects.filter(action=ActionType.ARTICLE_PUBLISHED)
+        self.assertEqual(logs.count(), 3)
+        self.assertEqual(logs.first().metadata, {"from_status": "pending_review", "to_status": "published"})
+
+    def test_counters_follow_bulk_publish(self):
+        self._moderate(self._articles(2) + self._articles(1, category="club-directory", subcategory="robotics"), "published")
+
+        self.campus.refresh_from_db()
+        self.assertEqual(self.campus.published_article_count, 3)
+        self.assertEqual(Club.objects.get(pk=self.club.pk).published_article_count, 1)
+        self.assertEqual(ClubCampus.objects.get(club=self.club).published_article_count, 1)
+
+    def test_api_rejects_with_reason(self):
+        articles = self._articles(2)
+        with mock.patch("notifications.tasks.drain_email_outbox.delay") as delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(
+                    URL,
+                    {"ids": [str(a.pk) for a in articles], "status": "rejected", "rejection_reason": "Needs sources cited."},
+                    format="json",
+                )
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(len(response.json()["updated"]), 2)
+        self.assertEqual(set(Article.objects.values_list("rejection_reason", flat=True)), {"Needs sources cited."})
+        delay.assert_called_once()
+
+    def test_api_validation_and_permissions(self):
+        articles = self._articles(1)
+        response = self.client.post(URL, {"ids": [str(articles[0].pk)], "status": "rejected"}, format="json")
+        self.assertEqual(response.status_code, 400)
+
+        self.client.force_authenticate(self.author)
+        response = self.client.post(URL, {"ids": [str(articles[0].pk)], "status": "published"}, format="json")
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(Article.objects.get(pk=articles[0].pk).status, "pending_review")
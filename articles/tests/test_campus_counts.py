@@ -0,0 +1,65 @@
+"""Campus directory: stored published article counters."""
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from articles.models import Article
+from campuses.models import Campus
+
+
+def _campus(slug):
+    return Campus.objects.create(name=slug.title(), location="City", state="State", image_url="https://x.test/i.png", slug=slug)
+
+
+class CampusArticleCountTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.author = User.objects.create(username="writer", email="writer@example.com")
+        self.north = _campus("north")
+        self.south = _campus("south")
+
+    def _article(self, campus, status="published"):
+        return Article.objects.create(
+            author_id=self.author,
+            author_username=self.author.username,
+            category="campus-life",
+            campus_id=campus,
+            title="Campus news",
+            excerpt="Excerpt",
+            body="Body",
+            status=status,
+        )
+
+    def _counts(self):
+        response = self.client.get("/api/campuses/")
+        self.assertEqual(response.status_code, 200, response.content)
+        return [(row["slug"], row["articleCount"]) for row in response.json()]
+
+    def test_counts_follow_transitions_moves_and_deletes(self):
+        self._article(self.south)
+        pending = self._article(self.north, status="pending_review")
+        self.assertEqual(self._counts(), [("south", 1), ("north", 0)])
+
+        pending.transition_to("published", actor=self.author)
+        self._article(self.north)
+        self.assertEqual(self._counts(), [("north", 2), ("south", 1)])
+
+        pending.campus_id = self.south
+        pending.save()
+        self.assertEqual(self._counts(), [("south", 2), ("north", 1)])
+
+        Article.objects.get(pk=pending.pk).delete()
+        self.assertEqual(self._counts(), [("north", 1), ("south", 1)])
+        self.assertEqual(self.client.get("/api/campuses/north/").json()["articleCount"], 1)
+
+    def test_reconcile_command_repairs_drift(self):
+        self._article(self.north, status="draft")
+        Article.objects.update(status="published")  # bypasses signals
+        self.assertEqual(Campus.objects.get(pk=self.north.pk).published_article_count, 0)
+        out = StringIO()
+        call_command("reconcile_article_counts", stdout=out)
+        self.assertIn("Fixed 1 campus counter(s)", out.getvalue())
+        self.assertEqual(Campus.objects.get(pk=self.north.pk).published_article_count, 1)
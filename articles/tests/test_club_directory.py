@@ -0,0 +1,97 @@
+"""Club directory: one chapter resolution per club and stored article counters."""
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from articles.article_counts import reconcile_club_article_counts
+from articles.models import Article, Club, ClubCampus
+from campuses.models import Campus
+
+
+def _campus(slug):
+    return Campus.objects.create(name=slug.title(), location="City", state="State", image_url="https://x.test/i.png", slug=slug)
+
+
+class ClubDirectoryTests(TestCase):
+    url = "/api/articles/clubs/"
+
+    def setUp(self):
+        self.client = APIClient()
+        self.author = User.objects.create(username="writer", email="writer@example.com")
+        self.north = _campus("north")
+        self.south = _campus("south")
+        self.clubs = 0
+
+    def _add_clubs(self, count):
+        for _ in range(count):
+            club = Club.objects.create(name=f"Club {self.clubs:02d}", slug=f"club-{self.clubs:02d}")
+            self.clubs += 1
+            ClubCampus.objects.create(club=club, campus=self.north, president_name="North lead")
+            ClubCampus.objects.create(club=club, campus=self.south, president_name="South lead")
+
+    def _article(self, club_slug, campus, status="published"):
+        return Article.objects.create(
+            author_id=self.author,
+            author_username=self.author.username,
+            category="club-directory",
+            subcategory=club_slug,
+            campus_id=campus,
+            title=f"{club_slug} news",
+            excerpt="Excerpt",
+            body="Body",
+            status=status,
+        )
+
+    def _count(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, response.content)
+        return len(queries), response.json()
+
+    def test_list_query_count_is_independent_of_club_count(self):
+        for url in (self.url, f"{self.url}?campus={self.south.pk}"):
+            self._add_clubs(2)
+            small, _ = self._count(url)
+            self._add_clubs(8)
+            large, data = self._count(url)
+            self.assertEqual(small, large, url)
+            self.assertEqual(len(data["results"]), self.clubs)
+        self.assertEqual(data["results"][0]["campus_name"], "South")
+        self.assertEqual(data["results"][0]["president_name"], "South lead")
+
+    def test_detail_query_count_is_constant(self):
+        self._add_clubs(1)
+        queries, data = self._count(f"{self.url}club-00/")
+        self.assertEqual(len(data["campus_chapters"]), 2)
+        self.assertLessEqual(queries, 4)
+
+    def test_article_counts_follow_publish_move_and_delete(self):
+        self._add_clubs(2)
+        article = self._article("club-00", self.north)
+        self._article("club-00", self.south)
+        self._article("club-00", self.north, status="draft")
+
+        def counts(campus=None):
+            url = f"{self.url}?campus={campus.pk}" if campus else self.url
+            return {row["slug"]: row["article_count"] for row in self.client.get(url).json()["results"]}
+
+        self.assertEqual(counts(), {"club-00": 2, "club-01": 0})
+        self.assertEqual(counts(self.north), {"club-00": 1, "club-01": 0})
+
+        article.subcategory = "club-01"
+        article.save()
+        self.assertEqual(counts(self.north), {"club-00": 0, "club-01": 1})
+
+        Article.objects.get(pk=article.pk).delete()
+        self.assertEqual(counts(), {"club-00": 1, "club-01": 0})
+
+    def test_reconcile_repairs_counters_after_queryset_updates(self):
+        self._add_clubs(1)
+        self._article("club-00", self.north, status="draft")
+        Article.objects.update(status="published")  # bypasses signals
+        self.assertEqual(Club.objects.get().published_article_count, 0)
+        self.assertEqual(reconcile_club_article_counts(), 2)
+        self.assertEqual(Club.objects.get().published_article_count, 1)
+        self.assertEqual(ClubCampus.objects.get(campus=self.north).published_article_count, 1)
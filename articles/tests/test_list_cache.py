@@ -0,0 +1,113 @@
+"""Anonymous article list responses are cached and invalidated by article and campus signals."""
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from articles.models import Article
+from campuses.models import Campus
+
+
+class ArticleListCacheTests(TestCase):
+    url = "/api/articles/articles/"
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.author = User.objects.create(username="writer", email="writer@example.com")
+
+    def _publish(self, title):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Article.objects.create(
+                author_id=self.author,
+                author_username=self.author.username,
+                category="onboarding-kit",
+                title=title,
+                excerpt="Excerpt",
+                body="Body",
+                status="published",
+            )
+
+    def _titles(self, url=None):
+        return [row["title"] for row in self.client.get(url or self.url).json()["results"]]
+
+    def test_repeat_request_is_served_from_cache(self):
+        self._publish("First")
+        self.assertEqual(self._titles(), ["First"])
+        with self.assertNumQueries(0):
+            self.assertEqual(self._titles(), ["First"])
+
+    def test_query_params_are_normalized(self):
+        self._publish("First")
+        self.client.get(f"{self.url}?featured=false&ordering=updated_at")
+        with self.assertNumQueries(0):
+            self.client.get(f"{self.url}?ordering=updated_at&featured=false&search=")
+
+    def test_article_save_invalidates(self):
+        article = self._publish("First")
+        self._titles()
+        article.title = "Renamed"
+        with self.captureOnCommitCallbacks(execute=True):
+            article.save()
+        self.assertEqual(self._titles(), ["Renamed"])
+
+    def test_counter_only_save_keeps_cache(self):
+        article = self._publish("First")
+        self._titles()
+        article.upvote_count = 3
+        with self.captureOnCommitCallbacks(execute=True):
+            article.save(update_fields=["upvote_count"])
+        with self.assertNumQueries(0):
+            self._titles()
+
+    def test_ai_review_save_keeps_cache_and_search_index(self):
+        article = self._publish("First")
+        self._titles()
+        article.ai_feedback = {"confidence_score": 0.9}
+        article.ai_review_claimed_until = None
+        with mock.patch("articles.signals.update_search_index") as update_search_index:
+            with self.captureOnCommitCallbacks(execute=True):
+                article.save(update_fields=["ai_feedback", "ai_review_claimed_until"])
+        update_search_index.assert_not_called()
+        with self.assertNumQueries(0):
+            self._titles()
+
+    def test_authenticated_requests_bypass_cache(self):
+        self._publish("First")
+        self._titles()
+        self.client.force_authenticate(self.author)
+        self._publish("Second")
+        self.assertEqual(sorted(self._titles()), ["First", "Second"])
+
+    def test_campus_delete_invalidates(self):
+        campus = Campus.objects.create(
+            name="North", location="City", state="State", image_url="https://x.test/i.png", slug="north"
+        )
+        article = self._publish("First")
+        article.campus_id = campus
+        with self.captureOnCommitCallbacks(execute=True):
+            article.save()
+        self.assertEqual(self.client.get(self.url).json()["results"][0]["campus_id"], str(campus.pk))
+        with self.captureOnCommitCallbacks(execute=True):
+            campus.delete()
+        self.assertIsNone(self.client.get(self.url).json()["results"][0]["campus_id"])
+
+    def test_unavailable_cache_serves_uncached(self):
+        self._publish("First")
+        with mock.patch("articles.caching.list_cache.get", side_effect=ConnectionError("down")):
+            with self.assertLogs("articles.views", "WARNING"):
+                self.assertEqual(self._titles(), ["First"])
+        with mock.patch("articles.caching.list_cache.set", side_effect=ConnectionError("down")):
+            with self.assertLogs("articles.views", "WARNING"):
+                self.assertEqual(self._titles(), ["First"])
+
+    def test_unavailable_cache_does_not_fail_writes(self):
+        article = self._publish("First")
+        article.title = "Renamed"
+        with mock.patch("articles.caching.list_cache.backend.incr", side_effect=ConnectionError("down")):
+            with self.assertLogs("articles.caching", "WARNING"):
+                with self.captureOnCommitCallbacks(execute=True):
+                    article.save()
+        self.assertEqual(Article.objects.get(pk=article.pk).title, "Renamed")
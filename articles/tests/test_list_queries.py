@@ -0,0 +1,97 @@
+"""Article list endpoints must run in a constant number of queries regardless of page size."""
+import itertools
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from articles.models import Article
+from campuses.models import Campus
+from profiles.models import VerifiedNiatStudentProfile
+
+_counter = itertools.count()
+
+
+class ArticleListQueryCountTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.campus = Campus.objects.create(
+            name="Test Campus", location="City", state="State", image_url="https://example.com/c.png", slug="test-campus"
+        )
+        self.moderator = User.objects.create(username="mod", email="mod@example.com", role=User.UserRole.MODERATOR)
+
+    def _make_author(self):
+        n = next(_counter)
+        user = User.objects.create(
+            username=f"writer{n}", email=f"writer{n}@example.com", role=User.UserRole.VERIFIED_NIAT_STUDENT
+        )
+        VerifiedNiatStudentProfile.objects.create(
+            user=user, campus=self.campus, linkedin_profile=f"https://www.linkedin.com/in/writer{n}"
+        )
+        return user
+
+    def _make_articles(self, count, author=None, status="published"):
+        for _ in range(count):
+            user = author or self._make_author()
+            n = next(_counter)
+            Article.objects.create(
+                author_id=user,
+                author_username=user.username,
+                campus_id=self.campus,
+                campus_name=self.campus.name,
+                category="onboarding-kit",
+                title=f"Article {n}",
+                slug=f"article-{n}",
+                excerpt="Excerpt",
+                body="Body",
+                status=status,
+            )
+
+    def _count_queries(self, url, user=None):
+        cache.clear()
+        self.client.force_authenticate(User.objects.get(pk=user.pk) if user else None)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, response.content)
+        return len(queries), response
+
+    def _assert_constant(self, url, grow, user=None):
+        grow(2)
+        small, _ = self._count_queries(url, user)
+        grow(10)
+        large, response = self._count_queries(url, user)
+        self.assertEqual(small, large)
+        return response
+
+    def test_public_list(self):
+        response = self._assert_constant("/api/articles/articles/", self._make_articles)
+        first = response.json()["results"][0]
+        self.assertTrue(first["author_linkedin_profile"].startswith("https://www.linkedin.com/in/writer"))
+
+    def test_my_articles(self):
+        author = self._make_author()
+        self._assert_constant(
+            "/api/articles/articles/my_articles/",
+            lambda n: self._make_articles(n, author=author, status="draft"),
+            user=author,
+        )
+
+    def test_pending(self):
+        self._assert_constant(
+            "/api/articles/articles/pending/",
+            lambda n: self._make_articles(n, status="pending_review"),
+            user=self.moderator,
+        )
+
+    def test_author_profile_with_articles(self):
+        author = self._make_author()
+        response = self._assert_constant(
+            f"/api/authors/{author.username}/",
+            lambda n: self._make_articles(n, author=author),
+        )
+        self.assertEqual(
+            response.json()["articles"][0]["author_linkedin_profile"], author.verified_niat_profile.linkedin_profile
+        )
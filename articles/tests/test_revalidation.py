@@ -0,0 +1,84 @@
+"""Next.js revalidation: queued after commit, coalesced, skipped for counter-only saves."""
+import threading
+from unittest import mock
+
+from django.db import transaction
+from django.test import TestCase, override_settings
+
+from accounts.models import User
+from articles import revalidation
+from articles.models import Article
+from articles.revalidation import RevalidationDispatcher
+from campuses.models import Campus
+
+
+@override_settings(REVALIDATION_ASYNC=False)
+@mock.patch.multiple(revalidation, NEXT_BASE_URL="https://web.test", REVALIDATION_SECRET="s3cret")
+class RevalidationTests(TestCase):
+    def setUp(self):
+        self.author = User.objects.create(username="writer", email="writer@example.com")
+        self.campus = Campus.objects.create(
+            name="North", location="City", state="State", image_url="https://x.test/i.png", slug="north"
+        )
+        self.article = Article.objects.create(
+            author_id=self.author,
+            author_username=self.author.username,
+            category="campus-life",
+            campus_id=self.campus,
+            title="Campus news",
+            slug="campus-news",
+            excerpt="Excerpt",
+            body="Body",
+            status="published",
+        )
+
+    def _posts(self, func):
+        with mock.patch.object(revalidation.dispatcher, "_post") as post:
+            with self.captureOnCommitCallbacks(execute=True):
+                func()
+        return [call.args[0] for call in post.call_args_list]
+
+    def test_article_save_posts_after_commit(self):
+        with mock.patch.object(revalidation.dispatcher, "_post") as post:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.article.save()
+                post.assert_not_called()
+        post.assert_called_once_with(
+            ["/campus/north", "/campus/north/article/campus-news", "/campus/north/articles"]
+        )
+
+    def test_counter_and_ai_review_saves_are_skipped(self):
+        def save():
+            self.article.upvote_count = 3
+            self.article.save(update_fields=["upvote_count"])
+            self.article.ai_confident_score = 0.9
+            self.article.save(update_fields=["ai_confident_score", "ai_feedback", "ai_reviewed_at"])
+
+        self.assertEqual(self._posts(save), [])
+
+    def test_rolled_back_saves_are_not_sent(self):
+        def save():
+            with self.assertRaises(RuntimeError), transaction.atomic():
+                self.article.save()
+                raise RuntimeError
+
+        self.assertEqual(self._posts(save), [])
+
+
+class DispatcherTests(TestCase):
+    @override_settings(REVALIDATION_ASYNC=True, REVALIDATION_WINDOW=0.05)
+    def test_background_worker_coalesces_a_burst(self):
+        dispatcher = RevalidationDispatcher()
+        sent = threading.Event()
+        with mock.patch.object(dispatcher, "_post", side_effect=lambda paths: sent.set()) as post:
+            dispatcher.enqueue(["/campus/north", "/campuses"])
+            dispatcher.enqueue(["/campus/north"])
+            self.assertTrue(sent.wait(5))
+        post.assert_called_once_with(["/campus/north", "/campuses"])
+
+    def test_flush_splits_large_batches(self):
+        dispatcher = RevalidationDispatcher()
+        with mock.patch.object(dispatcher, "_post") as post:
+            dispatcher._pending.update(f"/p/{i:03d}" for i in range(revalidation.MAX_PATHS_PER_REQUEST + 1))
+            self.assertEqual(dispatcher.flush(), revalidation.MAX_PATHS_PER_REQUEST + 1)
+        self.assertEqual([len(call.args[0]) for call in post.call_args_list], [revalidation.MAX_PATHS_PER_REQUEST, 1])
@@ -0,0 +1,101 @@
+"""AI review queue: leased claiming, worker pool and metrics."""
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import DatabaseError
+from django.test import TestCase
+from django.utils import timezone
+
+from accounts.models import User
+from articles.models import Article
+from articles.review_queue import ReviewMetrics, ReviewWorkerPool, claim_articles
+
+RESULT = {"confidence_score": 0.9, "status_recommendation": "published"}
+
+
+class ReviewQueueTests(TestCase):
+    def setUp(self):
+        self.author = User.objects.create(username="writer", email="writer@example.com")
+
+    def _article(self, title, status="pending_review", **extra):
+        return Article.objects.create(
+            author_id=self.author,
+            author_username=self.author.username,
+            category="campus-life",
+            title=title,
+            excerpt="Excerpt",
+            body="Body",
+            status=status,
+            **extra,
+        )
+
+    def test_claim_leases_each_article_once(self):
+        first = self._article("First")
+        second = self._article("Second")
+        self._article("Reviewed", ai_feedback=RESULT)
+        self._article("Draft", status="draft")
+
+        self.assertEqual([a.pk for a in claim_articles(1)], [first.pk])
+        self.assertEqual([a.pk for a in claim_articles(5)], [second.pk])
+        self.assertEqual(claim_articles(5), [])
+
+        Article.objects.filter(pk=first.pk).update(ai_review_claimed_until=timezone.now() - timedelta(seconds=1))
+        self.assertEqual([a.pk for a in claim_articles(5)], [first.pk])
+
+    def test_review_stores_result_and_releases_lease(self):
+        article = self._article("First")
+        pool = ReviewWorkerPool(review=mock.Mock(return_value=RESULT))
+        self.assertEqual(pool.run_batch(5), 1)
+        article.refresh_from_db()
+        self.assertEqual(article.ai_feedback, RESULT)
+        self.assertEqual(article.ai_confident_score, 0.9)
+        self.assertIsNone(article.ai_review_claimed_until)
+        self.assertEqual(pool.metrics.summary()["reviewed"], 1)
+
+    def test_failed_review_keeps_lease_until_it_expires(self):
+        article = self._article("First")
+        pool = ReviewWorkerPool(review=mock.Mock(side_effect=RuntimeError("quota")))
+        with self.assertLogs("articles.review_queue", "ERROR"):
+            self.assertEqual(pool.run_batch(5), 1)
+        article.refresh_from_db()
+        self.assertIsNone(article.ai_feedback)
+        self.assertIsNotNone(article.ai_review_claimed_until)
+        self.assertEqual(pool.run_batch(5), 0)
+        self.assertEqual(pool.metrics.summary()["failed"], 1)
+
+    def test_failed_save_is_logged_and_does_not_stop_the_batch(self):
+        self._article("First")
+        self._article("Second")
+        pool = ReviewWorkerPool(review=mock.Mock(return_value=RESULT))
+        with mock.patch.object(Article, "save", side_effect=[DatabaseError("gone away"), None]):
+            with self.assertLogs("articles.review_queue", "ERROR"):
+                self.assertEqual(pool.run_batch(5), 2)
+        self.assertEqual((pool.metrics.summary()["reviewed"], pool.metrics.summary()["failed"]), (1, 1))
+
+    def test_daemon_survives_batch_errors(self):
+        out = StringIO()
+        batches = [DatabaseError("gone away"), KeyboardInterrupt()]
+        with mock.patch.object(ReviewWorkerPool, "run_batch", side_effect=batches) as run_batch, mock.patch("time.sleep"):
+            with self.assertLogs("articles.management.commands.run_ai_review_daemon", "ERROR"):
+                call_command("run_ai_review_daemon", stdout=out)
+        self.assertEqual(run_batch.call_count, 2)
+        self.assertIn("Batch failed: gone away", out.getvalue())
+
+    def test_daemon_once_reviews_backlog(self):
+        self._article("First")
+        self._article("Second")
+        out = StringIO()
+        with mock.patch.object(ReviewWorkerPool, "review", mock.Mock(return_value=RESULT)):
+            call_command("run_ai_review_daemon", "--once", "--batch", "5", "--rate", "0", stdout=out)
+        self.assertIn("Reviewed 2 (failed 0)", out.getvalue())
+        self.assertFalse(Article.objects.filter(ai_feedback__isnull=True).exists())
+
+    def test_metrics_keep_a_bounded_latency_window(self):
+        metrics = ReviewMetrics(window=10)
+        for latency in range(100):
+            metrics.record(float(latency), ok=True)
+        summary = metrics.summary()
+        self.assertEqual(len(metrics.latencies), 10)
+        self.assertEqual((summary["reviewed"], summary["p50_s"]), (100, 95.0))
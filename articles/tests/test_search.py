@@ -0,0 +1,68 @@
+"""Full-text article search (FTS5 on SQLite) ranking, headlines and index sync."""
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from articles.models import Article
+
+
+class ArticleSearchTests(TestCase):
+    url = "/api/articles/articles/"
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.author = User.objects.create(username="writer", email="writer@example.com")
+
+    def _publish(self, title, body="Body", excerpt="Excerpt"):
+        return Article.objects.create(
+            author_id=self.author,
+            author_username=self.author.username,
+            category="onboarding-kit",
+            title=title,
+            excerpt=excerpt,
+            body=body,
+            status="published",
+        )
+
+    def _search(self, q, **params):
+        # Anonymous lists are cached; invalidation runs on commit, which TestCase never reaches.
+        cache.clear()
+        response = self.client.get(self.url, {"search": q, **params})
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()["results"]
+
+    def test_title_match_ranks_above_body_match(self):
+        self._publish("Campus life", body="The hostel mess serves dinner at eight.")
+        self._publish("Hostel guide")
+        self._publish("Placements")
+        results = self._search("hostel")
+        self.assertEqual([row["title"] for row in results], ["Hostel guide", "Campus life"])
+
+    def test_prefix_match_and_headlines(self):
+        self._publish("Scholarships explained", body="Merit scholarships are renewed every year.")
+        [row] = self._search("scholar")
+        self.assertIn("<mark>Scholarships</mark>", row["title_headline"])
+        self.assertIn("<mark>scholarships</mark>", row["headline"])
+
+    def test_special_characters_are_not_parsed_as_fts_syntax(self):
+        self._publish("Hostel guide")
+        self.assertEqual(len(self._search('hostel" (-*')), 1)
+        self.assertEqual(self._search("%%"), [])
+
+    def test_explicit_ordering_overrides_rank(self):
+        self._publish("Hostel guide")
+        self._publish("Campus life", body="hostel")
+        Article.objects.filter(title="Campus life").update(upvote_count=5)
+        results = self._search("hostel", ordering="upvote_count")
+        self.assertEqual([row["title"] for row in results], ["Campus life", "Hostel guide"])
+
+    def test_index_follows_updates_and_deletes(self):
+        article = self._publish("Hostel guide")
+        article.title = "Library guide"
+        article.save()
+        self.assertEqual(self._search("hostel"), [])
+        self.assertEqual(len(self._search("library")), 1)
+        article.delete()
+        self.assertEqual(self._search("library"), [])
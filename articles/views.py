@@ -1,3 +1,4 @@
+import logging
 import re
 import uuid
 from collections import defaultdict
@@ -14,9 +15,15 @@ from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from django.db.models import Count, F, Q, OuterRef, Subquery, IntegerField, Value, Prefetch, Sum
+from django.db.models import Count, Q, Value, Prefetch, Sum
 from django.db.models.functions import Coalesce
 
+from core.cache import NamespacedCache
+from core.counters import article_views
+
+from .search import search_articles
+from .caching import cache_list, get_cached_list, list_cache_key
+from . import moderation
 from .models import Article, ArticleSuggestion, ArticleUpvote, Category, Club, ClubCampus, Subcategory, generate_unique_slug
 from profiles.models import VerifiedNiatStudentProfile
 from core.permissions import IsAuthorOrModerator, IsFoundingEditor, IsModeratorOrAdmin
@@ -27,11 +34,14 @@ from .serializers import (
     ArticleListSerializer,
     ArticleWriteSerializer,
     ClubDetailSerializer,
+    BulkModerationSerializer,
     ClubListSerializer,
     CategorySerializer,
     ModerationSerializer,
+    with_author_linkedin,
 )
 
+logger = logging.getLogger(__name__)
 
 moderator_or_admin_permission = IsModeratorOrAdmin()
 founding_editor_permission = IsFoundingEditor()
@@ -131,14 +141,7 @@ class ArticleViewSet(viewsets.ModelViewSet):
             base_qs = base_qs.filter(topic=topic)
         search = (self.request.query_params.get("search") or "").strip()
         if search:
-            base_qs = base_qs.filter(
-                Q(title__icontains=search)
-                | Q(excerpt__icontains=search)
-                | Q(body__icontains=search)
-                | Q(campus_name__icontains=search)
-                | Q(subcategory__icontains=search)
-                | Q(subcategory_other__icontains=search)
-            )
+            base_qs = search_articles(base_qs, search)
         author_username = (self.request.query_params.get("author_username") or "").strip()
         if author_username:
             base_qs = base_qs.filter(author_username__iexact=author_username)
@@ -152,12 +155,14 @@ class ArticleViewSet(viewsets.ModelViewSet):
             except (ValueError, TypeError):
                 pass
 
-        ordering = self.request.query_params.get("ordering", "updated_at")
+        ordering = self.request.query_params.get("ordering")
         if ordering == "upvote_count":
             base_qs = base_qs.order_by("-upvote_count", "-updated_at")
+        elif search and ordering is None:
+            base_qs = base_qs.order_by("-search_rank", "-updated_at")
         else:
             base_qs = base_qs.order_by("-updated_at")
-        return base_qs
+        return with_author_linkedin(base_qs)
 
     def get_serializer_class(self):
         if self.action == "retrieve" or self.action == "preview" or self.action == "edit_detail" or self.action == "create" or self.action == "partial_update" or self.action == "moderate":
@@ -171,7 +176,7 @@ class ArticleViewSet(viewsets.ModelViewSet):
             return [IsAuthenticated(), CanWriteArticle()]
         if self.action in ("partial_update", "destroy"):
             return [IsAuthenticated(), IsAuthorOrModerator()]
-        if self.action == "moderate":
+        if self.action in ("moderate", "bulk_moderate"):
             return [IsModeratorOrAdmin()]
         if self.action == "pending":
             return [IsModeratorOrAdmin()]
@@ -207,6 +212,25 @@ class ArticleViewSet(viewsets.ModelViewSet):
         self.check_object_permissions(self.request, obj)
         return obj
 
+    def list(self, request, *args, **kwargs):
+        # Anonymous visitors all see the same published lists; serve them from the shared cache.
+        if request.user.is_authenticated:
+            return super().list(request, *args, **kwargs)
+        try:
+            key = list_cache_key(request)
+            data = get_cached_list(key)
+        except Exception:
+            # An unavailable cache degrades to an uncached response, not a 500.
+            logger.warning("Article list cache unavailable", exc_info=True)
+            return super().list(request, *args, **kwargs)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            try:
+                cache_list(key, data)
+            except Exception:
+                logger.warning("Could not cache article list", exc_info=True)
+        return Response(data)
+
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
         if instance.status != "published":
@@ -403,6 +427,20 @@ class ArticleViewSet(viewsets.ModelViewSet):
         send_article_status_email.delay(str(article.pk), article.status)
         return Response(ArticleDetailSerializer(article).data)
 
+    @action(detail=False, methods=["post"], url_path="bulk-moderate", permission_classes=[IsModeratorOrAdmin])
+    def bulk_moderate(self, request):
+        ser = BulkModerationSerializer(data=request.data)
+        ser.is_valid(raise_exception=True)
+        data = ser.validated_data
+        result = moderation.bulk_moderate(
+            data["ids"],
+            data["status"],
+            request.user,
+            request=request,
+            rejection_reason=data.get("rejection_reason", "").strip(),
+        )
+        return Response(result)
+
     @action(detail=True, methods=["post"], permission_classes=[IsAuthenticated, IsAuthorOrModerator])
     def submit(self, request, pk=None):
         article = self.get_object()
@@ -450,7 +488,7 @@ class ArticleViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=["get"], permission_classes=[IsModeratorOrAdmin])
     def pending(self, request):
-        qs = Article.objects.filter(status="pending_review").order_by("created_at")
+        qs = with_author_linkedin(Article.objects.filter(status="pending_review").order_by("created_at"))
         page = self.paginate_queryset(qs)
         if page is not None:
             serializer = ArticleListSerializer(page, many=True)
@@ -510,12 +548,15 @@ class ClubViewSet(viewsets.ModelViewSet):
             qs = qs.prefetch_related(
                 Prefetch(
                     "campus_chapters",
-                    queryset=ClubCampus.objects.filter(campus_id=campus_uuid),
+                    queryset=ClubCampus.objects.filter(campus_id=campus_uuid).select_related("campus"),
                     to_attr="current_chapter",
                 )
             )
-        else:
-            qs = qs.prefetch_related("campus_chapters__campus")
+        if campus_uuid is None or self.action == "retrieve":
+            # Chapter resolution (and the detail's campus_chapters) read this prefetch.
+            qs = qs.prefetch_related(
+                Prefetch("campus_chapters", queryset=ClubCampus.objects.select_related("campus"))
+            )
         open_to_all = self.request.query_params.get("open_to_all")
         if open_to_all is not None:
             qs = qs.filter(campus_chapters__open_to_all=open_to_all.lower() in ("true", "1", "yes"))
@@ -533,26 +574,9 @@ class ClubViewSet(viewsets.ModelViewSet):
         if not is_moderator or not include_inactive:
             qs = qs.filter(is_active=True)
 
-        # article association remains campus + subcategory(club slug).
-        article_filters = {
-            "status": "published",
-            "category": "club-directory",
-            "subcategory": OuterRef("slug"),
-        }
-        if campus_uuid is not None:
-            article_filters["campus_id_id"] = campus_uuid
-        published_count_subquery = (
-            Article.objects.filter(**article_filters)
-            .values("subcategory")
-            .annotate(total=Count("id"))
-            .values("total")[:1]
-        )
-        return qs.annotate(
-            article_count=Coalesce(
-                Subquery(published_count_subquery, output_field=IntegerField()),
-                Value(0),
-            )
-        ).distinct().order_by("name")
+        # article_count is read from the stored published_article_count counters
+        # (articles.article_counts) rather than counted per club here.
+        return qs.distinct().order_by("name")
 
     def get_serializer_class(self):
         if self.action == "retrieve":
@@ -697,6 +721,10 @@ class ArticleImageUploadView(APIView):
         return Response({"url": url}, status=status.HTTP_201_CREATED)
 
 
+PUBLISHED_PK_CACHE_TIMEOUT = 10 * 60
+engagement_cache = NamespacedCache("articles:engagement")
+
+
 def _get_article_for_engagement(article_id, request=None):
     article = None
     try:
@@ -775,13 +803,32 @@ class ArticleSuggestView(APIView):
         return Response({"success": True}, status=status.HTTP_201_CREATED)
 
 
+def _published_article_pk(article_id):
+    """Published article pk for an id or slug, cached so repeat page views skip the lookup."""
+    key = f"published_pk:{article_id}"
+    pk = engagement_cache.get(key)
+    if pk is None:
+        lookup = Q(slug=article_id)
+        try:
+            lookup |= Q(pk=uuid.UUID(str(article_id)))
+        except (ValueError, TypeError):
+            pass
+        pk = Article.objects.filter(lookup, status="published").values_list("pk", flat=True).first()
+        if pk is not None:
+            engagement_cache.set(key, pk, PUBLISHED_PK_CACHE_TIMEOUT)
+    return pk
+
+
 class ArticleViewIncrementView(APIView):
     """POST: increment view count. Anonymous allowed. Deduplication is client-side (sessionStorage)."""
     permission_classes = [AllowAny]
 
     def post(self, request, article_id):
-        article = _get_article_for_engagement(article_id, request)
-        Article.objects.filter(pk=article.pk).update(view_count=F("view_count") + 1)
+        pk = _published_article_pk(article_id)
+        if pk is None:
+            # Drafts: only the author/moderator previewing them counts.
+            pk = _get_article_for_engagement(article_id, request).pk
+        article_views.incr(pk)
         return Response({"ok": True}, status=status.HTTP_200_OK)
 
 
@@ -0,0 +1,99 @@
+"""
+Batched audit log writes.
+
+AUDIT_LOG_MODE selects how log_action() stores entries:
+  "sync"      one INSERT per entry, immediately (tests)
+  "buffered"  entries are collected and written with one bulk_create
+  "queue"     like "buffered", but the batch is handed to the
+              audit.tasks.write_audit_logs Celery task
+
+In the buffered modes an entry logged inside a transaction is handed to
+transaction.on_commit, so it is kept only if that transaction commits and is
+dropped if it, or the savepoint it was logged in, rolls back, exactly like a row
+inserted in it would be. Within a request (AuditLogBufferMiddleware), or any
+other request_scope() block, committed and autocommit entries are held until the
+block exits, so a request costs at most one audit INSERT. Outside one, each entry
+is written as soon as it is committed.
+"""
+import logging
+import threading
+from contextlib import contextmanager
+from functools import partial
+
+from django.conf import settings
+from django.db import transaction
+
+from .models import AuditLog
+
+logger = logging.getLogger("audit.buffer")
+
+_state = threading.local()
+
+
+def _mode():
+    return getattr(settings, "AUDIT_LOG_MODE", "buffered")
+
+
+def _flush_or_hold(entries):
+    held = getattr(_state, "request_entries", None)
+    if held is not None:
+        held.extend(entries)
+    else:
+        write(entries)
+
+
+def serialize(entry):
+    return {
+        "id": str(entry.id),
+        "actor_id": str(entry.actor_id) if entry.actor_id is not None else None,
+        "target_user_id": str(entry.target_user_id) if entry.target_user_id is not None else None,
+        "action": entry.action,
+        "entity_type": entry.entity_type,
+        "entity_id": entry.entity_id,
+        "metadata": entry.metadata,
+        "ip_address": entry.ip_address,
+        "created_at": entry.created_at.isoformat(),
+    }
+
+
+def write(entries):
+    """Store `entries` (unsaved AuditLog instances) with one INSERT, or queue them in "queue" mode."""
+    if not entries:
+        return
+    if _mode() == "queue":
+        from .tasks import write_audit_logs
+
+        try:
+            write_audit_logs.delay([serialize(entry) for entry in entries])
+            return
+        except Exception:
+            logger.warning("Audit log queue unavailable, writing %s entries inline", len(entries), exc_info=True)
+    AuditLog.objects.bulk_create(entries)
+
+
+def record(entry):
+    """Store one unsaved AuditLog according to AUDIT_LOG_MODE."""
+    if _mode() == "sync":
+        entry.save(force_insert=True)
+        return
+    # Runs immediately outside a transaction; Django drops it if the transaction or savepoint rolls back.
+    # robust: a failed audit write is logged rather than raised from a transaction that already committed.
+    transaction.on_commit(partial(_flush_or_hold, [entry]), robust=True)
+
+
+@contextmanager
+def request_scope():
+    """Hold entries until the block exits, then write them with one INSERT."""
+    if getattr(_state, "request_entries", None) is not None:
+        yield
+        return
+    _state.request_entries = []
+    try:
+        yield
+    finally:
+        entries, _state.request_entries = _state.request_entries, None
+        try:
+            write(entries)
+        except Exception:
+            # Audit entries must not turn a finished response into a 500.
+            logger.exception("Failed to write %s audit log entries", len(entries))
@@ -0,0 +1,12 @@
+from .buffer import request_scope
+
+
+class AuditLogBufferMiddleware:
+    """Write the audit entries logged while handling a request with one INSERT."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with request_scope():
+            return self.get_response(request)
@@ -2,6 +2,7 @@ import uuid
 
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
 
 class ActionType(models.TextChoices):
@@ -35,10 +36,13 @@ class AuditLog(models.Model):
     entity_id = models.CharField(max_length=64)
     metadata = models.JSONField(default=dict)
     ip_address = models.GenericIPAddressField(null=True, blank=True)
-    created_at = models.DateTimeField(auto_now_add=True)
+    # Set when the entry is logged, not when a buffered batch is written.
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
 
     class Meta:
         indexes = [
             models.Index(fields=["actor", "-created_at"]),
             models.Index(fields=["entity_type", "entity_id"]),
+            # Range scans by core.retention.
+            models.Index(fields=["created_at"], name="audit_created_at_idx"),
         ]
@@ -0,0 +1,10 @@
+from celery import shared_task
+
+from .models import AuditLog
+
+
+@shared_task(autoretry_for=(Exception,), retry_backoff=True, max_retries=3)
+def write_audit_logs(rows):
+    """Insert audit entries serialized by audit.buffer.serialize; safe to retry."""
+    AuditLog.objects.bulk_create([AuditLog(**row) for row in rows], ignore_conflicts=True)
+    return len(rows)
@@ -0,0 +1,81 @@
+"""Batched audit log writes (audit.buffer)."""
+from unittest import mock
+
+from django.db import connection, transaction
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from accounts.models import User
+from audit.buffer import request_scope
+from audit.models import ActionType, AuditLog
+from audit.tasks import write_audit_logs
+from audit.utils import log_action
+
+
+def _inserts(ctx):
+    return [q for q in ctx.captured_queries if q["sql"].startswith('INSERT INTO "audit_auditlog"')]
+
+
+@override_settings(AUDIT_LOG_MODE="buffered")
+class BufferedAuditLogTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(username="mod", email="mod@example.com")
+
+    def _log(self, action=ActionType.ROLE_CHANGED):
+        log_action(actor=self.user, action=action, entity=self.user, target_user=self.user)
+
+    def test_entries_are_written_with_one_insert_on_commit(self):
+        with CaptureQueriesContext(connection) as ctx:
+            with request_scope(), self.captureOnCommitCallbacks(execute=True):
+                for _ in range(3):
+                    self._log()
+                self.assertEqual(AuditLog.objects.count(), 0)
+        self.assertEqual(AuditLog.objects.count(), 3)
+        self.assertEqual(len(_inserts(ctx)), 1)
+
+    def test_outside_a_request_entries_are_written_once_committed(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self._log()
+            self.assertEqual(AuditLog.objects.count(), 0)
+        self.assertEqual(AuditLog.objects.count(), 1)
+
+    def test_rolled_back_entries_are_dropped(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self._log(ActionType.NIAT_APPROVED)
+            try:
+                with transaction.atomic():
+                    self._log(ActionType.NIAT_REJECTED)
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+            self._log(ActionType.NIAT_APPROVED)
+        self.assertEqual(list(AuditLog.objects.values_list("action", flat=True)), [ActionType.NIAT_APPROVED] * 2)
+
+    def test_request_scope_writes_once_at_the_end(self):
+        with CaptureQueriesContext(connection) as ctx:
+            with request_scope():
+                for _ in range(2):
+                    with self.captureOnCommitCallbacks(execute=True):
+                        self._log()
+                self.assertEqual(AuditLog.objects.count(), 0)
+        self.assertEqual(AuditLog.objects.count(), 2)
+        self.assertEqual(len(_inserts(ctx)), 1)
+
+    @override_settings(AUDIT_LOG_MODE="queue")
+    def test_queue_mode_hands_batch_to_celery(self):
+        with mock.patch("audit.tasks.write_audit_logs.delay") as delay:
+            with request_scope(), self.captureOnCommitCallbacks(execute=True):
+                self._log()
+                self._log()
+        self.assertEqual(AuditLog.objects.count(), 0)
+        (rows,) = delay.call_args.args
+        self.assertEqual(len(rows), 2)
+
+        write_audit_logs(rows)
+        write_audit_logs(rows)  # retried delivery is idempotent
+        self.assertEqual(AuditLog.objects.filter(actor=self.user).count(), 2)
+
+    @override_settings(AUDIT_LOG_MODE="sync")
+    def test_sync_mode_inserts_immediately(self):
+        self._log()
+        self.assertEqual(AuditLog.objects.count(), 1)
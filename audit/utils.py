@@ -1,3 +1,6 @@
+from django.utils import timezone
+
+from .buffer import record
 from .models import AuditLog
 
 
@@ -9,12 +12,15 @@ def get_client_ip(request):
 
 
 def log_action(actor, action, entity, target_user=None, metadata=None, request=None):
-    AuditLog.objects.create(
-        actor=actor,
-        action=action,
-        entity_type=entity.__class__.__name__,
-        entity_id=str(entity.pk),
-        target_user=target_user,
-        metadata=metadata or {},
-        ip_address=get_client_ip(request) if request else None,
+    record(
+        AuditLog(
+            actor=actor,
+            action=action,
+            entity_type=entity.__class__.__name__,
+            entity_id=str(entity.pk),
+            target_user=target_user,
+            metadata=metadata or {},
+            ip_address=get_client_ip(request) if request else None,
+            created_at=timezone.now(),
+        )
     )
@@ -1,10 +1,10 @@
-from django.core.cache import cache
 from rest_framework import status
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from accounts.models import User
+from core.cache import cache_health
 
 
 class HealthCheckView(APIView):
@@ -17,11 +17,8 @@ class HealthCheckView(APIView):
         except Exception:
             db_status = "error"
 
-        try:
-            cache.set("healthcheck", "ok", timeout=5)
-            cache_status = "ok" if cache.get("healthcheck") == "ok" else "error"
-        except Exception:
-            cache_status = "error"
+        cache_report = cache_health()
+        cache_status = cache_report.pop("status")
 
         status_code = status.HTTP_200_OK if db_status == "ok" and cache_status == "ok" else status.HTTP_503_SERVICE_UNAVAILABLE
         return Response(
@@ -29,6 +26,7 @@ class HealthCheckView(APIView):
                 "status": "ok" if status_code == status.HTTP_200_OK else "error",
                 "db": db_status,
                 "cache": cache_status,
+                "cache_details": cache_report,
             },
             status=status_code,
         )
@@ -1,4 +1,6 @@
+import importlib.util
 import os
+import sys
 from datetime import timedelta
 from pathlib import Path
 
@@ -32,6 +34,7 @@ INSTALLED_APPS = [
     "profiles",
     "moderation",
     "audit",
+    "activity",
     "rest_framework",
     "corsheaders",
     "django_filters",
@@ -132,6 +135,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "audit.middleware.AuditLogBufferMiddleware",
 ]
 
 ROOT_URLCONF = "backend.urls"
@@ -184,15 +188,104 @@ CSRF_TRUSTED_ORIGINS = [
 ]
 
 REDIS_URL = os.environ.get("REDIS_URL", "redis://127.0.0.1:6379/1")
-CACHES = {
-    "default": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+TESTING = len(sys.argv) > 1 and sys.argv[1] == "test"
+
+# Cache tier shared by all workers. "redis" is the default whenever REDIS_URL is set;
+# tests use fakeredis when installed so Redis code paths run without a server.
+if TESTING:
+    _default_cache_backend = "fakeredis" if importlib.util.find_spec("fakeredis") else "locmem"
+else:
+    _default_cache_backend = "redis" if os.environ.get("REDIS_URL") else "locmem"
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", _default_cache_backend).strip().lower()
+CACHE_URL = os.getenv("CACHE_URL", REDIS_URL)
+CACHE_KEY_PREFIX = os.getenv("CACHE_KEY_PREFIX", "niat")
+
+if CACHE_BACKEND in ("redis", "fakeredis"):
+    _cache_options = {
+        "socket_connect_timeout": float(os.getenv("CACHE_SOCKET_CONNECT_TIMEOUT", "1")),
+        "socket_timeout": float(os.getenv("CACHE_SOCKET_TIMEOUT", "1")),
+    }
+    if CACHE_BACKEND == "fakeredis":
+        import fakeredis
+
+        _cache_options = {"connection_class": fakeredis.FakeConnection}
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": CACHE_URL,
+            "KEY_PREFIX": CACHE_KEY_PREFIX,
+            "OPTIONS": _cache_options,
+        }
+    }
+elif CACHE_BACKEND == "dummy":
+    CACHES = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "KEY_PREFIX": CACHE_KEY_PREFIX,
+        }
     }
-}
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", REDIS_URL)
 CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND", REDIS_URL)
 CELERY_TASK_ALWAYS_EAGER = os.getenv("CELERY_TASK_ALWAYS_EAGER", "False").lower() in ("1", "true", "yes")
 
+# View counters are buffered in Redis and written back by core.tasks.flush_counters;
+# with any other cache backend they are written through.
+COUNTER_BUFFERING = os.getenv("COUNTER_BUFFERING", "True").lower() in ("1", "true", "yes")
+COUNTER_FLUSH_INTERVAL = int(os.getenv("COUNTER_FLUSH_INTERVAL", 30))
+CELERY_BEAT_SCHEDULE = {
+    "flush-counters": {
+        "task": "core.tasks.flush_counters",
+        "schedule": COUNTER_FLUSH_INTERVAL,
+    },
+    "drain-email-outbox": {
+        "task": "notifications.tasks.drain_email_outbox",
+        "schedule": int(os.getenv("EMAIL_OUTBOX_INTERVAL", 30)),
+    },
+    "flush-engagement-events": {
+        "task": "activity.tasks.flush_engagement_events",
+        "schedule": int(os.getenv("ENGAGEMENT_FLUSH_INTERVAL", 30)),
+    },
+    "rollup-engagement": {
+        "task": "activity.tasks.rollup_engagement",
+        "schedule": int(os.getenv("ENGAGEMENT_ROLLUP_INTERVAL", 60 * 60)),
+    },
+    "apply-retention": {
+        "task": "core.tasks.apply_retention",
+        "schedule": int(os.getenv("RETENTION_INTERVAL", 24 * 60 * 60)),
+    },
+}
+# Engagement events (activity.ingest) are buffered in Redis and bulk-inserted by beat;
+# with any other cache backend each batch is inserted by a Celery task.
+ENGAGEMENT_BUFFERING = os.getenv("ENGAGEMENT_BUFFERING", "True").lower() in ("1", "true", "yes")
+# Transactional email outbox (notifications.outbox).
+EMAIL_OUTBOX_BATCH_SIZE = int(os.getenv("EMAIL_OUTBOX_BATCH_SIZE", 100))
+EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.getenv("EMAIL_OUTBOX_MAX_ATTEMPTS", 5))
+# How long a drain owns the rows it claimed; must exceed the time to send one batch.
+EMAIL_OUTBOX_LEASE_SECONDS = int(os.getenv("EMAIL_OUTBOX_LEASE_SECONDS", 10 * 60))
+
+# Audit log writes (audit.buffer): "buffered" writes each request's entries with one
+# INSERT after commit, "queue" hands them to Celery, "sync" inserts each entry at once.
+AUDIT_LOG_MODE = os.getenv("AUDIT_LOG_MODE", "sync" if TESTING else "buffered").strip().lower()
+
+# Retention for append-only tables (core.retention). Overrides merge into the defaults,
+# e.g. RETENTION_POLICIES = {"audit.AuditLog": {"days": 730}}.
+RETENTION_POLICIES = {}
+RETENTION_BATCH_SIZE = int(os.getenv("RETENTION_BATCH_SIZE", 5000))
+RETENTION_ARCHIVE_DIR = os.getenv("RETENTION_ARCHIVE_DIR", str(BASE_DIR / "archive"))
+
+# Materialized follower answer feed (qa.feed). Seniors with more followers than
+# ANSWER_FEED_PULL_THRESHOLD are not fanned out; their answers are merged in at read time.
+ANSWER_FEED_FANOUT = os.getenv("ANSWER_FEED_FANOUT", "False").lower() in ("1", "true", "yes")
+ANSWER_FEED_PULL_THRESHOLD = int(os.getenv("ANSWER_FEED_PULL_THRESHOLD", 5000))
+ANSWER_FEED_BACKFILL_LIMIT = int(os.getenv("ANSWER_FEED_BACKFILL_LIMIT", 200))
+
+# Next.js revalidation (articles.revalidation): paths are collected for
+# REVALIDATION_WINDOW seconds and sent from a background thread.
+REVALIDATION_ASYNC = os.getenv("REVALIDATION_ASYNC", "True").lower() in ("1", "true", "yes")
+REVALIDATION_WINDOW = float(os.getenv("REVALIDATION_WINDOW", 1.0))
+
 EMAIL_BACKEND = os.getenv("EMAIL_BACKEND", "django.core.mail.backends.smtp.EmailBackend")
 EMAIL_HOST = os.getenv("EMAIL_HOST")
 EMAIL_PORT = int(os.getenv("EMAIL_PORT", 587))
@@ -210,6 +303,12 @@ MAIN_APP_URL = os.getenv("MAIN_APP_URL", "http://localhost:3000")
 GROQ_API_KEY = os.getenv("GROQ_API_KEY", "")
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
+# core.llm: "live", "fake" (offline), "record" or "replay" (LLM_RECORDING_PATH).
+LLM_BACKEND = os.getenv("LLM_BACKEND", "live")
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", 60))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", 2))
+LLM_RECORDING_PATH = os.getenv("LLM_RECORDING_PATH", str(BASE_DIR / "llm_recording.jsonl"))
+LLM_FAKE_LATENCY = float(os.getenv("LLM_FAKE_LATENCY", 0))
 
 REFRESH_TOKEN_COOKIE_NAME = "refresh_token"
 REFRESH_TOKEN_COOKIE_SECURE = True
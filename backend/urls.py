@@ -64,6 +64,7 @@ urlpatterns = [
     path("api/articles/", include("articles.urls")),
     path("api/campuses/", include("campuses.urls")),
     path("api/profiles/", include("profiles.urls")),
+    path("api/activity/", include("activity.urls")),
 ]
 
 if settings.DEBUG:
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:05
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_counts(apps, schema_editor):
+    Article = apps.get_model("articles", "Article")
+    Campus = apps.get_model("campuses", "Campus")
+    counts = (
+        Article.objects.filter(status="published", campus_id__isnull=False)
+        .values_list("campus_id_id")
+        .annotate(total=Count("pk"))
+        .order_by()
+    )
+    for campus_id, total in counts:
+        Campus.objects.filter(pk=campus_id).update(published_article_count=total)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("campuses", "0006_campus_google_map_link_and_description"),
+        ("articles", "0039_club_published_article_count"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="campus",
+            name="published_article_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name="campus",
+            index=models.Index(fields=["-published_article_count", "name"], name="campus_article_count_idx"),
+        ),
+        migrations.RunPython(backfill_counts, migrations.RunPython.noop),
+    ]
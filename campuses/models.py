@@ -19,12 +19,17 @@ class Campus(models.Model):
     description = models.TextField(blank=True, default="")
     slug = models.SlugField(max_length=120, unique=True)
     is_deemed = models.BooleanField(default=False)
+    # Published articles for this campus; maintained by articles.article_counts.
+    published_article_count = models.IntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = "campuses"
         ordering = ["name"]
+        indexes = [
+            models.Index(fields=["-published_article_count", "name"], name="campus_article_count_idx"),
+        ]
         verbose_name_plural = "Campuses"
 
     def __str__(self):
@@ -1,4 +1,3 @@
-from django.db.models import Count
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework import status
@@ -6,10 +5,10 @@ from .models import Campus
 from .serializers import CampusSerializer
 
 class CampusListView(APIView):
-    """GET /api/campuses/ — list all campuses ordered by article count descending."""
+    """GET /api/campuses/ — list all campuses ordered by published article count descending."""
 
     def get(self, request):
-        qs = Campus.objects.annotate(article_count=Count('articles')).order_by('-article_count', 'name')
+        qs = Campus.objects.order_by('-published_article_count', 'name')
         serializer = CampusSerializer(qs, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -18,7 +17,7 @@ class CampusDetailView(APIView):
 
     def get(self, request, slug):
         try:
-            campus = Campus.objects.annotate(article_count=Count('articles')).get(slug=slug)
+            campus = Campus.objects.get(slug=slug)
             serializer = CampusSerializer(campus)
             return Response(serializer.data, status=status.HTTP_200_OK)
         except Campus.DoesNotExist:
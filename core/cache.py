@@ -0,0 +1,93 @@
+"""
+Shared cache helpers.
+
+All workers share one cache (Redis in production), so every app reads and writes
+through its own namespace (e.g. "qa:classifier:<hash>") to keep keys from colliding.
+"""
+import time
+
+from django.core.cache import caches
+
+
+class NamespacedCache:
+    """Thin wrapper over a Django cache alias that prefixes every key with an app namespace."""
+
+    def __init__(self, namespace, alias="default"):
+        self.namespace = namespace
+        self.alias = alias
+
+    @property
+    def backend(self):
+        return caches[self.alias]
+
+    def key(self, *parts):
+        return ":".join([self.namespace, *(str(part) for part in parts)])
+
+    def get(self, key, default=None):
+        return self.backend.get(self.key(key), default)
+
+    def set(self, key, value, timeout=None):
+        self.backend.set(self.key(key), value, timeout)
+
+    def add(self, key, value, timeout=None):
+        return self.backend.add(self.key(key), value, timeout)
+
+    def delete(self, key):
+        return self.backend.delete(self.key(key))
+
+    def get_many(self, keys):
+        prefixed = {self.key(k): k for k in keys}
+        found = self.backend.get_many(list(prefixed))
+        return {prefixed[k]: v for k, v in found.items()}
+
+    def incr(self, key, timeout):
+        """
+        Atomically increment a counter, creating it with `timeout` on first use.
+        Returns the new value. Safe across workers when the backend is Redis.
+        """
+        full_key = self.key(key)
+        if self.backend.add(full_key, 1, timeout):
+            return 1
+        try:
+            return self.backend.incr(full_key)
+        except ValueError:
+            # Expired between add() and incr(); start a fresh window.
+            self.backend.set(full_key, 1, timeout)
+            return 1
+
+
+def cache_backend_name(alias="default"):
+    backend = caches[alias]
+    return f"{type(backend).__module__}.{type(backend).__name__}"
+
+
+def cache_health(alias="default"):
+    """
+    Round-trip a key through the cache and report status, latency and, for Redis,
+    server-wide hit/miss counters.
+    """
+    backend = caches[alias]
+    report = {"backend": cache_backend_name(alias)}
+    key = "core:healthcheck"
+    try:
+        started = time.perf_counter()
+        backend.set(key, "ok", timeout=5)
+        ok = backend.get(key) == "ok"
+        report["latency_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        report["status"] = "ok" if ok else "error"
+    except Exception:
+        report["status"] = "error"
+        return report
+
+    client_factory = getattr(getattr(backend, "_cache", None), "get_client", None)
+    if client_factory is not None:
+        try:
+            stats = client_factory(key).info("stats")
+            hits = int(stats.get("keyspace_hits", 0))
+            misses = int(stats.get("keyspace_misses", 0))
+            report["hits"] = hits
+            report["misses"] = misses
+            report["hit_rate"] = round(hits / (hits + misses), 4) if hits + misses else None
+        except Exception:
+            pass
+    return report
@@ -0,0 +1,125 @@
+"""
+Write-behind counters.
+
+Hot counters (page views) are incremented in the shared cache instead of the
+database; flush_counter_buffers (Celery beat, or `manage.py flush_counters`)
+applies the accumulated deltas as a few batched UPDATEs. The pending deltas live
+in one Redis hash per counter, so increments are atomic across workers. Buffering
+needs Redis: any other cache is per-process (locmem) or discards writes (dummy),
+where the flush task would never see the deltas, so increments are written
+through with an F() UPDATE instead.
+"""
+import logging
+from collections import defaultdict
+
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+
+from .cache import NamespacedCache
+
+logger = logging.getLogger("core.counters")
+
+FLUSH_BATCH_SIZE = 500
+FLUSH_LOCK_TIMEOUT = 5 * 60
+
+counter_cache = NamespacedCache("counters")
+
+
+class CounterBuffer:
+    """Buffered `model.field += n` keyed by primary key."""
+
+    def __init__(self, model_label, field):
+        self.model_label = model_label
+        self.field = field
+        self.name = f"{model_label.lower()}:{field}"
+
+    @property
+    def model(self):
+        return apps.get_model(self.model_label)
+
+    def _redis(self):
+        """(client, pending_key, flushing_key) when the cache is Redis, else None."""
+        backend = counter_cache.backend
+        client_factory = getattr(getattr(backend, "_cache", None), "get_client", None)
+        if client_factory is None:
+            return None
+        pending = backend.make_and_validate_key(counter_cache.key(self.name, "pending"))
+        flushing = backend.make_and_validate_key(counter_cache.key(self.name, "flushing"))
+        return client_factory(pending, write=True), pending, flushing
+
+    def incr(self, pk, amount=1):
+        """
+        Record `amount` against `pk`; returns what callers add to the value they
+        loaded to show the current count (the pending delta, or `amount` when
+        written through).
+        """
+        redis = self._redis() if getattr(settings, "COUNTER_BUFFERING", True) else None
+        if redis is None:
+            self.model.objects.filter(pk=pk).update(**{self.field: F(self.field) + amount})
+            return amount
+        client, pending, _ = redis
+        return int(client.hincrby(pending, str(pk), amount))
+
+    def _take_pending(self):
+        redis = self._redis()
+        if redis is None:
+            return {}, lambda: None
+        client, pending, flushing = redis
+        # A leftover "flushing" hash means the previous flush died before applying it;
+        # apply that first instead of overwriting it.
+        # Only increments touch "pending" and only the lock holder moves it, so
+        # exists-then-rename cannot race.
+        if not client.exists(flushing):
+            if not client.exists(pending):
+                return {}, lambda: None
+            client.rename(pending, flushing)
+        deltas = {
+            key.decode() if isinstance(key, bytes) else key: int(value)
+            for key, value in client.hgetall(flushing).items()
+        }
+        return deltas, lambda: client.delete(flushing)
+
+    def _apply(self, deltas):
+        by_amount = defaultdict(list)
+        for pk, amount in deltas.items():
+            if amount:
+                by_amount[amount].append(pk)
+        model = self.model
+        pk_field = model._meta.pk
+        with transaction.atomic():
+            for amount, pks in by_amount.items():
+                for start in range(0, len(pks), FLUSH_BATCH_SIZE):
+                    chunk = [pk_field.to_python(pk) for pk in pks[start:start + FLUSH_BATCH_SIZE]]
+                    model.objects.filter(pk__in=chunk).update(**{self.field: F(self.field) + amount})
+
+    def flush(self):
+        """Write pending deltas to the database; returns the number of rows touched."""
+        lock_key = f"{self.name}:lock"
+        if not counter_cache.add(lock_key, 1, FLUSH_LOCK_TIMEOUT):
+            return 0
+        try:
+            deltas, done = self._take_pending()
+            if not deltas:
+                return 0
+            # On failure the "flushing" hash is left in place and applied by the next flush.
+            self._apply(deltas)
+            done()
+            return len(deltas)
+        finally:
+            counter_cache.delete(lock_key)
+
+
+article_views = CounterBuffer("articles.Article", "view_count")
+question_views = CounterBuffer("qa.Question", "view_count")
+
+COUNTER_BUFFERS = (article_views, question_views)
+
+
+def flush_counter_buffers():
+    flushed = {}
+    for buffer in COUNTER_BUFFERS:
+        flushed[buffer.name] = buffer.flush()
+    logger.info("Flushed counter buffers", extra={"flushed": flushed})
+    return flushed
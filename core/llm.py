@@ -0,0 +1,359 @@
+"""
+Shared LLM clients.
+
+get_llm(name) returns one long-lived provider per backend ("gemini", "groq",
+"anthropic"), so SDK clients and their HTTP connection pools are reused across
+calls and threads. Every call has a timeout (LLM_TIMEOUT) and is retried with
+exponential backoff on rate limits, timeouts, connection errors and 5xx
+responses (LLM_MAX_RETRIES).
+
+LLM_BACKEND selects what get_llm() returns:
+  "live"    the vendor SDKs (default)
+  "fake"    FakeLLM: deterministic offline responses, optionally delayed by
+            LLM_FAKE_LATENCY seconds to benchmark pipeline throughput
+  "record"  live calls, each appended to LLM_RECORDING_PATH as a JSON line
+  "replay"  FakeLLM answering from LLM_RECORDING_PATH
+Modules that parse a structured response register a fake responder for their
+backend (register_fake_responder) so the fake backend returns something they
+accept.
+"""
+import hashlib
+import json
+import logging
+import random
+import threading
+import time
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+logger = logging.getLogger("core.llm")
+
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504, 529})
+
+
+def request_key(name, model, system, prompt):
+    """Stable identity of one completion request, used by recordings and fakes."""
+    raw = json.dumps([name, model, system or "", prompt], ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class LLMProvider:
+    """Base provider: lazily built shared client, per-call timeout and retries."""
+
+    name = ""
+    default_model = ""
+    api_key_setting = ""
+
+    def __init__(self, api_key=None, timeout=None, max_retries=None, backoff=1.0):
+        self.api_key = api_key if api_key is not None else getattr(settings, self.api_key_setting, None) or ""
+        self.timeout = timeout if timeout is not None else getattr(settings, "LLM_TIMEOUT", 60)
+        self.max_retries = max_retries if max_retries is not None else getattr(settings, "LLM_MAX_RETRIES", 2)
+        self.backoff = backoff
+        self._client = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_configured(self):
+        return bool(self.api_key)
+
+    @property
+    def client(self):
+        with self._lock:
+            if self._client is None:
+                self._client = self._make_client()
+            return self._client
+
+    def _make_client(self):
+        raise NotImplementedError
+
+    def _complete(self, prompt, *, system, model, temperature, max_tokens):
+        raise NotImplementedError
+
+    def _connection_errors(self):
+        """SDK exception classes for network failures and timeouts."""
+        return ()
+
+    def is_retryable(self, exc):
+        try:
+            connection_errors = self._connection_errors()
+        except ImportError:
+            connection_errors = ()
+        if isinstance(exc, (TimeoutError, ConnectionError, *connection_errors)):
+            return True
+        status = getattr(exc, "status_code", None) or getattr(exc, "code", None)
+        return status in RETRYABLE_STATUS_CODES
+
+    def complete(self, prompt, *, system=None, model=None, temperature=None, max_tokens=None):
+        """Return the model's text response to `prompt`; raises the SDK error once retries are exhausted."""
+        model = model or self.default_model
+        attempt = 0
+        while True:
+            started = time.monotonic()
+            try:
+                text = self._complete(
+                    prompt, system=system, model=model, temperature=temperature, max_tokens=max_tokens
+                )
+            except Exception as exc:
+                if attempt >= self.max_retries or not self.is_retryable(exc):
+                    raise
+                delay = self.backoff * 2 ** attempt * (1 + random.random() / 4)
+                logger.warning(
+                    "LLM call failed, retrying in %.1fs: %s",
+                    delay,
+                    exc,
+                    extra={"provider": self.name, "model": model, "attempt": attempt + 1},
+                )
+                time.sleep(delay)
+                attempt += 1
+                continue
+            logger.info(
+                "LLM call complete",
+                extra={
+                    "provider": self.name,
+                    "model": model,
+                    "attempts": attempt + 1,
+                    "latency_s": round(time.monotonic() - started, 3),
+                },
+            )
+            return text
+
+
+class GeminiProvider(LLMProvider):
+    name = "gemini"
+    default_model = "gemini-2.5-pro"
+    api_key_setting = "GEMINI_API_KEY"
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._models = {}
+
+    def _make_client(self):
+        import google.generativeai as genai
+
+        genai.configure(api_key=self.api_key)
+        return genai
+
+    def _model(self, model, system):
+        key = (model, system)
+        if key not in self._models:
+            self._models[key] = self.client.GenerativeModel(model_name=model, system_instruction=system)
+        return self._models[key]
+
+    def _connection_errors(self):
+        from google.api_core import exceptions
+
+        return (exceptions.DeadlineExceeded, exceptions.ServiceUnavailable, exceptions.ResourceExhausted)
+
+    def _complete(self, prompt, *, system, model, temperature, max_tokens):
+        config = {}
+        if temperature is not None:
+            config["temperature"] = temperature
+        if max_tokens is not None:
+            config["max_output_tokens"] = max_tokens
+        response = self._model(model, system).generate_content(
+            prompt, generation_config=config or None, request_options={"timeout": self.timeout}
+        )
+        return response.text
+
+
+class GroqProvider(LLMProvider):
+    name = "groq"
+    default_model = "llama-3.1-8b-instant"
+    api_key_setting = "GROQ_API_KEY"
+
+    def _make_client(self):
+        from groq import Groq
+
+        # Retries are handled by complete(); the SDK's own would multiply them.
+        return Groq(api_key=self.api_key, timeout=self.timeout, max_retries=0)
+
+    def _connection_errors(self):
+        import groq
+
+        return (groq.APIConnectionError,)
+
+    def _complete(self, prompt, *, system, model, temperature, max_tokens):
+        messages = [{"role": "system", "content": system}] if system else []
+        messages.append({"role": "user", "content": prompt})
+        options = {}
+        if temperature is not None:
+            options["temperature"] = temperature
+        if max_tokens is not None:
+            options["max_tokens"] = max_tokens
+        response = self.client.chat.completions.create(model=model, messages=messages, **options)
+        return response.choices[0].message.content or ""
+
+
+class AnthropicProvider(LLMProvider):
+    name = "anthropic"
+    default_model = "claude-haiku-4-5-20251001"
+    api_key_setting = "ANTHROPIC_API_KEY"
+
+    def _make_client(self):
+        import anthropic
+
+        return anthropic.Anthropic(api_key=self.api_key, timeout=self.timeout, max_retries=0)
+
+    def _connection_errors(self):
+        import anthropic
+
+        return (anthropic.APIConnectionError,)
+
+    def _complete(self, prompt, *, system, model, temperature, max_tokens):
+        options = {}
+        if system:
+            options["system"] = system
+        if temperature is not None:
+            options["temperature"] = temperature
+        message = self.client.messages.create(
+            model=model,
+            max_tokens=max_tokens or 1024,
+            messages=[{"role": "user", "content": prompt}],
+            **options,
+        )
+        return "".join(getattr(block, "text", "") for block in message.content)
+
+
+_fake_responders = {}
+
+
+def register_fake_responder(name, system=None):
+    """
+    Decorator: `func(prompt, system, model) -> str` answers `name` requests on the
+    fake backend; with `system`, only requests using that system prompt.
+    """
+
+    def decorator(func):
+        _fake_responders[(name, system)] = func
+        return func
+
+    return decorator
+
+
+class FakeLLM(LLMProvider):
+    """
+    Deterministic offline provider. Answers from `responses` (request_key -> text),
+    then `responder`, then the responder registered for `name`, else "{}".
+    Every request is kept in `calls`.
+    """
+
+    def __init__(self, name, responder=None, responses=None, latency=0.0, strict=False):
+        super().__init__(api_key="", timeout=0, max_retries=0)
+        self.name = name
+        # Same default as the provider it stands in for, so recorded requests replay under the same key.
+        self.default_model = PROVIDERS[name].default_model if name in PROVIDERS else ""
+        self.responder = responder
+        self.responses = dict(responses or {})
+        self.latency = latency
+        self.strict = strict
+        self.calls = []
+
+    @classmethod
+    def from_recording(cls, name, path, **kwargs):
+        responses = {}
+        with open(path, encoding="utf-8") as recording:
+            for line in recording:
+                entry = json.loads(line)
+                if entry["provider"] == name:
+                    responses[entry["key"]] = entry["response"]
+        return cls(name, responses=responses, strict=True, **kwargs)
+
+    @property
+    def is_configured(self):
+        return True
+
+    def _make_client(self):
+        return None
+
+    def _complete(self, prompt, *, system, model, temperature, max_tokens):
+        with self._lock:
+            self.calls.append({"prompt": prompt, "system": system, "model": model})
+        if self.latency:
+            time.sleep(self.latency)
+        key = request_key(self.name, model, system, prompt)
+        if key in self.responses:
+            return self.responses[key]
+        if self.strict:
+            raise LookupError(f"No recorded {self.name} response for request {key[:12]}")
+        responder = (
+            self.responder
+            or _fake_responders.get((self.name, system or None))
+            or _fake_responders.get((self.name, None))
+        )
+        if responder is not None:
+            return responder(prompt, system=system, model=model)
+        return "{}"
+
+
+class RecordingLLM:
+    """Wraps a live provider and appends every request/response pair to `path` for replay."""
+
+    def __init__(self, provider, path):
+        self.provider = provider
+        self.path = path
+        self._lock = threading.Lock()
+
+    @property
+    def name(self):
+        return self.provider.name
+
+    @property
+    def is_configured(self):
+        return self.provider.is_configured
+
+    def complete(self, prompt, *, system=None, model=None, **options):
+        model = model or self.provider.default_model
+        text = self.provider.complete(prompt, system=system, model=model, **options)
+        entry = {
+            "provider": self.name,
+            "key": request_key(self.name, model, system, prompt),
+            "model": model,
+            "response": text,
+        }
+        with self._lock, open(self.path, "a", encoding="utf-8") as recording:
+            recording.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        return text
+
+
+PROVIDERS = {
+    GeminiProvider.name: GeminiProvider,
+    GroqProvider.name: GroqProvider,
+    AnthropicProvider.name: AnthropicProvider,
+}
+
+_providers = {}
+_providers_lock = threading.Lock()
+
+
+def _build(name):
+    backend = getattr(settings, "LLM_BACKEND", "live")
+    recording = getattr(settings, "LLM_RECORDING_PATH", "llm_recording.jsonl")
+    if backend == "fake":
+        return FakeLLM(name, latency=getattr(settings, "LLM_FAKE_LATENCY", 0.0))
+    if backend == "replay":
+        return FakeLLM.from_recording(name, recording, latency=getattr(settings, "LLM_FAKE_LATENCY", 0.0))
+    provider = PROVIDERS[name]()
+    if backend == "record":
+        return RecordingLLM(provider, recording)
+    return provider
+
+
+def get_llm(name):
+    """Shared provider for `name` ("gemini", "groq" or "anthropic") on the configured LLM_BACKEND."""
+    with _providers_lock:
+        if name not in _providers:
+            _providers[name] = _build(name)
+        return _providers[name]
+
+
+def reset_llms():
+    with _providers_lock:
+        _providers.clear()
+
+
+@receiver(setting_changed)
+def _reset_on_setting_change(setting, **kwargs):
+    if setting.startswith("LLM_") or setting.endswith("_API_KEY"):
+        reset_llms()
@@ -0,0 +1,39 @@
+"""
+Archive and delete rows older than their retention window, in bounded batches.
+Usage:
+  python manage.py apply_retention
+  python manage.py apply_retention --model audit.AuditLog --batch-size 1000 --pause 0.5
+  python manage.py apply_retention --dry-run
+"""
+from django.core.management.base import BaseCommand
+
+from core.retention import apply_retention_policies, policies
+
+
+class Command(BaseCommand):
+    help = "Apply RETENTION_POLICIES to append-only tables (audit log, notifications, engagement log)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            action="append",
+            dest="labels",
+            choices=sorted(policies()),
+            help="Only this model label (repeatable).",
+        )
+        parser.add_argument("--batch-size", type=int, default=None, help="Rows per batch (default: RETENTION_BATCH_SIZE).")
+        parser.add_argument("--max-batches", type=int, default=None, help="Stop after this many batches per model.")
+        parser.add_argument("--pause", type=float, default=0.0, help="Seconds to sleep between batches.")
+        parser.add_argument("--dry-run", action="store_true", help="Only count the expired rows.")
+
+    def handle(self, *args, **options):
+        results = apply_retention_policies(
+            labels=options["labels"],
+            batch_size=options["batch_size"],
+            max_batches=options["max_batches"],
+            pause=options["pause"],
+            dry_run=options["dry_run"],
+        )
+        verb = "would remove" if options["dry_run"] else "removed"
+        for label, count in results.items():
+            self.stdout.write(self.style.SUCCESS(f"{label}: {verb} {count} row(s)."))
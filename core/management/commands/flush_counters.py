@@ -0,0 +1,15 @@
+"""
+Write buffered view counters (articles, questions) to the database.
+Usage: python manage.py flush_counters
+"""
+from django.core.management.base import BaseCommand
+
+from core.counters import flush_counter_buffers
+
+
+class Command(BaseCommand):
+    help = "Flush write-behind view counters to the database"
+
+    def handle(self, *args, **options):
+        for name, rows in flush_counter_buffers().items():
+            self.stdout.write(self.style.SUCCESS(f"{name}: flushed {rows} row(s)."))
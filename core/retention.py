@@ -0,0 +1,97 @@
+"""
+Retention for append-only tables.
+
+RETENTION_POLICIES maps a model label to how many days of rows it keeps and
+whether expired rows are archived first. purge_expired() removes expired rows in
+batches of RETENTION_BATCH_SIZE, oldest first, each batch in its own short
+transaction, so no single statement locks or bloats the table the way one large
+`DELETE ... WHERE created_at < cutoff` does. Archived batches are written as
+gzipped JSON lines under RETENTION_ARCHIVE_DIR (one file per batch, written
+before the rows are deleted) and can be reloaded with loaddata-style tooling or
+queried offline. Run it with `manage.py apply_retention` or the daily beat task.
+Policies for apps that are not installed are skipped.
+"""
+import gzip
+import json
+import logging
+import time
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+
+logger = logging.getLogger("core.retention")
+
+DEFAULT_POLICIES = {
+    "audit.AuditLog": {"days": 365, "archive": True},
+    "notifications.Notification": {"days": 90, "archive": False},
+    "activity.EngagementLog": {"days": 90, "archive": True},
+}
+
+
+def policies():
+    """{model label: {"days": int, "archive": bool}} with RETENTION_POLICIES applied over the defaults."""
+    merged = {label: dict(policy) for label, policy in DEFAULT_POLICIES.items()}
+    for label, policy in getattr(settings, "RETENTION_POLICIES", {}).items():
+        merged.setdefault(label, {"archive": False}).update(policy)
+    return merged
+
+
+def archive_storage():
+    return FileSystemStorage(location=getattr(settings, "RETENTION_ARCHIVE_DIR", settings.BASE_DIR / "archive"))
+
+
+def _archive(model, rows, now):
+    lines = "".join(json.dumps(row, cls=DjangoJSONEncoder) + "\n" for row in rows)
+    name = f"{model._meta.db_table}/{now:%Y/%m/%d}/{rows[0]['created_at']:%Y%m%dT%H%M%S}-{len(rows)}.jsonl.gz"
+    return archive_storage().save(name, ContentFile(gzip.compress(lines.encode("utf-8"))))
+
+
+def purge_expired(model, days, archive=False, batch_size=None, max_batches=None, pause=0.0, dry_run=False):
+    """
+    Delete (and optionally archive) rows of `model` whose created_at is older than
+    `days`; returns the number of rows removed, or that would be removed on a dry run.
+    """
+    batch_size = batch_size or getattr(settings, "RETENTION_BATCH_SIZE", 5000)
+    now = timezone.now()
+    expired = model.objects.filter(created_at__lt=now - timedelta(days=days))
+    if dry_run:
+        return expired.count()
+
+    removed = batches = 0
+    while max_batches is None or batches < max_batches:
+        with transaction.atomic():
+            pks = list(expired.order_by("created_at", "pk").values_list("pk", flat=True)[:batch_size])
+            if not pks:
+                break
+            if archive:
+                _archive(model, list(model.objects.filter(pk__in=pks).order_by("created_at", "pk").values()), now)
+            removed += model.objects.filter(pk__in=pks).delete()[1].get(model._meta.label, 0)
+        batches += 1
+        if len(pks) < batch_size:
+            break
+        if pause:
+            # Give replicas and autovacuum room between batches on large backlogs.
+            time.sleep(pause)
+    if removed:
+        logger.info("Purged expired rows", extra={"model": model._meta.label, "removed": removed, "days": days})
+    return removed
+
+
+def apply_retention_policies(labels=None, **options):
+    """Run purge_expired for every policy (or only `labels`); returns {label: rows removed}."""
+    results = {}
+    for label, policy in policies().items():
+        if labels and label not in labels:
+            continue
+        try:
+            model = apps.get_model(label)
+        except LookupError:
+            continue
+        results[label] = purge_expired(model, policy["days"], archive=policy.get("archive", False), **options)
+    return results
@@ -0,0 +1,30 @@
+import logging
+
+from celery import shared_task
+
+from .counters import flush_counter_buffers
+from .retention import apply_retention_policies
+
+logger = logging.getLogger("core.tasks")
+
+
+@shared_task
+def flush_counters():
+    """Beat task: write buffered view counters to the database."""
+    try:
+        return flush_counter_buffers()
+    except Exception:
+        # Deltas stay buffered and are retried on the next beat tick.
+        logger.exception("flush_counters.failure")
+        raise
+
+
+@shared_task
+def apply_retention():
+    """Beat task: archive and delete rows past their RETENTION_POLICIES window."""
+    try:
+        return apply_retention_policies()
+    except Exception:
+        # Whatever was not purged is picked up by the next run.
+        logger.exception("apply_retention.failure")
+        raise
@@ -0,0 +1,32 @@
+"""Tests for the shared cache helpers."""
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from core.cache import NamespacedCache
+
+
+class NamespacedCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_namespaces_do_not_collide(self):
+        qa_cache = NamespacedCache("qa")
+        accounts_cache = NamespacedCache("accounts")
+        qa_cache.set("key", "qa-value")
+        accounts_cache.set("key", "accounts-value")
+        self.assertEqual(qa_cache.get("key"), "qa-value")
+        self.assertEqual(accounts_cache.get("key"), "accounts-value")
+
+    def test_incr_counts_from_one(self):
+        counters = NamespacedCache("test")
+        self.assertEqual([counters.incr("hits", timeout=60) for _ in range(3)], [1, 2, 3])
+
+
+class HealthCheckTests(TestCase):
+    def test_reports_cache_backend(self):
+        response = APIClient().get("/health/")
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body["cache"], "ok")
+        self.assertIn("backend", body["cache_details"])
@@ -0,0 +1,84 @@
+"""Write-behind view counters for articles and questions."""
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from articles.models import Article
+from core.counters import article_views, flush_counter_buffers, question_views
+from qa.models import Question
+
+
+class CounterBufferTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.buffered = article_views._redis() is not None
+        self.client = APIClient()
+        self.author = User.objects.create(username="writer", email="writer@example.com")
+
+    def _article(self, title, status="published"):
+        return Article.objects.create(
+            author_id=self.author,
+            author_username=self.author.username,
+            category="onboarding-kit",
+            title=title,
+            excerpt="Excerpt",
+            body="Body",
+            status=status,
+        )
+
+    def test_article_views_are_buffered_until_flush(self):
+        if not self.buffered:
+            self.skipTest("write-behind buffering needs the Redis cache")
+        article = self._article("Hostel guide")
+        url = f"/api/articles/articles/{article.slug}/view/"
+        self.client.post(url)
+        with self.assertNumQueries(0):
+            for _ in range(4):
+                self.assertEqual(self.client.post(url).status_code, 200)
+        article.refresh_from_db()
+        self.assertEqual(article.view_count, 0)
+
+        flush_counter_buffers()
+        article.refresh_from_db()
+        self.assertEqual(article.view_count, 5)
+        self.assertEqual(flush_counter_buffers()[article_views.name], 0)
+
+    def test_anonymous_views_of_drafts_are_rejected(self):
+        draft = self._article("Draft", status="draft")
+        self.assertEqual(self.client.post(f"/api/articles/articles/{draft.slug}/view/").status_code, 404)
+
+    def test_views_are_written_through_without_redis(self):
+        if self.buffered:
+            self.skipTest("the cache is Redis")
+        article = self._article("Hostel guide")
+        self.assertEqual(self.client.post(f"/api/articles/articles/{article.slug}/view/").status_code, 200)
+        article.refresh_from_db()
+        self.assertEqual(article.view_count, 1)
+        self.assertEqual(flush_counter_buffers()[article_views.name], 0)
+
+    def test_flush_batches_updates_by_delta(self):
+        if not self.buffered:
+            self.skipTest("write-behind buffering needs the Redis cache")
+        articles = [self._article(f"Article {i}") for i in range(6)]
+        for article in articles[:3]:
+            article_views.incr(article.pk)
+        for article in articles[3:]:
+            article_views.incr(article.pk, 2)
+        with CaptureQueriesContext(connection) as queries:
+            article_views.flush()
+        updates = [q for q in queries.captured_queries if q["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 2)
+        counts = sorted(Article.objects.values_list("view_count", flat=True))
+        self.assertEqual(counts, [1, 1, 1, 2, 2, 2])
+
+    def test_question_retrieve_counts_every_view(self):
+        question = Question.objects.create(author=self.author, title="Is there a gym?", slug="gym")
+        seen = [self.client.get(f"/api/questions/{question.slug}/").json()["view_count"] for _ in range(3)]
+        self.assertEqual(seen, [1, 2, 3])
+        question_views.flush()
+        question.refresh_from_db()
+        self.assertEqual(question.view_count, 3)
+        self.assertEqual(self.client.get(f"/api/questions/{question.slug}/").json()["view_count"], 4)
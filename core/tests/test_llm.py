@@ -0,0 +1,97 @@
+"""Shared LLM providers: retries, shared instances and the offline fake/record/replay backends."""
+import json
+import os
+import tempfile
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from core import llm
+from core.llm import FakeLLM, RecordingLLM, get_llm
+from qa.category_classifier import CategoryClassifier
+
+
+class FlakyLLM(FakeLLM):
+    def __init__(self, failures, **kwargs):
+        super().__init__("flaky", **kwargs)
+        self.failures = list(failures)
+
+    def _complete(self, prompt, **kwargs):
+        if self.failures:
+            raise self.failures.pop(0)
+        return super()._complete(prompt, **kwargs)
+
+
+class HTTPError(Exception):
+    def __init__(self, status_code):
+        super().__init__(status_code)
+        self.status_code = status_code
+
+
+@mock.patch("core.llm.time.sleep")
+class RetryTests(SimpleTestCase):
+    def test_retries_transient_errors_with_backoff(self, sleep):
+        provider = FlakyLLM([TimeoutError(), HTTPError(529)])
+        provider.max_retries = 2
+        with self.assertLogs("core.llm", "WARNING"):
+            self.assertEqual(provider.complete("hi"), "{}")
+        self.assertEqual(sleep.call_count, 2)
+        self.assertLess(sleep.call_args_list[0].args[0], sleep.call_args_list[1].args[0])
+
+    def test_gives_up_after_max_retries_or_on_client_errors(self, sleep):
+        provider = FlakyLLM([TimeoutError(), TimeoutError()])
+        provider.max_retries = 1
+        with self.assertRaises(TimeoutError), self.assertLogs("core.llm", "WARNING"):
+            provider.complete("hi")
+        provider = FlakyLLM([HTTPError(400)])
+        provider.max_retries = 3
+        with self.assertRaises(HTTPError):
+            provider.complete("hi")
+        self.assertEqual(sleep.call_count, 1)
+
+
+class BackendTests(SimpleTestCase):
+    @override_settings(LLM_BACKEND="fake")
+    def test_fake_backend_is_shared_and_uses_registered_responders(self):
+        self.assertIs(get_llm("groq"), get_llm("groq"))
+        cache.clear()
+        result = CategoryClassifier().classify("What is the hostel fee for a shared room?")
+        self.assertEqual(result["source"], "llm")
+        self.assertEqual(result["category"], "Hostel & Accommodation")
+
+    def test_record_then_replay(self):
+        fd, path = tempfile.mkstemp(suffix=".jsonl")
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        live = FakeLLM("anthropic", responder=lambda prompt, **kwargs: prompt.upper())
+        RecordingLLM(live, path).complete("hello", system="be brief", model="m")
+
+        replay = FakeLLM.from_recording("anthropic", path)
+        self.assertEqual(replay.complete("hello", system="be brief", model="m"), "HELLO")
+        with self.assertRaises(LookupError):
+            replay.complete("something else", model="m")
+
+    def test_replay_matches_recordings_made_without_a_model(self):
+        fd, path = tempfile.mkstemp(suffix=".jsonl")
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        live = llm.AnthropicProvider(api_key="key")
+        with mock.patch.object(llm.AnthropicProvider, "_complete", return_value="recorded"):
+            RecordingLLM(live, path).complete("hello")
+
+        self.assertEqual(FakeLLM.from_recording("anthropic", path).complete("hello"), "recorded")
+
+    @override_settings(LLM_BACKEND="fake")
+    def test_fake_responders_can_be_scoped_to_a_system_prompt(self):
+        from articles.management.commands.seo_optimize_articles import SEO_SYSTEM_PROMPT
+
+        prompt = "TITLE: Hostel life\n\nAVAILABLE KEYWORDS TO CHOOSE FROM:\n- niat\n- niat hyderabad\n\nRULES"
+        result = json.loads(get_llm("anthropic").complete(prompt, system=SEO_SYSTEM_PROMPT))
+        self.assertEqual((result["title"], result["meta_keywords"]), ("Hostel life", ["niat", "niat hyderabad"]))
+
+    def test_live_providers_reuse_one_client(self):
+        provider = llm.GroqProvider(api_key="key")
+        with mock.patch.object(llm.GroqProvider, "_make_client", return_value=object()) as make:
+            self.assertIs(provider.client, provider.client)
+        make.assert_called_once()
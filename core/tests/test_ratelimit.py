@@ -0,0 +1,29 @@
+"""Token bucket rate limiter."""
+from django.test import SimpleTestCase
+
+from core.ratelimit import TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TokenBucketTests(SimpleTestCase):
+    def test_burst_then_steady_rate(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, capacity=2, clock=clock, sleep=clock.sleep)
+        self.assertEqual([bucket.acquire() for _ in range(2)], [0.0, 0.0])
+        self.assertAlmostEqual(bucket.acquire(), 0.5)
+        self.assertAlmostEqual(clock.now, 0.5)
+
+    def test_zero_rate_is_unlimited(self):
+        bucket = TokenBucket(rate=0, sleep=lambda seconds: self.fail("should not wait"))
+        for _ in range(100):
+            bucket.acquire()
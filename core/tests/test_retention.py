@@ -0,0 +1,75 @@
+"""Chunked retention and archival (core.retention)."""
+import gzip
+import json
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from accounts.models import User
+from audit.models import ActionType, AuditLog
+from core.retention import purge_expired
+from notifications.models import Notification
+from notifications.services import cleanup_old_notifications
+
+
+class RetentionTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(username="member", email="member@example.com")
+        self.archive_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.archive_dir.cleanup)
+        override = override_settings(RETENTION_ARCHIVE_DIR=self.archive_dir.name)
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def _audit(self, age_days):
+        return AuditLog.objects.create(
+            actor=self.user,
+            action=ActionType.ROLE_CHANGED,
+            entity_type="User",
+            entity_id=str(self.user.pk),
+            created_at=timezone.now() - timedelta(days=age_days),
+        )
+
+    def test_purge_archives_then_deletes_in_batches(self):
+        expired = [self._audit(400 + i) for i in range(5)]
+        kept = self._audit(10)
+
+        removed = purge_expired(AuditLog, days=365, archive=True, batch_size=2)
+
+        self.assertEqual(removed, 5)
+        self.assertEqual(list(AuditLog.objects.values_list("pk", flat=True)), [kept.pk])
+        files = sorted(Path(self.archive_dir.name).rglob("*.jsonl.gz"))
+        self.assertEqual(len(files), 3)
+        archived = [json.loads(line) for path in files for line in gzip.decompress(path.read_bytes()).splitlines()]
+        self.assertCountEqual([row["id"] for row in archived], [str(row.pk) for row in expired])
+
+    def test_max_batches_bounds_one_run(self):
+        for i in range(5):
+            self._audit(400 + i)
+        self.assertEqual(purge_expired(AuditLog, days=365, batch_size=2, max_batches=1), 2)
+        self.assertEqual(AuditLog.objects.count(), 3)
+
+    def test_cleanup_old_notifications_uses_batches(self):
+        old = Notification.objects.create(recipient=self.user, verb="asked a question")
+        Notification.objects.filter(pk=old.pk).update(created_at=timezone.now() - timedelta(days=120))
+        Notification.objects.create(recipient=self.user, verb="asked a question")
+
+        self.assertEqual(cleanup_old_notifications(days=90), 1)
+        self.assertFalse(Notification.objects.filter(pk=old.pk).exists())
+        self.assertEqual(Notification.objects.count(), 1)
+
+    @override_settings(RETENTION_POLICIES={"audit.AuditLog": {"days": 30}})
+    def test_command_dry_run_and_policy_override(self):
+        self._audit(45)
+        out = StringIO()
+        call_command("apply_retention", "--model", "audit.AuditLog", "--dry-run", stdout=out)
+        self.assertIn("audit.AuditLog: would remove 1 row(s).", out.getvalue())
+        self.assertEqual(AuditLog.objects.count(), 1)
+
+        call_command("apply_retention", stdout=StringIO())
+        self.assertEqual(AuditLog.objects.count(), 0)
@@ -8,7 +8,7 @@ from rest_framework.views import APIView
 from audit.models import ActionType
 from audit.utils import log_action
 from core.permissions import IsModeratorOrAdmin
-from notifications.models import Notification
+from notifications.services import create_notifications_bulk
 from notifications.tasks import (
     send_niat_rejection_email,
     send_write_access_unlocked_email,
@@ -59,11 +59,7 @@ class ApproveNiatProfileView(APIView):
             "approval_email_queued",
             extra={"user_id": str(user.id), "user_email": user.email or "NO_EMAIL", "user_role": user.role},
         )
-        Notification.objects.create(
-            recipient=user,
-            actor=request.user,
-            verb="niat_approved",
-        )
+        create_notifications_bulk([user], actor=request.user, verb="niat_approved")
         return Response({"status": profile.status, "user_role": user.role}, status=status.HTTP_200_OK)
 
 
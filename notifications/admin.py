@@ -1,6 +1,6 @@
 from django.contrib import admin
 from django.contrib.contenttypes.admin import GenericTabularInline
-from .models import NotificationType, Notification, NotificationDelivery
+from .models import EmailOutbox, NotificationType, Notification, NotificationDelivery
 
 
 @admin.register(NotificationType)
@@ -29,3 +29,11 @@ class NotificationDeliveryAdmin(admin.ModelAdmin):
     list_display = ("notification", "channel", "sent_at", "opened_at", "created_at")
     list_filter = ("channel",)
     raw_id_fields = ("notification",)
+
+
+@admin.register(EmailOutbox)
+class EmailOutboxAdmin(admin.ModelAdmin):
+    list_display = ("subject", "status", "attempts", "next_attempt_at", "sent_at", "created_at")
+    list_filter = ("status",)
+    search_fields = ("subject",)
+    readonly_fields = ("created_at", "sent_at", "last_error")
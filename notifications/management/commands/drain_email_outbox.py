@@ -0,0 +1,15 @@
+"""
+Send due emails from the transactional outbox (what the Celery beat task runs).
+Usage: python manage.py drain_email_outbox
+"""
+from django.core.management.base import BaseCommand
+
+from notifications.outbox import drain_outbox
+
+
+class Command(BaseCommand):
+    help = "Send pending emails from the transactional email outbox"
+
+    def handle(self, *args, **options):
+        totals = drain_outbox()
+        self.stdout.write(self.style.SUCCESS(f"Sent {totals['sent']} email(s); {totals['failed']} failed."))
@@ -8,6 +8,7 @@ from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
+from django.utils import timezone
 
 
 class NotificationType(models.Model):
@@ -123,3 +124,37 @@ class NotificationDelivery(models.Model):
 
     def __str__(self):
         return f"{self.channel}({self.notification_id})"
+
+
+class EmailOutbox(models.Model):
+    """
+    Transactional email outbox: rows are written in the caller's transaction and
+    sent by notifications.outbox.drain_outbox, so requests never wait on SMTP.
+    """
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        SENT = "sent", "Sent"
+        FAILED = "failed", "Failed"
+
+    id = models.BigAutoField(primary_key=True)
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=255, blank=True)
+    to = models.JSONField(default=list)
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "notifications_email_outbox"
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"], name="notif_outbox_due_idx"),
+        ]
+        verbose_name = "Outbox email"
+        verbose_name_plural = "Outbox emails"
+
+    def __str__(self):
+        return f"{self.subject} → {', '.join(self.to)} ({self.status})"
@@ -0,0 +1,160 @@
+"""
+Transactional email outbox.
+
+enqueue_email() inserts an EmailOutbox row in the caller's transaction, so an
+email exists only if the change that caused it commits, and the request never
+talks to SMTP. After commit a drain task is scheduled (deduplicated for a few
+seconds so bulk admin actions schedule one task); Celery beat also drains on
+EMAIL_OUTBOX_INTERVAL as a safety net for retries. drain_outbox() claims due rows
+in a short SELECT ... FOR UPDATE SKIP LOCKED transaction that leases them (moves
+next_attempt_at EMAIL_OUTBOX_LEASE_SECONDS ahead) and commits, so no lock or
+transaction is held while SMTP is slow. The batch is then sent over one SMTP
+connection and the results are stored with one bulk UPDATE. A drain that dies
+mid-batch leaves its rows leased; they are sent again once the lease expires.
+Failed rows are retried with exponential backoff up to EMAIL_OUTBOX_MAX_ATTEMPTS,
+then marked failed.
+"""
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from core.cache import NamespacedCache
+
+from .models import EmailOutbox
+
+logger = logging.getLogger("notifications.outbox")
+
+DRAIN_SCHEDULE_DEDUP_SECONDS = 5
+MAX_RETRY_DELAY = 60 * 60
+
+outbox_cache = NamespacedCache("notifications:outbox")
+
+
+def _schedule_drain():
+    if not outbox_cache.add("drain-scheduled", 1, DRAIN_SCHEDULE_DEDUP_SECONDS):
+        return
+    from .tasks import drain_email_outbox
+
+    drain_email_outbox.delay()
+
+
+def enqueue_email(subject, body, recipients, from_email=None):
+    """Queue one email for delivery after the current transaction commits; returns the outbox row."""
+    rows = enqueue_emails([(subject, body, recipients)], from_email=from_email)
+    return rows[0] if rows else None
+
+
+def enqueue_emails(messages, from_email=None):
+    """Queue many (subject, body, recipients) emails with one INSERT; returns the outbox rows."""
+    from_email = from_email or settings.DEFAULT_FROM_EMAIL or ""
+    rows = []
+    for subject, body, recipients in messages:
+        recipients = [address for address in recipients if address]
+        if recipients:
+            rows.append(EmailOutbox(subject=subject[:255], body=body, from_email=from_email, to=recipients))
+    if not rows:
+        return []
+    EmailOutbox.objects.bulk_create(rows)
+    # robust: a broker outage must not break the request; beat drains the rows later.
+    transaction.on_commit(_schedule_drain, robust=True)
+    return rows
+
+
+def _retry_delay(attempts):
+    return timedelta(seconds=min(MAX_RETRY_DELAY, 30 * 2 ** (attempts - 1)))
+
+
+def _record_failure(row, exc, now, max_attempts):
+    row.attempts += 1
+    row.last_error = f"{type(exc).__name__}: {exc}"[:2000]
+    if row.attempts >= max_attempts:
+        row.status = EmailOutbox.Status.FAILED
+    else:
+        row.next_attempt_at = now + _retry_delay(row.attempts)
+
+
+def _send_batch(rows):
+    """Send rows over one SMTP connection, updating each row's status; returns (sent, failed)."""
+    max_attempts = getattr(settings, "EMAIL_OUTBOX_MAX_ATTEMPTS", 5)
+    now = timezone.now()
+    sent = failed = 0
+    connection = get_connection(fail_silently=False)
+    try:
+        # Opened explicitly so send_messages reuses it instead of connecting per call.
+        connection.open()
+    except Exception as exc:
+        # SMTP is unreachable: every claimed row counts an attempt and backs off.
+        logger.warning("Could not open SMTP connection for %s outbox email(s): %s", len(rows), exc)
+        for row in rows:
+            _record_failure(row, exc, now, max_attempts)
+        EmailOutbox.objects.bulk_update(rows, ["status", "attempts", "next_attempt_at", "last_error"])
+        return 0, len(rows)
+    try:
+        for row in rows:
+            message = EmailMessage(row.subject, row.body, row.from_email or None, row.to, connection=connection)
+            try:
+                connection.send_messages([message])
+            except Exception as exc:
+                failed += 1
+                _record_failure(row, exc, now, max_attempts)
+                logger.warning(
+                    "Outbox email %s failed (attempt %s): %s", row.pk, row.attempts, exc, extra={"outbox_id": row.pk}
+                )
+                # The connection may be dead after an SMTP error; reopen it for the rest of the batch.
+                connection.close()
+                try:
+                    connection.open()
+                except Exception:
+                    logger.warning("Could not reopen SMTP connection", exc_info=True)
+                continue
+            row.attempts += 1
+            sent += 1
+            row.status = EmailOutbox.Status.SENT
+            row.sent_at = timezone.now()
+            row.last_error = ""
+    finally:
+        connection.close()
+    EmailOutbox.objects.bulk_update(rows, ["status", "attempts", "next_attempt_at", "last_error", "sent_at"])
+    return sent, failed
+
+
+def claim_due(batch_size):
+    """Lease up to `batch_size` due rows to this drain and return them; the locks are released on return."""
+    now = timezone.now()
+    lease = timedelta(seconds=getattr(settings, "EMAIL_OUTBOX_LEASE_SECONDS", 10 * 60))
+    with transaction.atomic():
+        rows = list(
+            EmailOutbox.objects.filter(status=EmailOutbox.Status.PENDING, next_attempt_at__lte=now)
+            .order_by("next_attempt_at", "id")
+            .select_for_update(skip_locked=True)[:batch_size]
+        )
+        if rows:
+            EmailOutbox.objects.filter(pk__in=[row.pk for row in rows]).update(next_attempt_at=now + lease)
+    for row in rows:
+        row.next_attempt_at = now + lease
+    return rows
+
+
+def drain_outbox(batch_size=None, max_batches=None):
+    """Send every due outbox email; returns {"sent": n, "failed": n}."""
+    batch_size = batch_size or getattr(settings, "EMAIL_OUTBOX_BATCH_SIZE", 100)
+    totals = {"sent": 0, "failed": 0}
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        rows = claim_due(batch_size)
+        if not rows:
+            break
+        sent, failed = _send_batch(rows)
+        totals["sent"] += sent
+        totals["failed"] += failed
+        batches += 1
+        if failed and not sent:
+            # SMTP is likely down; leave the rest for the next drain instead of spinning.
+            break
+    if totals["sent"] or totals["failed"]:
+        logger.info("Drained email outbox", extra=totals)
+    return totals
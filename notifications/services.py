@@ -7,11 +7,92 @@ from django.contrib.contenttypes.models import ContentType
 from django.utils import timezone
 from datetime import timedelta
 
+from core.retention import purge_expired
+
 from .models import Notification, NotificationType
 
 logger = logging.getLogger(__name__)
 
 
+DEDUP_WINDOW = timedelta(minutes=5)
+
+
+def _recipient_id(recipient):
+    return getattr(recipient, "pk", recipient)
+
+
+def create_notifications_bulk(
+    recipients,
+    actor,
+    verb,
+    target=None,
+    type_code=None,
+):
+    """
+    Create one notification per recipient with the same business rules as
+    create_notification, in a constant number of queries.
+
+    ContentType and NotificationType are resolved once, recent duplicates are
+    found with a single query on (recipient, -created_at), and every remaining
+    row is written with one bulk_create.
+
+    Args:
+        recipients: Iterable of Users or user ids
+        actor: User who performed the action (or None for system notifications)
+        verb: Action description (e.g., "asked a question")
+        target: The object being acted upon (Question, Article, etc.)
+        type_code: Optional NotificationType code
+
+    Returns:
+        List of created Notification instances (skipped recipients omitted)
+    """
+    actor_id = actor.pk if actor else None
+    # Rule 1: No self-notifications; also collapse repeated recipients.
+    recipient_ids = list(dict.fromkeys(
+        rid for rid in map(_recipient_id, recipients) if rid is not None and rid != actor_id
+    ))
+    if not recipient_ids:
+        return []
+
+    content_type = ContentType.objects.get_for_model(target) if target else None
+    object_id = target.pk if target else None
+
+    # Rule 2: Skip recipients already notified about the same event within 5 minutes.
+    duplicates = set(
+        Notification.objects.filter(
+            recipient_id__in=recipient_ids,
+            actor_id=actor_id,
+            verb=verb,
+            content_type=content_type,
+            object_id=object_id,
+            created_at__gte=timezone.now() - DEDUP_WINDOW,
+        ).values_list("recipient_id", flat=True)
+    )
+    if duplicates:
+        logger.debug(f"Skipping {len(duplicates)} duplicate notifications ({verb})")
+
+    notification_type = None
+    if type_code:
+        notification_type = NotificationType.objects.filter(code=type_code).first()
+
+    notifications = Notification.objects.bulk_create(
+        [
+            Notification(
+                recipient_id=recipient_id,
+                actor_id=actor_id,
+                verb=verb,
+                notification_type=notification_type,
+                content_type=content_type,
+                object_id=object_id,
+            )
+            for recipient_id in recipient_ids
+            if recipient_id not in duplicates
+        ]
+    )
+    logger.info(f"Created {len(notifications)} notifications ({verb})")
+    return notifications
+
+
 def create_notification(
     recipient,
     actor,
@@ -32,46 +113,14 @@ def create_notification(
     Returns:
         Notification instance or None if not created
     """
-    # Rule 1: No self-notifications
-    if recipient == actor:
-        logger.debug(f"Skipping self-notification: {actor} -> {verb}")
-        return None
-    
-    # Rule 2: Check for duplicate recent notifications (within 5 minutes)
-    recent_cutoff = timezone.now() - timedelta(minutes=5)
-    content_type = ContentType.objects.get_for_model(target) if target else None
-    object_id = target.id if target else None
-    
-    duplicate = Notification.objects.filter(
-        recipient=recipient,
+    created = create_notifications_bulk(
+        [recipient],
         actor=actor,
         verb=verb,
-        content_type=content_type,
-        object_id=object_id,
-        created_at__gte=recent_cutoff,
-    ).exists()
-    
-    if duplicate:
-        logger.debug(f"Skipping duplicate notification: {actor} -> {recipient} ({verb})")
-        return None
-    
-    # Get notification type if code provided
-    notification_type = None
-    if notification_type_code:
-        notification_type = NotificationType.objects.filter(code=notification_type_code).first()
-    
-    # Create notification
-    notification = Notification.objects.create(
-        recipient=recipient,
-        actor=actor,
-        verb=verb,
-        notification_type=notification_type,
-        content_type=content_type,
-        object_id=object_id,
+        target=target,
+        type_code=notification_type_code,
     )
-    
-    logger.info(f"Created notification: {actor.username} -> {recipient.username} ({verb})")
-    return notification
+    return created[0] if created else None
 
 
 def mark_notification_read(notification_id, user):
@@ -105,8 +154,7 @@ def get_unread_count(user):
 
 
 def cleanup_old_notifications(days=90):
-    """Delete notifications older than specified days. Run as periodic task."""
-    cutoff = timezone.now() - timedelta(days=days)
-    count, _ = Notification.objects.filter(created_at__lt=cutoff).delete()
+    """Delete notifications older than specified days, in bounded batches (see core.retention)."""
+    count = purge_expired(Notification, days)
     logger.info(f"Deleted {count} notifications older than {days} days")
     return count
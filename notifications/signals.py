@@ -3,7 +3,7 @@ Notification signals - create notifications on user actions (Q&A).
 """
 import logging
 from django.apps import apps
-from django.contrib.auth import get_user_model
+from django.db import transaction
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
@@ -17,28 +17,18 @@ def _register_qa_signals():
     from qa.models import Question, Answer
     from .services import create_notification
 
-    User = get_user_model()
-
     @receiver(post_save, sender=Question)
     def notify_seniors_new_question(sender, instance, created, **kwargs):
+        """Queue the senior fan-out after commit; the request never iterates recipients."""
         if not created:
             return
         question = instance
-        author = question.author
-        if getattr(author, "is_verified_senior", False):
+        if getattr(question.author, "is_verified_senior", False):
             return
-        seniors = User.objects.filter(
-            is_verified_senior=True, is_active=True
-        ).exclude(pk=author.pk)
-        verb = "asked a question"
-        for recipient in seniors:
-            create_notification(
-                recipient=recipient,
-                actor=author,
-                verb=verb,
-                target=question,
-                notification_type_code="qa_question_asked",
-            )
+        from .tasks import fan_out_new_question_notifications
+
+        question_id = str(question.pk)
+        transaction.on_commit(lambda: fan_out_new_question_notifications.delay(question_id))
 
     @receiver(post_save, sender=Answer)
     def notify_author_answer_posted(sender, instance, created, **kwargs):
@@ -1,5 +1,6 @@
 import logging
 
+from celery import shared_task
 from django.conf import settings
 from django.core.mail import send_mail
 
@@ -7,36 +8,13 @@ from accounts.models import User
 from articles.models import Article
 from profiles.models import NiatStudentProfile, VerifiedNiatStudentProfile
 
-logger = logging.getLogger("notifications.tasks")
-
-try:
-    from celery import shared_task
-except ImportError:  # pragma: no cover
-    def shared_task(*args, **kwargs):
-        bind = kwargs.get("bind", False)
-
-        def decorator(func):
-            class _FallbackTaskContext:
-                class _Request:
-                    retries = 0
-
-                request = _Request()
+from .outbox import drain_outbox
+from .services import create_notifications_bulk
 
-                @staticmethod
-                def retry(exc=None, countdown=None):
-                    if exc is not None:
-                        raise exc
-                    raise RuntimeError("Task retry requested")
-
-            def delay(*delay_args, **delay_kwargs):
-                if bind:
-                    return func(_FallbackTaskContext(), *delay_args, **delay_kwargs)
-                return func(*delay_args, **delay_kwargs)
-
-            func.delay = delay
-            return func
+logger = logging.getLogger("notifications.tasks")
 
-        return decorator
+QUESTION_FANOUT_CHUNK_SIZE = 500
+QUESTION_ASKED_VERB = "asked a question"
 
 
 def _send(subject, message, recipients):
@@ -170,3 +148,61 @@ def send_niat_rejection_email(self, profile_id):
     except Exception as exc:  # pragma: no cover
         logger.exception("send_niat_rejection_email.failure")
         raise self.retry(exc=exc, countdown=2 ** self.request.retries)
+
+
+def _chunked(iterable, size):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+@shared_task(bind=True, max_retries=3)
+def fan_out_new_question_notifications(self, question_id):
+    """Notify every active verified senior about a new question, in chunks of QUESTION_FANOUT_CHUNK_SIZE."""
+    from qa.models import Question
+
+    logger.info("fan_out_new_question_notifications.start", extra={"question_id": str(question_id)})
+    try:
+        question = Question.objects.select_related("author").filter(pk=question_id).first()
+        if not question or question.author.is_verified_senior:
+            return 0
+        recipient_ids = (
+            User.objects.filter(is_verified_senior=True, is_active=True)
+            .exclude(pk=question.author_id)
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+        created = 0
+        for chunk in _chunked(recipient_ids.iterator(chunk_size=QUESTION_FANOUT_CHUNK_SIZE), QUESTION_FANOUT_CHUNK_SIZE):
+            created += len(
+                create_notifications_bulk(
+                    chunk,
+                    actor=question.author,
+                    verb=QUESTION_ASKED_VERB,
+                    target=question,
+                    type_code="qa_question_asked",
+                )
+            )
+        logger.info(
+            "fan_out_new_question_notifications.success",
+            extra={"question_id": str(question_id), "created": created},
+        )
+        return created
+    except Exception as exc:  # pragma: no cover
+        logger.exception("fan_out_new_question_notifications.failure")
+        raise self.retry(exc=exc, countdown=2 ** self.request.retries)
+
+
+@shared_task(bind=True, max_retries=3)
+def drain_email_outbox(self):
+    """Send due outbox emails (queued after commit and run periodically by beat)."""
+    try:
+        return drain_outbox()
+    except Exception as exc:  # pragma: no cover
+        logger.exception("drain_email_outbox.failure")
+        raise self.retry(exc=exc, countdown=2 ** self.request.retries)
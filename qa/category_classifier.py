@@ -1,14 +1,18 @@
 """
 Auto category classification for Q&A questions.
 Uses keyword scoring with optional Groq LLM; results cached for 7 days.
+New questions are saved with the cached or keyword category; qa.tasks.classify_question
+upgrades them with the LLM result after commit.
 """
 import hashlib
 import json
 import logging
 import re
-from django.core.cache import cache
 from django.conf import settings
 
+from core.cache import NamespacedCache
+from core.llm import get_llm, register_fake_responder
+
 logger = logging.getLogger(__name__)
 
 # Set to True to print Groq request/response to console (runserver).
@@ -125,16 +129,14 @@ def classify_with_groq(question_text: str):
     Use Groq (llama-3.1-8b-instant) to classify. Returns (category: str, confidence: float).
     On any failure returns ("General", 0.0). Response must be JSON: {"category": "...", "confidence": 0.0}.
     """
-    api_key = getattr(settings, "GROQ_API_KEY", None) or ""
-    if not api_key:
+    llm = get_llm("groq")
+    if not llm.is_configured:
         _log("GROQ: skipped — GROQ_API_KEY is empty or not set. Set it in .env to use AI classification.")
         return ("General", 0.0)
     if not question_text or not isinstance(question_text, str):
         _log("GROQ: skipped — no question text.")
         return ("General", 0.0)
     try:
-        from groq import Groq
-        client = Groq(api_key=api_key)
         prompt = (
             "You are a classifier for student questions about a college (NIAT). "
             "Choose exactly one category from this list: "
@@ -145,13 +147,7 @@ def classify_with_groq(question_text: str):
             + question_text[:1000]
         )
         _log("GROQ: requesting (model=llama-3.1-8b-instant) for question: %s", (question_text[:80] + "..." if len(question_text) > 80 else question_text))
-        response = client.chat.completions.create(
-            model="llama-3.1-8b-instant",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.1,
-            max_tokens=60,
-        )
-        content = (response.choices[0].message.content or "").strip()
+        content = llm.complete(prompt, model="llama-3.1-8b-instant", temperature=0.1, max_tokens=60).strip()
         _log("GROQ: raw response: %s", content[:500] if content else "(empty)")
         # Strip markdown code blocks if present
         if content.startswith("```"):
@@ -172,16 +168,30 @@ def classify_with_groq(question_text: str):
         return ("General", 0.0)
 
 
+@register_fake_responder("groq")
+def fake_classification_response(prompt, system=None, model=None) -> str:
+    """Offline LLM backend: answer with the keyword classification of the question."""
+    question = prompt.rsplit("Question: ", 1)[-1]
+    return json.dumps({"category": classify_with_keywords(question), "confidence": 0.9})
+
+
 class CategoryClassifier:
     """Classify question text with optional Groq LLM and keyword fallback; cache for 7 days."""
 
-    CACHE_PREFIX = "niat_cat_"
+    cache = NamespacedCache("qa:classifier")
     CACHE_TIMEOUT = 7 * 24 * 60 * 60  # 7 days in seconds
 
     def _cache_key(self, text: str) -> str:
         normalized = (text or "").lower().strip()
-        h = hashlib.md5(normalized.encode("utf-8")).hexdigest()
-        return self.CACHE_PREFIX + h
+        return hashlib.md5(normalized.encode("utf-8")).hexdigest()
+
+    def classify_without_llm(self, question_text: str) -> dict:
+        """Cached result if there is one, else the keyword category. Never calls the LLM and caches nothing."""
+        if question_text and isinstance(question_text, str):
+            cached = self.cache.get(self._cache_key(question_text))
+            if cached is not None:
+                return cached
+        return {"category": classify_with_keywords(question_text), "confidence": 0.0, "source": "keyword"}
 
     def classify(self, question_text: str) -> dict:
         """
@@ -192,7 +202,7 @@ class CategoryClassifier:
             result = {"category": "General", "confidence": 0.0, "source": "keyword"}
             return result
         key = self._cache_key(question_text)
-        cached = cache.get(key)
+        cached = self.cache.get(key)
         if cached is not None:
             _log("classify: cache HIT -> %s (source=%s)", cached.get("category"), cached.get("source"))
             return cached
@@ -211,8 +221,34 @@ class CategoryClassifier:
             source = "keyword"
             _log("classify: using KEYWORD fallback -> category=%s (Groq had confidence=%.2f)", category, groq_confidence)
         result = {"category": category, "confidence": confidence, "source": source}
-        cache.set(key, result, self.CACHE_TIMEOUT)
+        self.cache.set(key, result, self.CACHE_TIMEOUT)
         return result
 
 
 classifier = CategoryClassifier()
+
+
+def llm_classification_available() -> bool:
+    return get_llm("groq").is_configured
+
+
+def upgrade_question_category(question_id) -> bool:
+    """
+    Replace a question's keyword category with the LLM result (cached for 7 days).
+    Questions whose category was set any other way are left alone. Returns True if updated.
+    """
+    from .models import Question
+
+    question = Question.objects.filter(pk=question_id, category_source="keyword").only("title", "body").first()
+    if question is None:
+        return False
+    result = classifier.classify(question.classification_text())
+    if result.get("source") != "llm":
+        return False
+    return bool(
+        Question.objects.filter(pk=question_id, category_source="keyword").update(
+            category=result["category"],
+            category_confidence=result["confidence"],
+            category_source="llm",
+        )
+    )
@@ -0,0 +1,105 @@
+"""
+Follower answer feed.
+
+With ANSWER_FEED_FANOUT on, each new answer is copied into FeedEntry rows for the
+author's followers (fan-out on write) and a new follow backfills that senior's
+recent answers, so reading a feed is an indexed range scan on (user, created_at).
+Seniors above ANSWER_FEED_PULL_THRESHOLD followers are never fanned out; their
+answers are pulled at read time and merged in. With fan-out off the feed is
+always pulled from SeniorFollow.
+"""
+from django.conf import settings
+from django.db.models import Q
+
+from verification.models import SeniorFollow, SeniorProfile
+
+from .models import Answer, FeedEntry
+
+FANOUT_CHUNK_SIZE = 1000
+
+
+def fanout_enabled():
+    return getattr(settings, "ANSWER_FEED_FANOUT", False)
+
+
+def _pull_threshold():
+    return getattr(settings, "ANSWER_FEED_PULL_THRESHOLD", 5000)
+
+
+def _is_pull_senior(senior_id):
+    return SeniorProfile.objects.filter(user_id=senior_id, follower_count__gt=_pull_threshold()).exists()
+
+
+def fan_out_answer(answer_id):
+    """Write the answer into every follower's feed; returns the number of entries written."""
+    answer = Answer.objects.filter(pk=answer_id).only("pk", "author_id", "created_at").first()
+    if answer is None or _is_pull_senior(answer.author_id):
+        return 0
+    follower_ids = (
+        SeniorFollow.objects.filter(senior_id=answer.author_id)
+        .order_by("pk")
+        .values_list("follower_id", flat=True)
+    )
+    created = 0
+    batch = []
+    for follower_id in follower_ids.iterator(chunk_size=FANOUT_CHUNK_SIZE):
+        batch.append(
+            FeedEntry(user_id=follower_id, answer_id=answer.pk, senior_id=answer.author_id, created_at=answer.created_at)
+        )
+        if len(batch) >= FANOUT_CHUNK_SIZE:
+            created += len(FeedEntry.objects.bulk_create(batch, ignore_conflicts=True))
+            batch = []
+    if batch:
+        created += len(FeedEntry.objects.bulk_create(batch, ignore_conflicts=True))
+    return created
+
+
+def backfill_follow(follower_id, senior_id):
+    """Copy the senior's most recent answers into a new follower's feed."""
+    if _is_pull_senior(senior_id):
+        return 0
+    limit = getattr(settings, "ANSWER_FEED_BACKFILL_LIMIT", 200)
+    recent = Answer.objects.filter(author_id=senior_id).order_by("-created_at").values_list("pk", "created_at")[:limit]
+    entries = [
+        FeedEntry(user_id=follower_id, answer_id=pk, senior_id=senior_id, created_at=created_at)
+        for pk, created_at in recent
+    ]
+    return len(FeedEntry.objects.bulk_create(entries, ignore_conflicts=True))
+
+
+def remove_follow(follower_id, senior_id):
+    FeedEntry.objects.filter(user_id=follower_id, senior_id=senior_id).delete()
+
+
+def feed_queryset(user):
+    """
+    Answers for the user's feed, newest first. Returns (queryset, model) where model is
+    FeedEntry for the pure materialized path (caller reads entry.answer) or Answer otherwise.
+    """
+    followed = SeniorFollow.objects.filter(follower=user)
+    if not fanout_enabled():
+        return (
+            Answer.objects.filter(author_id__in=followed.values_list("senior_id", flat=True))
+            .select_related("question", "author")
+            .order_by("-created_at"),
+            Answer,
+        )
+    pull_ids = list(
+        followed.filter(senior__senior_profile__follower_count__gt=_pull_threshold()).values_list(
+            "senior_id", flat=True
+        )
+    )
+    if not pull_ids:
+        return (
+            FeedEntry.objects.filter(user=user)
+            .select_related("answer__question", "answer__author")
+            .order_by("-created_at"),
+            FeedEntry,
+        )
+    materialized = FeedEntry.objects.filter(user=user).values("answer_id")
+    return (
+        Answer.objects.filter(Q(pk__in=materialized) | Q(author_id__in=pull_ids))
+        .select_related("question", "author")
+        .order_by("-created_at"),
+        Answer,
+    )
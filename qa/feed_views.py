@@ -1,15 +1,15 @@
 """
 Feed of answers from seniors the current user follows.
-GET /api/feed/answers/ — cursor-paginated, authenticated only.
+GET /api/feed/answers/ — cursor-paginated, authenticated only. See qa.feed for the
+materialized (fan-out on write) mode.
 """
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from verification.models import SeniorFollow
-
-from .models import Answer
+from .feed import feed_queryset
+from .models import FeedEntry
 from .pagination import QuestionCursorPagination
 from .serializers import AnswerSerializer
 
@@ -19,17 +19,12 @@ class FeedAnswersView(APIView):
     pagination_class = QuestionCursorPagination
 
     def get(self, request):
-        following_senior_ids = SeniorFollow.objects.filter(
-            follower=request.user
-        ).values_list("senior_id", flat=True)
-        qs = (
-            Answer.objects.filter(author_id__in=following_senior_ids)
-            .select_related("question", "author")
-            .order_by("-created_at")
-        )
+        qs, model = feed_queryset(request.user)
         paginator = self.pagination_class()
         paginator.ordering = "-created_at"
         page = paginator.paginate_queryset(qs, request)
+        if page is not None and model is FeedEntry:
+            page = [entry.answer for entry in page]
         if page is not None:
             serializer = AnswerSerializer(page, many=True, context={"request": request})
             return paginator.get_paginated_response(serializer.data)
@@ -0,0 +1,19 @@
+"""
+Backfill materialized answer feeds from existing follows (run once after enabling ANSWER_FEED_FANOUT).
+Usage: python manage.py rebuild_answer_feeds
+"""
+from django.core.management.base import BaseCommand
+
+from qa import feed
+from verification.models import SeniorFollow
+
+
+class Command(BaseCommand):
+    help = "Backfill FeedEntry rows for every follower/senior pair"
+
+    def handle(self, *args, **options):
+        written = 0
+        follows = SeniorFollow.objects.order_by("pk").values_list("follower_id", "senior_id")
+        for follower_id, senior_id in follows.iterator(chunk_size=1000):
+            written += feed.backfill_follow(follower_id, senior_id)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {written} feed entr(ies)."))
@@ -15,8 +15,7 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         updated = 0
         for q in Question.objects.iterator():
-            text = f"{q.title}\n{q.body or ''}".strip()
-            result = classifier.classify(text)
+            result = classifier.classify(q.classification_text())
             q.category = result.get("category", "General")
             q.category_confidence = result.get("confidence", 0.0)
             q.category_source = result.get("source", "keyword")
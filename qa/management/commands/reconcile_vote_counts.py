@@ -0,0 +1,59 @@
+"""
+Recompute upvote_count/downvote_count for questions and answers from their votes
+and repair any drift left by the incremental counters. Safe to run periodically (e.g. nightly cron).
+Usage: python manage.py reconcile_vote_counts [--dry-run]
+"""
+from django.core.management.base import BaseCommand
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from qa.models import Answer, AnswerVote, Question, QuestionVote
+
+BATCH_SIZE = 500
+
+
+def _vote_count(vote_model, fk, value):
+    counts = (
+        vote_model.objects.filter(**{fk: OuterRef("pk")}, value=value)
+        .order_by()
+        .values(fk)
+        .annotate(c=Count("pk"))
+        .values("c")
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+
+
+def reconcile(model, vote_model, fk, dry_run=False):
+    """Fix rows whose stored counters differ from their votes; returns the number of rows fixed."""
+    drifted = (
+        model.objects.annotate(
+            actual_up=_vote_count(vote_model, fk, 1),
+            actual_down=_vote_count(vote_model, fk, -1),
+        )
+        .filter(~Q(upvote_count=F("actual_up")) | ~Q(downvote_count=F("actual_down")))
+        .only("pk", "upvote_count", "downvote_count")
+    )
+    fixed = []
+    for row in drifted.iterator(chunk_size=BATCH_SIZE):
+        row.upvote_count = row.actual_up
+        row.downvote_count = row.actual_down
+        fixed.append(row)
+    if fixed and not dry_run:
+        model.objects.bulk_update(fixed, ["upvote_count", "downvote_count"], batch_size=BATCH_SIZE)
+    return len(fixed)
+
+
+class Command(BaseCommand):
+    help = "Repair drift in question/answer vote counters"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Report drift without writing.")
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        questions = reconcile(Question, QuestionVote, "question", dry_run)
+        answers = reconcile(Answer, AnswerVote, "answer", dry_run)
+        verb = "Found" if dry_run else "Fixed"
+        self.stdout.write(
+            self.style.SUCCESS(f"{verb} drifted vote counts on {questions} question(s) and {answers} answer(s).")
+        )
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:01
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('qa', '0018_alter_answervote_id_alter_questionvote_id'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FeedEntry',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('senior_id', models.UUIDField(db_index=True)),
+                ('created_at', models.DateTimeField(db_index=True)),
+                ('answer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='feed_entries', to='qa.answer')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='feed_entries', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'qa_feed_entry',
+                'indexes': [models.Index(fields=['user', '-created_at', 'id'], name='qa_feed_user_created_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'answer'), name='qa_feed_entry_unique')],
+            },
+        ),
+    ]
@@ -45,14 +45,17 @@ class Question(models.Model):
 
     def save(self, *args, **kwargs):
         if self._state.adding:
+            # The LLM upgrade runs after commit (qa.tasks.classify_question).
             from qa.category_classifier import classifier
-            text = f"{self.title}\n{self.body or ''}".strip()
-            result = classifier.classify(text)
+            result = classifier.classify_without_llm(self.classification_text())
             self.category = result.get("category", "General")
             self.category_confidence = result.get("confidence", 0.0)
             self.category_source = result.get("source", "keyword")
         super().save(*args, **kwargs)
 
+    def classification_text(self):
+        return f"{self.title}\n{self.body or ''}".strip()
+
     def __str__(self):
         return self.title[:80]
 
@@ -91,6 +94,38 @@ class Answer(models.Model):
         return self.body[:50] or str(self.id)
 
 
+class FeedEntry(models.Model):
+    """
+    Materialized follower feed: one row per (follower, answer by a senior they follow).
+    Written by qa.feed when ANSWER_FEED_FANOUT is on; created_at copies the answer's.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="feed_entries",
+    )
+    answer = models.ForeignKey(
+        Answer,
+        on_delete=models.CASCADE,
+        related_name="feed_entries",
+    )
+    senior_id = models.UUIDField(db_index=True)  # answer.author_id, for cheap unfollow cleanup
+    created_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        db_table = "qa_feed_entry"
+        constraints = [
+            models.UniqueConstraint(fields=["user", "answer"], name="qa_feed_entry_unique"),
+        ]
+        indexes = [
+            models.Index(fields=["user", "-created_at", "id"], name="qa_feed_user_created_idx"),
+        ]
+
+    def __str__(self):
+        return f"FeedEntry({self.user_id}, {self.answer_id})"
+
+
 class FollowUp(models.Model):
     """Reddit-style thread under an answer: top-level = student follow-up (question), replies = nested."""
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
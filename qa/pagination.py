@@ -17,3 +17,15 @@ class FollowUpCursorPagination(CursorPagination):
     max_page_size = 100
     ordering = ["created_at", "id"]
     cursor_query_param = "cursor"
+
+
+class AnswerCursorPagination(CursorPagination):
+    """Opt-in cursor pagination for long answer threads (oldest first)."""
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = ["created_at", "id"]
+    cursor_query_param = "cursor"
+
+    def is_requested(self, request):
+        return self.cursor_query_param in request.query_params or self.page_size_query_param in request.query_params
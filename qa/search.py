@@ -1,5 +1,6 @@
-"""PostgreSQL full-text search for questions (search_vector + trigram fallback)."""
-from django.db.models import F, Prefetch, Q
+"""PostgreSQL full-text search for questions (search_vector + trigram fallback; icontains on other backends)."""
+from django.db import connection
+from django.db.models import F, Q
 from django.contrib.postgres.search import (
     SearchQuery,
     SearchRank,
@@ -7,46 +8,47 @@ from django.contrib.postgres.search import (
     TrigramSimilarity,
 )
 
-from .models import Answer, Question
+from .models import Question
+from .serializers import answers_prefetch
 
 
-def _answers_prefetch():
-    return Prefetch(
-        "answers",
-        queryset=Answer.objects.order_by("created_at").select_related("author"),
-    )
+def _icontains(q, order_by, user=None):
+    qs = Question.objects.filter(
+        Q(title__icontains=q) | Q(body__icontains=q)
+    ).select_related("author").prefetch_related(answers_prefetch(user))
+    if order_by == "-upvote_count":
+        qs = qs.order_by("-upvote_count", "-created_at")
+    else:
+        qs = qs.order_by("-created_at")
+    return qs
 
 
-def _trigram_fallback(q, order_by):
+def _trigram_fallback(q, order_by, user=None):
     """Fallback when FTS returns no results: trigram similarity on title, then icontains."""
     qs = (
         Question.objects.select_related("author")
-        .prefetch_related(_answers_prefetch())
+        .prefetch_related(answers_prefetch(user))
         .annotate(similarity=TrigramSimilarity("title", q))
         .filter(similarity__gte=0.15)
         .order_by("-similarity", "-created_at")
     )
     if qs.exists():
         return qs
-    qs = Question.objects.filter(
-        Q(title__icontains=q) | Q(body__icontains=q)
-    ).select_related("author").prefetch_related(_answers_prefetch())
-    if order_by == "-upvote_count":
-        qs = qs.order_by("-upvote_count", "-created_at")
-    else:
-        qs = qs.order_by("-created_at")
-    return qs
+    return _icontains(q, order_by, user)
 
 
-def search_questions(query_string, order_by="-rank"):
+def search_questions(query_string, order_by="-rank", user=None):
+    """`user` only annotates each prefetched answer with that user's vote."""
     q = (query_string or "").strip()
     if not q:
         return Question.objects.none()
+    if connection.vendor != "postgresql":
+        return _icontains(q, order_by, user)
 
     search_query = SearchQuery(q, search_type="websearch", config="english")
     qs = (
         Question.objects.select_related("author")
-        .prefetch_related(_answers_prefetch())
+        .prefetch_related(answers_prefetch(user))
         .filter(search_vector=search_query)
         .annotate(
             rank=SearchRank(
@@ -86,20 +88,22 @@ def search_questions(query_string, order_by="-rank"):
         qs = qs.order_by("-rank", "-created_at")
 
     if not qs.exists():
-        return _trigram_fallback(q, order_by)
+        return _trigram_fallback(q, order_by, user)
     return qs
 
 
-def suggestion_questions(query_string, limit=10):
+def suggestion_questions(query_string, limit=10, user=None):
     q = (query_string or "").strip()
     if not q:
         return Question.objects.none()
     limit = min(20, max(1, limit))
+    if connection.vendor != "postgresql":
+        return _icontains(q, "-created_at", user)[:limit]
 
     search_query = SearchQuery(q, search_type="websearch", config="english")
     qs = (
         Question.objects.select_related("author")
-        .prefetch_related(_answers_prefetch())
+        .prefetch_related(answers_prefetch(user))
         .filter(search_vector=search_query)
         .annotate(
             rank=SearchRank(
@@ -116,7 +120,7 @@ def suggestion_questions(query_string, limit=10):
         return qs
     qs = (
         Question.objects.select_related("author")
-        .prefetch_related(_answers_prefetch())
+        .prefetch_related(answers_prefetch(user))
         .annotate(similarity=TrigramSimilarity("title", q))
         .filter(similarity__gte=0.1)
         .order_by("-similarity", "-created_at")[:limit]
@@ -37,7 +37,7 @@ def search_questions_view(request):
             "previous": None,
             "results": [],
         })
-    qs = search_questions(q, order_by=order_by)
+    qs = search_questions(q, order_by=order_by, user=request.user)
     qs = _annotate_user_vote(qs, request.user)
     paginator = QuestionSearchPagination()
     page = paginator.paginate_queryset(qs, request)
@@ -56,7 +56,7 @@ def search_suggestions_view(request):
     if not q:
         return Response([])
     limit = min(20, int(request.query_params.get("limit", 10)))
-    qs = suggestion_questions(q, limit=limit)
+    qs = suggestion_questions(q, limit=limit, user=request.user)
     qs = _annotate_user_vote(qs, request.user)
     serializer = QuestionListSerializer(qs, many=True, context={"request": request})
     return Response(serializer.data)
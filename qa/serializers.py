@@ -1,9 +1,10 @@
 import uuid
 from django.contrib.auth import get_user_model
+from django.db.models import OuterRef, Prefetch, Subquery
 from django.utils.text import slugify
 from rest_framework import serializers
 
-from .models import Answer, FollowUp, Question
+from .models import Answer, AnswerVote, FollowUp, Question
 
 User = get_user_model()
 
@@ -71,11 +72,31 @@ class AnswerSerializer(serializers.ModelSerializer):
         }
 
 
-def _answer_serializer_with_vote(answer, request):
+def answers_with_user_vote(user=None):
+    """
+    Answers oldest-first with their authors. For a logged-in user each answer is
+    annotated with user_vote, so serializing never queries votes per answer.
+    """
+    queryset = Answer.objects.order_by("created_at").select_related("author")
+    if user is not None and user.is_authenticated:
+        my_vote = AnswerVote.objects.filter(answer=OuterRef("pk"), user=user).values("value")[:1]
+        queryset = queryset.annotate(user_vote=Subquery(my_vote))
+    return queryset
+
+
+def answers_prefetch(user=None):
+    return Prefetch("answers", queryset=answers_with_user_vote(user))
+
+
+def answer_data_with_vote(answer, request):
+    """Serialized answer plus the requesting user's vote (annotated `user_vote` when present)."""
     data = AnswerSerializer(answer).data
     if request and request.user.is_authenticated:
-        vote = answer.votes.filter(user=request.user).first()
-        data["user_vote"] = vote.value if vote else None
+        if hasattr(answer, "user_vote"):
+            data["user_vote"] = answer.user_vote
+        else:
+            vote = answer.votes.filter(user=request.user).first()
+            data["user_vote"] = vote.value if vote else None
     else:
         data["user_vote"] = None
     return data
@@ -128,10 +149,11 @@ class QuestionListSerializer(serializers.ModelSerializer):
     def get_answer(self, obj):
         if not obj.is_answered:
             return None
-        first = obj.answers.order_by("created_at").first()
+        # answers.all() reuses answers_prefetch() (already oldest-first) when present.
+        first = next(iter(obj.answers.all()), None)
         if not first:
             return None
-        return _answer_serializer_with_vote(first, self.context.get("request"))
+        return answer_data_with_vote(first, self.context.get("request"))
 
 
 class QuestionDetailSerializer(serializers.ModelSerializer):
@@ -170,9 +192,9 @@ class QuestionDetailSerializer(serializers.ModelSerializer):
         return {"username": obj.author.username, "id": str(obj.author.id)}
 
     def get_answers(self, obj):
-        answers = obj.answers.order_by("created_at")
+        answers = obj.answers.all()
         request = self.context.get("request")
-        return [_answer_serializer_with_vote(a, request) for a in answers]
+        return [answer_data_with_vote(a, request) for a in answers]
 
     def get_user_vote(self, obj):
         return getattr(obj, "user_vote", None)
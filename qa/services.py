@@ -0,0 +1,111 @@
+"""
+Voting service for questions and answers.
+
+On PostgreSQL the vote upsert/delete and the counter update are one statement:
+they run as data-modifying CTEs and RETURN the new counters and the caller's
+vote. It is preceded by a transaction-level advisory lock on (target, user):
+every CTE reads the snapshot taken when the statement starts, so without it two
+concurrent first votes by the same user would both see no previous vote and
+both add to the counters. Other backends (SQLite in dev/tests) use the ORM,
+where qa.signals keeps the counters in sync.
+"""
+import uuid
+
+from django.db import connection, transaction
+
+from .models import Answer, AnswerVote, Question, QuestionVote
+
+_LOCK_SQL = "SELECT pg_advisory_xact_lock(hashtext(%(table)s || ':' || %(target)s || ':' || %(user)s))"
+
+_UPSERT_SQL = """
+WITH old AS (
+    SELECT value FROM {vote_table} WHERE {fk} = %(target)s AND {user} = %(user)s FOR UPDATE
+), vote AS (
+    INSERT INTO {vote_table} ({vote_pk}, {fk}, {user}, value)
+    VALUES (%(vote_id)s, %(target)s, %(user)s, %(value)s)
+    ON CONFLICT ({fk}, {user}) DO UPDATE SET value = EXCLUDED.value
+    RETURNING value
+), counts AS (
+    UPDATE {target_table} SET
+        upvote_count = upvote_count + %(up)s - (SELECT COUNT(*) FROM old WHERE value = 1),
+        downvote_count = downvote_count + %(down)s - (SELECT COUNT(*) FROM old WHERE value = -1)
+    WHERE {target_pk} = %(target)s
+    RETURNING upvote_count, downvote_count
+)
+SELECT counts.upvote_count, counts.downvote_count, (SELECT value FROM vote) FROM counts
+"""
+
+_DELETE_SQL = """
+WITH removed AS (
+    DELETE FROM {vote_table} WHERE {fk} = %(target)s AND {user} = %(user)s RETURNING value
+), counts AS (
+    UPDATE {target_table} SET
+        upvote_count = upvote_count - (SELECT COUNT(*) FROM removed WHERE value = 1),
+        downvote_count = downvote_count - (SELECT COUNT(*) FROM removed WHERE value = -1)
+    WHERE {target_pk} = %(target)s
+    RETURNING upvote_count, downvote_count
+)
+SELECT counts.upvote_count, counts.downvote_count, NULL FROM counts
+"""
+
+
+def _vote_result(upvote_count, downvote_count, user_vote):
+    return {"upvote_count": upvote_count, "downvote_count": downvote_count, "user_vote": user_vote}
+
+
+def _vote_postgres(target_model, vote_model, fk_name, target_id, user_id, value):
+    fk = vote_model._meta.get_field(fk_name)
+    names = {
+        "vote_table": connection.ops.quote_name(vote_model._meta.db_table),
+        "vote_pk": connection.ops.quote_name(vote_model._meta.pk.column),
+        "fk": connection.ops.quote_name(fk.column),
+        "user": connection.ops.quote_name(vote_model._meta.get_field("user").column),
+        "target_table": connection.ops.quote_name(target_model._meta.db_table),
+        "target_pk": connection.ops.quote_name(target_model._meta.pk.column),
+    }
+    params = {"target": target_id, "user": user_id}
+    if value is None:
+        sql = _DELETE_SQL.format(**names)
+    else:
+        sql = _UPSERT_SQL.format(**names)
+        params.update(vote_id=uuid.uuid4(), value=value, up=int(value == 1), down=int(value == -1))
+    with transaction.atomic(savepoint=False), connection.cursor() as cursor:
+        # Separate statement, so the vote statement's snapshot sees a competing vote that committed first.
+        cursor.execute(_LOCK_SQL, {"table": vote_model._meta.db_table, "target": str(target_id), "user": str(user_id)})
+        cursor.execute(sql, params)
+        row = cursor.fetchone()
+    if row is None:
+        raise target_model.DoesNotExist
+    return _vote_result(*row)
+
+
+def _vote_orm(target_model, vote_model, fk_name, target_id, user_id, value):
+    lookup = {f"{fk_name}_id": target_id, "user_id": user_id}
+    with transaction.atomic():
+        if value is None:
+            vote_model.objects.filter(**lookup).delete()
+        else:
+            vote_model.objects.update_or_create(**lookup, defaults={"value": value})
+        counts = target_model.objects.filter(pk=target_id).values_list("upvote_count", "downvote_count").first()
+    if counts is None:
+        raise target_model.DoesNotExist
+    return _vote_result(*counts, value)
+
+
+def _cast_vote(target_model, vote_model, fk_name, target_id, user_id, value):
+    if connection.vendor == "postgresql":
+        return _vote_postgres(target_model, vote_model, fk_name, target_id, user_id, value)
+    return _vote_orm(target_model, vote_model, fk_name, target_id, user_id, value)
+
+
+def vote_on_question(question_id, user_id, value):
+    """
+    Set the user's vote on a question to value (1 or -1), or remove it (None).
+    Returns {"upvote_count", "downvote_count", "user_vote"}.
+    """
+    return _cast_vote(Question, QuestionVote, "question", question_id, user_id, value)
+
+
+def vote_on_answer(answer_id, user_id, value):
+    """Same as vote_on_question, for answers."""
+    return _cast_vote(Answer, AnswerVote, "answer", answer_id, user_id, value)
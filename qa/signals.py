@@ -1,8 +1,13 @@
-"""Keep denormalized counts and is_answered in sync; keep search_vector in sync for PostgreSQL FTS."""
-from django.db import connection
-from django.db.models.signals import post_save, post_delete
+"""Keep denormalized counts (vote counters by delta) and is_answered in sync; keep search_vector in sync for PostgreSQL FTS."""
+from django.db import connection, transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_init, post_save
 from django.dispatch import receiver
 
+from verification.models import SeniorFollow
+
+from . import feed
+from .category_classifier import llm_classification_available
 from .models import Question, Answer, QuestionVote, AnswerVote
 
 
@@ -18,22 +23,61 @@ def update_question_search_vector(sender, instance, **kwargs):
     )
 
 
+@receiver(post_save, sender=Question)
+def queue_question_classification(sender, instance, created, **kwargs):
+    if not created or instance.category_source != "keyword" or not llm_classification_available():
+        return
+    from .tasks import classify_question
+
+    question_id = str(instance.pk)
+    transaction.on_commit(lambda: classify_question.delay(question_id))
+
+
+def _counter_deltas(old_value, new_value):
+    """F() updates that move one vote from old_value to new_value (1, -1 or None)."""
+    deltas = {"upvote_count": 0, "downvote_count": 0}
+    for value, step in ((old_value, -1), (new_value, 1)):
+        if value == 1:
+            deltas["upvote_count"] += step
+        elif value == -1:
+            deltas["downvote_count"] += step
+    return {field: F(field) + delta for field, delta in deltas.items() if delta}
+
+
+@receiver(post_init, sender=QuestionVote)
+@receiver(post_init, sender=AnswerVote)
+def remember_loaded_vote_value(sender, instance, **kwargs):
+    # update_or_create() loads the row, changes value and saves; keep the old value for the delta.
+    # New instances never use it (post_save passes created=True).
+    instance._loaded_value = instance.__dict__.get("value")
+
+
+def _apply_vote_delta(model, pk, instance, new_value, created=False):
+    old_value = None if created else getattr(instance, "_loaded_value", None)
+    updates = _counter_deltas(old_value, new_value)
+    if updates:
+        model.objects.filter(pk=pk).update(**updates)
+    instance._loaded_value = new_value
+
+
 @receiver(post_save, sender=QuestionVote)
+def update_question_vote_counts(sender, instance, created, **kwargs):
+    _apply_vote_delta(Question, instance.question_id, instance, instance.value, created)
+
+
 @receiver(post_delete, sender=QuestionVote)
-def update_question_vote_counts(sender, instance, **kwargs):
-    q = instance.question
-    up = QuestionVote.objects.filter(question=q, value=1).count()
-    down = QuestionVote.objects.filter(question=q, value=-1).count()
-    Question.objects.filter(pk=q.pk).update(upvote_count=up, downvote_count=down)
+def remove_question_vote_count(sender, instance, **kwargs):
+    _apply_vote_delta(Question, instance.question_id, instance, None)
 
 
 @receiver(post_save, sender=AnswerVote)
+def update_answer_vote_counts(sender, instance, created, **kwargs):
+    _apply_vote_delta(Answer, instance.answer_id, instance, instance.value, created)
+
+
 @receiver(post_delete, sender=AnswerVote)
-def update_answer_vote_counts(sender, instance, **kwargs):
-    a = instance.answer
-    up = AnswerVote.objects.filter(answer=a, value=1).count()
-    down = AnswerVote.objects.filter(answer=a, value=-1).count()
-    Answer.objects.filter(pk=a.pk).update(upvote_count=up, downvote_count=down)
+def remove_answer_vote_count(sender, instance, **kwargs):
+    _apply_vote_delta(Answer, instance.answer_id, instance, None)
 
 
 @receiver(post_save, sender=Answer)
@@ -47,3 +91,28 @@ def set_question_unanswered(sender, instance, **kwargs):
     from .models import Answer as AnswerModel
     if not AnswerModel.objects.filter(question_id=instance.question_id).exists():
         Question.objects.filter(pk=instance.question_id).update(is_answered=False)
+
+
+@receiver(post_save, sender=Answer)
+def fan_out_answer_to_follower_feeds(sender, instance, created, **kwargs):
+    if not created or not feed.fanout_enabled():
+        return
+    from .tasks import fan_out_answer_to_feeds
+
+    answer_id = str(instance.pk)
+    transaction.on_commit(lambda: fan_out_answer_to_feeds.delay(answer_id))
+
+
+@receiver(post_save, sender=SeniorFollow)
+def backfill_feed_on_follow(sender, instance, created, **kwargs):
+    if not created or not feed.fanout_enabled():
+        return
+    from .tasks import backfill_feed_for_follow
+
+    follower_id, senior_id = str(instance.follower_id), str(instance.senior_id)
+    transaction.on_commit(lambda: backfill_feed_for_follow.delay(follower_id, senior_id))
+
+
+@receiver(post_delete, sender=SeniorFollow)
+def clear_feed_on_unfollow(sender, instance, **kwargs):
+    feed.remove_follow(instance.follower_id, instance.senior_id)
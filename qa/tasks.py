@@ -0,0 +1,41 @@
+import logging
+
+from celery import shared_task
+
+from . import feed
+from .category_classifier import upgrade_question_category
+
+logger = logging.getLogger("qa.tasks")
+
+
+@shared_task(bind=True, max_retries=3)
+def fan_out_answer_to_feeds(self, answer_id):
+    logger.info("fan_out_answer_to_feeds.start", extra={"answer_id": str(answer_id)})
+    try:
+        created = feed.fan_out_answer(answer_id)
+        logger.info("fan_out_answer_to_feeds.success", extra={"answer_id": str(answer_id), "created": created})
+        return created
+    except Exception as exc:  # pragma: no cover
+        logger.exception("fan_out_answer_to_feeds.failure")
+        raise self.retry(exc=exc, countdown=2 ** self.request.retries)
+
+
+@shared_task(bind=True, max_retries=3)
+def backfill_feed_for_follow(self, follower_id, senior_id):
+    try:
+        return feed.backfill_follow(follower_id, senior_id)
+    except Exception as exc:  # pragma: no cover
+        logger.exception("backfill_feed_for_follow.failure")
+        raise self.retry(exc=exc, countdown=2 ** self.request.retries)
+
+
+@shared_task(bind=True, max_retries=3)
+def classify_question(self, question_id):
+    """Upgrade a new question's keyword category with the LLM classification."""
+    try:
+        upgraded = upgrade_question_category(question_id)
+        logger.info("classify_question.success", extra={"question_id": str(question_id), "upgraded": upgraded})
+        return upgraded
+    except Exception as exc:  # pragma: no cover
+        logger.exception("classify_question.failure")
+        raise self.retry(exc=exc, countdown=2 ** self.request.retries)
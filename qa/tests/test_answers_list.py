@@ -0,0 +1,60 @@
+"""Answer lists resolve the viewer's votes in bulk; long threads can be cursor-paginated."""
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from qa.models import Answer, AnswerVote, Question
+
+
+class AnswersListTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.asker = User.objects.create(username="asker", email="asker@example.com")
+        self.viewer = User.objects.create(username="viewer", email="viewer@example.com")
+        self.question = Question.objects.create(author=self.asker, title="Is there a gym?", slug="gym")
+        self.answered = 0
+
+    def _add_answers(self, count):
+        for _ in range(count):
+            senior = User.objects.create(
+                username=f"senior{self.answered}",
+                email=f"senior{self.answered}@example.com",
+                is_verified_senior=True,
+            )
+            self.answered += 1
+            answer = Answer.objects.create(question=self.question, author=senior, body="Yes")
+            AnswerVote.objects.create(answer=answer, user=self.viewer, value=-1)
+
+    def _get(self, url):
+        self.client.force_authenticate(User.objects.get(pk=self.viewer.pk))
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, response.content)
+        return len(queries), response.json()
+
+    def test_answers_list_and_detail_query_count_is_constant(self):
+        for url in (f"/api/questions/{self.question.slug}/answers/", f"/api/questions/{self.question.slug}/"):
+            self._add_answers(2)
+            small, _ = self._get(url)
+            self._add_answers(10)
+            large, data = self._get(url)
+            self.assertEqual(small, large, url)
+            answers = data if isinstance(data, list) else data["answers"]
+            self.assertEqual(len(answers), self.answered)
+            self.assertTrue(all(answer["user_vote"] == -1 for answer in answers))
+
+    def test_cursor_pagination_is_opt_in(self):
+        self._add_answers(5)
+        url = f"/api/questions/{self.question.slug}/answers/"
+        _, page = self._get(f"{url}?page_size=2")
+        self.assertEqual(len(page["results"]), 2)
+        seen = [answer["id"] for answer in page["results"]]
+        while page["next"]:
+            _, page = self._get(page["next"])
+            seen += [answer["id"] for answer in page["results"]]
+        expected = [str(pk) for pk in Answer.objects.order_by("created_at", "id").values_list("pk", flat=True)]
+        self.assertEqual(seen, expected)
+        _, plain = self._get(url)
+        self.assertEqual(len(plain), 5)
@@ -1,9 +1,14 @@
 """Unit tests for Q&A category classifier."""
 from unittest.mock import patch, MagicMock
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.core.cache import cache
 
+from accounts.models import User
+from notifications.tasks import fan_out_new_question_notifications
+from qa.models import Question
+from qa.tasks import classify_question
+
 from qa.category_classifier import (
     classify_with_keywords,
     classify_with_groq,
@@ -24,10 +29,9 @@ class TestKeywordFallback(TestCase):
 
 
 class TestGroqReturnsTuple(TestCase):
-    @patch("qa.category_classifier.settings")
+    @override_settings(GROQ_API_KEY="test-key")
     @patch("groq.Groq")
-    def test_groq_returns_tuple(self, mock_groq_class, mock_settings):
-        mock_settings.GROQ_API_KEY = "test-key"
+    def test_groq_returns_tuple(self, mock_groq_class):
         mock_client = MagicMock()
         mock_response = MagicMock()
         mock_response.choices = [
@@ -37,6 +41,7 @@ class TestGroqReturnsTuple(TestCase):
         mock_groq_class.return_value = mock_client
 
         out = classify_with_groq("Is NIAT good?")
+        mock_client.chat.completions.create.assert_called_once()
         self.assertIsInstance(out, tuple, "classify_with_groq should return a tuple")
         self.assertEqual(len(out), 2, "tuple should have 2 elements")
         self.assertIsInstance(out[0], str, "first element should be str (category)")
@@ -76,3 +81,48 @@ class TestLowConfidenceUsesKeyword(TestCase):
         )
         self.assertIn("category", result)
         self.assertIn("confidence", result)
+
+
+@override_settings(LLM_BACKEND="fake")
+class TestAsyncQuestionClassification(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.author = User.objects.create(username="asker", email="asker@example.com")
+
+    def _ask(self, title):
+        return Question.objects.create(author=self.author, title=title, body="")
+
+    def _ask_and_commit(self, title):
+        """Create a question and run its on_commit hooks; returns (question, classify_question.delay mock)."""
+        with patch.object(classify_question, "delay") as delay, patch.object(fan_out_new_question_notifications, "delay"):
+            with self.captureOnCommitCallbacks(execute=True):
+                question = self._ask(title)
+        return question, delay
+
+    def test_question_saved_with_keywords_then_upgraded_after_commit(self):
+        with patch("qa.category_classifier.classify_with_groq") as groq:
+            question, delay = self._ask_and_commit("Do I get a job through placement support?")
+        groq.assert_not_called()
+        self.assertEqual((question.category, question.category_source), ("Placements & Career", "keyword"))
+        delay.assert_called_once_with(str(question.pk))
+
+        with patch("qa.category_classifier.classify_with_groq", return_value=("Faculty & Academics", 0.8)):
+            self.assertTrue(classify_question(str(question.pk)))
+        question.refresh_from_db()
+        self.assertEqual(question.category, "Faculty & Academics")
+        self.assertEqual((question.category_confidence, question.category_source), (0.8, "llm"))
+
+    def test_cached_llm_result_is_used_on_save(self):
+        title = "Are there mentors for projects?"
+        with patch("qa.category_classifier.classify_with_groq", return_value=("Faculty & Academics", 0.8)):
+            classifier.classify(title)
+        question, delay = self._ask_and_commit(title)
+        self.assertEqual((question.category, question.category_source), ("Faculty & Academics", "llm"))
+        delay.assert_not_called()
+
+    def test_manual_categories_are_not_overwritten(self):
+        question = self._ask("Is the hostel safe?")
+        Question.objects.filter(pk=question.pk).update(category="Campus Life", category_source="manual")
+        with patch("qa.category_classifier.classify_with_groq") as groq:
+            self.assertFalse(classify_question(str(question.pk)))
+        groq.assert_not_called()
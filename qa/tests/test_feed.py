@@ -0,0 +1,71 @@
+"""Materialized follower answer feed (fan-out on write with hybrid pull)."""
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from qa import feed
+from qa.models import Answer, FeedEntry, Question
+from verification.models import SeniorFollow, SeniorProfile
+
+
+@override_settings(ANSWER_FEED_FANOUT=True, ANSWER_FEED_PULL_THRESHOLD=2)
+class AnswerFeedTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.student = User.objects.create(username="student", email="student@example.com")
+        self.asker = User.objects.create(username="asker", email="asker@example.com")
+        self.senior = self._senior("senior")
+        self.question = Question.objects.create(author=self.asker, title="Is there a gym?", slug="gym")
+        self.client.force_authenticate(self.student)
+
+    def _senior(self, username):
+        senior = User.objects.create(username=username, email=f"{username}@example.com", is_verified_senior=True)
+        SeniorProfile.objects.create(user=senior, status="approved")
+        return senior
+
+    def _answer(self, author, question=None):
+        question = question or Question.objects.create(
+            author=self.asker, title=f"Question for {author.username}", slug=f"q-{author.username}-{Answer.objects.count()}"
+        )
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            answer = Answer.objects.create(question=question, author=author, body="Answer")
+        self.assertEqual(len(callbacks), 1)
+        feed.fan_out_answer(answer.pk)
+        return answer
+
+    def _feed_ids(self):
+        return [row["id"] for row in self.client.get("/api/feed/answers/").json()["results"]]
+
+    def test_follow_backfills_and_new_answers_fan_out(self):
+        old = self._answer(self.senior, self.question)
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            SeniorFollow.objects.create(follower=self.student, senior=self.senior)
+        self.assertEqual(len(callbacks), 1)
+        feed.backfill_follow(self.student.pk, self.senior.pk)
+        new = self._answer(self.senior)
+        self.assertEqual(FeedEntry.objects.filter(user=self.student).count(), 2)
+        self.assertEqual(self._feed_ids(), [str(new.pk), str(old.pk)])
+
+        SeniorFollow.objects.filter(follower=self.student, senior=self.senior).delete()
+        self.assertFalse(FeedEntry.objects.filter(user=self.student).exists())
+        self.assertEqual(self._feed_ids(), [])
+
+    def test_popular_seniors_are_pulled_at_read_time(self):
+        popular = self._senior("popular")
+        for i in range(3):
+            fan = User.objects.create(username=f"fan{i}", email=f"fan{i}@example.com")
+            SeniorFollow.objects.create(follower=fan, senior=popular)
+        SeniorFollow.objects.create(follower=self.student, senior=popular)
+        SeniorFollow.objects.create(follower=self.student, senior=self.senior)
+
+        pulled = self._answer(popular)
+        pushed = self._answer(self.senior)
+        self.assertFalse(FeedEntry.objects.filter(answer=pulled).exists())
+        self.assertEqual(self._feed_ids(), [str(pushed.pk), str(pulled.pk)])
+
+    @override_settings(ANSWER_FEED_FANOUT=False)
+    def test_pull_only_when_fan_out_is_off(self):
+        SeniorFollow.objects.create(follower=self.student, senior=self.senior)
+        answer = Answer.objects.create(question=self.question, author=self.senior, body="Answer")
+        self.assertFalse(FeedEntry.objects.exists())
+        self.assertEqual(self._feed_ids(), [str(answer.pk)])
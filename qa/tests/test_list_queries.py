@@ -0,0 +1,68 @@
+"""Question lists must not issue per-question or per-answer queries."""
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from qa.models import Answer, AnswerVote, Question
+
+
+class QuestionListQueryCountTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.asker = User.objects.create(username="asker", email="asker@example.com")
+        self.seniors = [
+            User.objects.create(username=f"senior{n}", email=f"senior{n}@example.com", is_verified_senior=True)
+            for n in range(2)
+        ]
+        self.viewer = User.objects.create(username="viewer", email="viewer@example.com")
+        self.created = 0
+
+    def _add_questions(self, count):
+        for _ in range(count):
+            i = self.created
+            self.created += 1
+            question = Question.objects.create(
+                author=self.asker,
+                title=f"Hostel question {i}",
+                slug=f"hostel-{i}",
+                is_faq=True,
+                faq_order=i,
+            )
+            for senior in self.seniors:
+                answer = Answer.objects.create(question=question, author=senior, body="Answer")
+                AnswerVote.objects.create(answer=answer, user=self.viewer, value=1)
+
+    def _count(self, url, user):
+        if user is not None:
+            self.client.force_authenticate(User.objects.get(pk=user.pk))
+        else:
+            self.client.force_authenticate(None)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, response.content)
+        return len(queries), response.json()
+
+    def _assert_constant(self, url, results):
+        for user in (None, self.viewer):
+            self._add_questions(2)
+            small, _ = self._count(url, user)
+            self._add_questions(8)
+            large, data = self._count(url, user)
+            self.assertEqual(small, large, f"{url} as {user}")
+            rows = results(data)
+            self.assertTrue(rows)
+            first_vote = rows[0]["answer"]["user_vote"] if "answer" in rows[0] else rows[0]["answers"][0]["user_vote"]
+            self.assertEqual(first_vote, 1 if user else None)
+
+    def test_question_list(self):
+        self._assert_constant("/api/questions/", lambda data: data["results"])
+
+    def test_question_search(self):
+        self._assert_constant("/api/questions/search/?q=hostel", lambda data: data["results"])
+
+    def test_faq_list(self):
+        self._assert_constant("/api/faqs/", lambda data: data)
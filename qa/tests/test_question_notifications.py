@@ -0,0 +1,63 @@
+"""Fan-out of "new question" notifications to verified seniors."""
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from notifications import tasks
+from notifications.models import Notification
+from qa.models import Question
+
+
+def _make_seniors(count, start=0):
+    return User.objects.bulk_create(
+        [
+            User(username=f"senior{i}", email=f"senior{i}@example.com", is_verified_senior=True)
+            for i in range(start, start + count)
+        ]
+    )
+
+
+class QuestionCreateFanOutTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.asker = User.objects.create_user(username="asker", email="asker@example.com", password="x")
+
+    def _ask(self, title):
+        self.client.force_authenticate(User.objects.get(pk=self.asker.pk))
+        with CaptureQueriesContext(connection) as queries:
+            with self.captureOnCommitCallbacks(execute=False) as callbacks:
+                response = self.client.post("/api/questions/", {"title": title, "body": ""}, format="json")
+        self.assertEqual(response.status_code, 201, response.content)
+        return len(queries), callbacks
+
+    def test_question_create_query_count_is_independent_of_senior_count(self):
+        _make_seniors(3)
+        small, callbacks = self._ask("How is the hostel food?")
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(Notification.objects.count(), 0)
+
+        _make_seniors(300, start=3)
+        large, _ = self._ask("How are the placements?")
+        self.assertEqual(small, large)
+
+    def test_fan_out_notifies_each_senior_once_in_chunked_batches(self):
+        _make_seniors(25)
+        User.objects.create_user(username="inactive", is_verified_senior=True, is_active=False)
+        question = Question.objects.create(author=self.asker, title="Is there a library?", slug="library")
+
+        with patch.object(tasks, "QUESTION_FANOUT_CHUNK_SIZE", 10):
+            with CaptureQueriesContext(connection) as queries:
+                created = tasks.fan_out_new_question_notifications(str(question.pk))
+        self.assertEqual(created, 25)
+        # question + recipient id cursor + content type, then dedup SELECT, notification
+        # type and one INSERT per chunk (3 chunks); never one query per senior.
+        self.assertLessEqual(len(queries), 3 + 3 * 3)
+        self.assertEqual(Notification.objects.filter(object_id=question.pk).count(), 25)
+
+        # A retry inside the dedup window creates nothing new.
+        self.assertEqual(tasks.fan_out_new_question_notifications(str(question.pk)), 0)
+        self.assertEqual(Notification.objects.filter(object_id=question.pk).count(), 25)
@@ -0,0 +1,92 @@
+"""Delta-maintained vote counters and their reconciliation."""
+import threading
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import close_old_connections, connection
+from django.test import TestCase, TransactionTestCase, skipUnlessDBFeature
+from django.test.utils import CaptureQueriesContext
+
+from accounts.models import User
+from qa.models import Answer, AnswerVote, Question, QuestionVote
+
+
+def _counts(obj):
+    obj.refresh_from_db(fields=["upvote_count", "downvote_count"])
+    return obj.upvote_count, obj.downvote_count
+
+
+class VoteCounterSignalTests(TestCase):
+    def setUp(self):
+        self.author = User.objects.create(username="asker", email="asker@example.com")
+        self.voter = User.objects.create(username="voter", email="voter@example.com")
+        self.question = Question.objects.create(author=self.author, title="Is there a gym?", slug="gym")
+
+    def test_create_switch_and_delete_apply_deltas(self):
+        QuestionVote.objects.update_or_create(question=self.question, user=self.voter, defaults={"value": 1})
+        self.assertEqual(_counts(self.question), (1, 0))
+
+        with CaptureQueriesContext(connection) as queries:
+            QuestionVote.objects.update_or_create(question=self.question, user=self.voter, defaults={"value": -1})
+        self.assertEqual(_counts(self.question), (0, 1))
+        self.assertFalse(any("COUNT(" in q["sql"] for q in queries.captured_queries))
+
+        QuestionVote.objects.update_or_create(question=self.question, user=self.voter, defaults={"value": -1})
+        self.assertEqual(_counts(self.question), (0, 1))
+
+        QuestionVote.objects.filter(question=self.question, user=self.voter).delete()
+        self.assertEqual(_counts(self.question), (0, 0))
+
+    def test_answer_votes(self):
+        answer = Answer.objects.create(question=self.question, author=self.author, body="Yes")
+        vote = AnswerVote.objects.create(answer=answer, user=self.voter, value=-1)
+        vote.value = 1
+        vote.save()
+        self.assertEqual(_counts(answer), (1, 0))
+        vote.delete()
+        self.assertEqual(_counts(answer), (0, 0))
+
+    def test_reconcile_repairs_drift(self):
+        QuestionVote.objects.create(question=self.question, user=self.voter, value=1)
+        Question.objects.filter(pk=self.question.pk).update(upvote_count=7, downvote_count=2)
+        out = StringIO()
+        call_command("reconcile_vote_counts", "--dry-run", stdout=out)
+        self.assertIn("1 question(s)", out.getvalue())
+        self.assertEqual(_counts(self.question), (7, 2))
+
+        call_command("reconcile_vote_counts", stdout=StringIO())
+        self.assertEqual(_counts(self.question), (1, 0))
+
+
+@skipUnlessDBFeature("has_select_for_update")
+class ConcurrentVoteTests(TransactionTestCase):
+    """Many users voting and switching on one question at once must not lose updates."""
+
+    def test_concurrent_votes_keep_counts_exact(self):
+        author = User.objects.create(username="asker", email="asker@example.com")
+        question = Question.objects.create(author=author, title="Hot question", slug="hot")
+        voters = User.objects.bulk_create(
+            [User(username=f"voter{i}", email=f"voter{i}@example.com") for i in range(20)]
+        )
+        barrier = threading.Barrier(len(voters))
+        errors = []
+
+        def vote(index, user):
+            try:
+                barrier.wait()
+                QuestionVote.objects.update_or_create(question=question, user=user, defaults={"value": 1})
+                if index % 2:
+                    QuestionVote.objects.update_or_create(question=question, user=user, defaults={"value": -1})
+            except Exception as exc:  # pragma: no cover - surfaced below
+                errors.append(exc)
+            finally:
+                close_old_connections()
+
+        threads = [threading.Thread(target=vote, args=(i, user)) for i, user in enumerate(voters)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(_counts(question), (10, 10))
@@ -0,0 +1,91 @@
+"""Question and answer vote endpoints."""
+import threading
+from unittest import skipUnless
+
+from django.db import close_old_connections, connection
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from qa.models import Answer, Question
+from qa.services import vote_on_question
+
+
+class VoteEndpointTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.author = User.objects.create(username="asker", email="asker@example.com")
+        self.senior = User.objects.create(username="senior", email="senior@example.com", is_verified_senior=True)
+        self.voter = User.objects.create(username="voter", email="voter@example.com")
+        self.question = Question.objects.create(author=self.author, title="Is there a gym?", slug="gym")
+        self.answer = Answer.objects.create(question=self.question, author=self.senior, body="Yes")
+        self.client.force_authenticate(self.voter)
+
+    def test_any_user_can_vote_and_switch_on_a_question(self):
+        url = f"/api/questions/{self.question.slug}/"
+        response = self.client.post(url + "upvote/")
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.json(), {"upvote_count": 1, "downvote_count": 0, "user_vote": 1})
+        self.assertEqual(
+            self.client.post(url + "downvote/").json(),
+            {"upvote_count": 0, "downvote_count": 1, "user_vote": -1},
+        )
+        self.assertEqual(
+            self.client.delete(url + "downvote/").json(),
+            {"upvote_count": 0, "downvote_count": 0, "user_vote": None},
+        )
+
+    def test_answer_vote_returns_answer_with_counts(self):
+        url = f"/api/questions/{self.question.slug}/answers/{self.answer.pk}/upvote/"
+        data = self.client.post(url).json()
+        self.assertEqual((data["id"], data["upvote_count"], data["user_vote"]), (str(self.answer.pk), 1, 1))
+        self.assertEqual(data["author"]["username"], "senior")
+        self.assertEqual(self.client.delete(url).json()["upvote_count"], 0)
+
+    def test_unknown_targets_404(self):
+        self.assertEqual(self.client.post("/api/questions/missing/upvote/").status_code, 404)
+        url = f"/api/questions/{self.question.slug}/answers/not-a-uuid/upvote/"
+        self.assertEqual(self.client.post(url).status_code, 404)
+
+    def test_postgres_vote_is_one_statement(self):
+        if connection.vendor != "postgresql":
+            self.skipTest("single-statement upsert is PostgreSQL only")
+        with CaptureQueriesContext(connection) as queries:
+            self.client.post(f"/api/questions/{self.question.slug}/upvote/")
+        # slug lookup + advisory lock + the vote statement
+        self.assertEqual(len(queries), 3)
+
+
+@skipUnless(connection.vendor == "postgresql", "single-statement upsert is PostgreSQL only")
+class ConcurrentFirstVoteTests(TransactionTestCase):
+    """The same user's first votes racing each other must be counted once."""
+
+    def test_racing_first_votes_count_once(self):
+        author = User.objects.create(username="asker", email="asker@example.com")
+        voter = User.objects.create(username="voter", email="voter@example.com")
+        values = [1, 1, -1, 1, -1, -1, 1, 1]
+        for round_number in range(5):
+            question = Question.objects.create(author=author, title=f"Race {round_number}", slug=f"race-{round_number}")
+            barrier = threading.Barrier(len(values))
+            errors = []
+
+            def vote(value):
+                try:
+                    barrier.wait()
+                    vote_on_question(question.pk, voter.pk, value)
+                except Exception as exc:  # pragma: no cover - surfaced below
+                    errors.append(exc)
+                finally:
+                    close_old_connections()
+
+            threads = [threading.Thread(target=vote, args=(value,)) for value in values]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            self.assertEqual(errors, [])
+            question.refresh_from_db()
+            stored = question.votes.get(user=voter).value
+            self.assertEqual((question.upvote_count, question.downvote_count), (int(stored == 1), int(stored == -1)))
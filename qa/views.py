@@ -1,6 +1,7 @@
 import logging
-from django.core.exceptions import ObjectDoesNotExist
-from django.db.models import Count, OuterRef, Prefetch, Subquery
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.http import Http404
+from django.db.models import Count, OuterRef, Subquery
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -9,7 +10,9 @@ from rest_framework.permissions import IsAuthenticatedOrReadOnly, AllowAny
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.decorators import api_view, permission_classes
 
-from .models import Question, Answer, QuestionVote, AnswerVote
+from core.counters import question_views
+
+from .models import Question, Answer, QuestionVote
 from .category_classifier import CATEGORIES
 from .permissions import IsAuthorOrReadOnly, IsVerifiedSenior
 
@@ -35,8 +38,12 @@ from .serializers import (
     QuestionCreateUpdateSerializer,
     AnswerSerializer,
     FAQSerializer,
+    answer_data_with_vote,
+    answers_prefetch,
+    answers_with_user_vote,
 )
-from .pagination import QuestionCursorPagination
+from .pagination import AnswerCursorPagination, QuestionCursorPagination
+from .services import vote_on_answer, vote_on_question
 
 logger = logging.getLogger(__name__)
 
@@ -53,11 +60,15 @@ def question_categories_view(request):
 VALUE_DOWN = -1
 
 
-def _answers_prefetch():
-    return Prefetch(
-        "answers",
-        queryset=Answer.objects.order_by("created_at").select_related("author"),
-    )
+# Actions that load answers themselves (or not at all); skip the all-answers prefetch.
+ANSWERS_NOT_PREFETCHED = {
+    "upvote",
+    "downvote",
+    "answers_list",
+    "answer_detail",
+    "answer_upvote",
+    "answer_downvote",
+}
 
 
 class QuestionViewSet(viewsets.ModelViewSet):
@@ -68,7 +79,14 @@ class QuestionViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticatedOrReadOnly, IsAuthorOrReadOnly]
 
     def get_permissions(self):
-        if self.action in ("answers_list", "answer_detail", "answer_upvote", "answer_downvote"):
+        if self.action in (
+            "upvote",
+            "downvote",
+            "answers_list",
+            "answer_detail",
+            "answer_upvote",
+            "answer_downvote",
+        ):
             return [IsAuthenticatedOrReadOnly()]
         return [IsAuthenticatedOrReadOnly(), IsAuthorOrReadOnly()]
 
@@ -81,7 +99,8 @@ class QuestionViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         qs = super().get_queryset()
-        qs = qs.prefetch_related(_answers_prefetch())
+        if self.action not in ANSWERS_NOT_PREFETCHED:
+            qs = qs.prefetch_related(answers_prefetch(self.request.user))
         if self.action == "retrieve":
             qs = qs.prefetch_related("followups", "followups__author")
         answered = self.request.query_params.get("answered")
@@ -139,71 +158,45 @@ class QuestionViewSet(viewsets.ModelViewSet):
 
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
-        Question.objects.filter(pk=instance.pk).update(view_count=instance.view_count + 1)
-        instance.refresh_from_db()
+        # Buffered, atomic increment; show the stored count plus views not yet flushed.
+        instance.view_count += question_views.incr(instance.pk)
         serializer = self.get_serializer(instance)
         return Response(serializer.data)
 
-    def _vote_response_question(self, question, user):
-        vote = QuestionVote.objects.filter(question=question, user=user).first()
-        question.refresh_from_db()
-        return {
-            "upvote_count": question.upvote_count,
-            "downvote_count": question.downvote_count,
-            "user_vote": vote.value if vote else None,
-        }
-
-    @action(detail=True, methods=["post", "delete"], url_path="upvote")
-    def upvote(self, request, slug=None):
+    def _question_vote(self, request, slug, value):
         if not request.user.is_authenticated:
             return Response(
                 {"detail": "Authentication required."},
                 status=status.HTTP_401_UNAUTHORIZED,
             )
-        question = self.get_object()
-        if request.method == "POST":
-            QuestionVote.objects.update_or_create(
-                question=question,
-                user=request.user,
-                defaults={"value": VALUE_UP},
-            )
-        else:
-            QuestionVote.objects.filter(question=question, user=request.user).delete()
-        return Response(self._vote_response_question(question, request.user))
+        question_id = Question.objects.filter(slug=slug).values_list("pk", flat=True).first()
+        if question_id is None:
+            raise Http404
+        if request.method != "POST":
+            value = None
+        return Response(vote_on_question(question_id, request.user.pk, value))
+
+    @action(detail=True, methods=["post", "delete"], url_path="upvote")
+    def upvote(self, request, slug=None):
+        return self._question_vote(request, slug, VALUE_UP)
 
     @action(detail=True, methods=["post", "delete"], url_path="downvote")
     def downvote(self, request, slug=None):
-        if not request.user.is_authenticated:
-            return Response(
-                {"detail": "Authentication required."},
-                status=status.HTTP_401_UNAUTHORIZED,
-            )
-        question = self.get_object()
-        if request.method == "POST":
-            QuestionVote.objects.update_or_create(
-                question=question,
-                user=request.user,
-                defaults={"value": VALUE_DOWN},
-            )
-        else:
-            QuestionVote.objects.filter(question=question, user=request.user).delete()
-        return Response(self._vote_response_question(question, request.user))
+        return self._question_vote(request, slug, VALUE_DOWN)
 
     @action(detail=True, methods=["get", "post"], url_path="answers")
     def answers_list(self, request, slug=None):
         question = self.get_object()
         if request.method == "GET":
-            answers = question.answers.order_by("created_at").select_related("author")
-            out = []
-            for ans in answers:
-                data = AnswerSerializer(ans).data
-                if request.user.is_authenticated:
-                    v = ans.votes.filter(user=request.user).first()
-                    data["user_vote"] = v.value if v else None
-                else:
-                    data["user_vote"] = None
-                out.append(data)
-            return Response(out)
+            # The viewer's votes come from one annotated query, not one lookup per answer.
+            answers = answers_with_user_vote(request.user).filter(question=question)
+            paginator = AnswerCursorPagination()
+            if paginator.is_requested(request):
+                page = paginator.paginate_queryset(answers, request, view=self)
+                return paginator.get_paginated_response(
+                    [answer_data_with_vote(ans, request) for ans in page]
+                )
+            return Response([answer_data_with_vote(ans, request) for ans in answers])
 
         if request.method == "POST":
             if not _user_is_verified_senior(request.user):
@@ -290,25 +283,20 @@ class QuestionViewSet(viewsets.ModelViewSet):
                 {"detail": "Authentication required."},
                 status=status.HTTP_401_UNAUTHORIZED,
             )
-        question = self.get_object()
-        ans = self._get_answer_or_404(question, answer_id)
+        try:
+            ans = Answer.objects.select_related("author").filter(pk=answer_id, question__slug=slug).first()
+        except (ValueError, ValidationError):
+            ans = None
         if not ans:
             return Response(
                 {"detail": "Answer not found."},
                 status=status.HTTP_404_NOT_FOUND,
             )
-        if request.method == "POST":
-            AnswerVote.objects.update_or_create(
-                answer=ans,
-                user=request.user,
-                defaults={"value": value},
-            )
-        else:
-            AnswerVote.objects.filter(answer=ans, user=request.user).delete()
-        ans.refresh_from_db()
+        result = vote_on_answer(ans.pk, request.user.pk, value if request.method == "POST" else None)
+        ans.upvote_count = result["upvote_count"]
+        ans.downvote_count = result["downvote_count"]
         data = AnswerSerializer(ans).data
-        v = ans.votes.filter(user=request.user).first()
-        data["user_vote"] = v.value if v else None
+        data["user_vote"] = result["user_vote"]
         return Response(data)
 
 
@@ -320,7 +308,7 @@ class FAQListView(APIView):
         qs = (
             Question.objects.filter(is_faq=True)
             .select_related("author")
-            .prefetch_related(_answers_prefetch())
+            .prefetch_related(answers_prefetch(request.user), "followups", "followups__author")
             .order_by("faq_order", "-created_at")
         )
         if request.user.is_authenticated:
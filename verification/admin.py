@@ -59,7 +59,7 @@ class SeniorProfileAdmin(admin.ModelAdmin):
         
         self.message_user(
             request,
-            f"Successfully approved {count} senior profile(s). Approval emails sent."
+            f"Successfully approved {count} senior profile(s). Approval emails queued."
         )
     approve_seniors.short_description = "Approve selected senior profiles"
     
@@ -209,7 +209,7 @@ class SeniorRegistrationAdmin(admin.ModelAdmin):
         
         self.message_user(
             request,
-            f"Successfully rejected {count} registration(s). Rejection emails sent."
+            f"Successfully rejected {count} registration(s). Rejection emails queued."
         )
     reject_registrations.short_description = "Reject selected registrations"
 
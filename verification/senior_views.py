@@ -3,10 +3,13 @@ Senior follow/unfollow API. Only verified seniors can be followed.
 List verified seniors for directory (GET /api/seniors/).
 """
 from rest_framework import status
+from rest_framework.pagination import CursorPagination
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.contrib.auth import get_user_model
+from django.db.models import F, Value
+from django.db.models.functions import Coalesce
 
 from accounts.serializers import PublicProfileSerializer
 from .models import SeniorFollow, SeniorProfile
@@ -18,17 +21,45 @@ def error_response(code: str, detail: str, status_code: int = status.HTTP_400_BA
     return Response({"code": code, "detail": detail}, status=status_code)
 
 
+class SeniorDirectoryPagination(CursorPagination):
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = "username"  # unique, so cursors are stable
+    cursor_query_param = "cursor"
+
+
 class SeniorListView(APIView):
-    """GET: list verified seniors for directory. Optional ?search= filters by username."""
+    """
+    GET: cursor-paginated verified seniors for the directory. Optional ?search= filters by username
+    (trigram-indexed on PostgreSQL). Follower counts come from SeniorProfile in the same query and
+    the viewer's follows are loaded once per page.
+    """
     permission_classes = [AllowAny]
 
     def get(self, request):
-        qs = User.objects.filter(is_verified_senior=True, is_active=True).order_by("username")
+        qs = User.objects.filter(is_verified_senior=True, is_active=True).annotate(
+            senior_follower_count=Coalesce(F("senior_profile__follower_count"), Value(0)),
+        )
         search = (request.query_params.get("search") or "").strip()
         if search:
             qs = qs.filter(username__icontains=search)
-        serializer = PublicProfileSerializer(qs, many=True, context={"request": request})
-        return Response(serializer.data)
+        paginator = SeniorDirectoryPagination()
+        page = paginator.paginate_queryset(qs, request, view=self)
+        followed_ids = None
+        if request.user.is_authenticated:
+            followed_ids = set(
+                SeniorFollow.objects.filter(
+                    follower=request.user,
+                    senior_id__in=[senior.pk for senior in page],
+                ).values_list("senior_id", flat=True)
+            )
+        serializer = PublicProfileSerializer(
+            page,
+            many=True,
+            context={"request": request, "followed_senior_ids": followed_ids},
+        )
+        return paginator.get_paginated_response(serializer.data)
 
 
 class SeniorFollowView(APIView):
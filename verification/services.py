@@ -1,15 +1,16 @@
 """
 Email services for verification workflow.
+Emails are queued in the transactional outbox (notifications.outbox) and sent by a worker.
 """
 import builtins
 import uuid as uuid_module
 from datetime import timedelta
 
 from django.conf import settings
-from django.core.mail import send_mail
 from django.utils import timezone
 
 from accounts.models import User
+from notifications.outbox import enqueue_email
 from .models import MagicLoginToken, SeniorProfile
 
 
@@ -99,13 +100,7 @@ The NIATReviews Team
 Need help? Reply to this email or contact us at support@niatreviews.com
 """
 
-    send_mail(
-        subject,
-        message,
-        settings.DEFAULT_FROM_EMAIL,
-        [user.email],
-        fail_silently=False,
-    )
+    enqueue_email(subject, message, [user.email])
 
 
 def send_senior_approved_email(user):
@@ -144,13 +139,7 @@ The NIATReviews Team
 Questions? Reply to this email or visit our help center at niatreviews.com/help
 """
 
-    send_mail(
-        subject,
-        message,
-        settings.DEFAULT_FROM_EMAIL,
-        [user.email],
-        fail_silently=False,
-    )
+    enqueue_email(subject, message, [user.email])
 
 
 
@@ -186,13 +175,7 @@ The NIATReviews Team
 Need help? Reply to this email or contact us at support@niatreviews.com
 """
 
-    send_mail(
-        subject,
-        message,
-        settings.DEFAULT_FROM_EMAIL,
-        [registration.personal_email],
-        fail_silently=False,
-    )
+    enqueue_email(subject, message, [registration.personal_email])
 
 
 def send_senior_registration_approved_email(registration):
@@ -243,13 +226,7 @@ The NIATReviews Team
 Questions? Reply to this email or visit our help center at niatreviews.com/help
 """
 
-    send_mail(
-        subject,
-        message,
-        settings.DEFAULT_FROM_EMAIL,
-        [registration.personal_email],
-        fail_silently=False,
-    )
+    enqueue_email(subject, message, [registration.personal_email])
 
 
 def send_senior_registration_rejected_email(registration):
@@ -286,10 +263,4 @@ The NIATReviews Team
 Need help? Reply to this email or contact us at support@niatreviews.com
 """
 
-    send_mail(
-        subject,
-        message,
-        settings.DEFAULT_FROM_EMAIL,
-        [registration.personal_email],
-        fail_silently=False,
-    )
+    enqueue_email(subject, message, [registration.personal_email])
@@ -4,6 +4,7 @@ Tests for verification email workflow.
 from django.test import TestCase
 from django.core import mail
 from accounts.models import User
+from notifications.outbox import drain_outbox
 from .models import SeniorProfile
 
 
@@ -55,6 +56,9 @@ class SeniorVerificationEmailTests(TestCase):
         profile.status = "approved"
         profile.save()
         
+        # Emails are queued in the outbox; deliver them
+        drain_outbox()
+        
         # Check email was sent
         self.assertEqual(len(mail.outbox), 1)
         self.assertIn("You're Approved", mail.outbox[0].subject)
@@ -69,6 +73,7 @@ class SeniorVerificationEmailTests(TestCase):
         )
         profile.status = "approved"
         profile.save()
+        drain_outbox()
         
         # Clear mail outbox
         mail.outbox = []
@@ -76,6 +81,7 @@ class SeniorVerificationEmailTests(TestCase):
         # Update profile again (status still approved)
         profile.proof_summary = "Updated proof"
         profile.save()
+        drain_outbox()
         
         # No new email should be sent
         self.assertEqual(len(mail.outbox), 0)
@@ -0,0 +1,120 @@
+"""
+Tests for the transactional email outbox used by the verification workflow.
+"""
+import smtplib
+from datetime import timedelta
+from unittest import mock
+
+from django.core import mail
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from accounts.models import User
+from notifications.models import EmailOutbox
+from notifications.outbox import claim_due, drain_outbox, enqueue_email
+from notifications.tasks import drain_email_outbox
+from .models import SeniorProfile
+from .services import send_senior_received_email
+
+
+class EmailOutboxTests(TestCase):
+    def setUp(self):
+        mail.outbox = []
+
+    def _profile(self, username):
+        user = User.objects.create_user(username=username, email=f"{username}@example.com", password="testpass123")
+        return SeniorProfile.objects.create(user=user, proof_summary="Test proof")
+
+    def test_approval_queues_email_and_schedules_drain_after_commit(self):
+        profile = self._profile("senior")
+        with mock.patch.object(drain_email_outbox, "delay") as delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                profile.status = "approved"
+                profile.save()
+        self.assertEqual(len(mail.outbox), 0)
+        delay.assert_called_once_with()
+        row = EmailOutbox.objects.get()
+        self.assertEqual(row.to, ["senior@example.com"])
+        self.assertEqual(row.status, EmailOutbox.Status.PENDING)
+
+        self.assertEqual(drain_outbox(), {"sent": 1, "failed": 0})
+        self.assertIn("You're Approved", mail.outbox[0].subject)
+        self.assertEqual(EmailOutbox.objects.get().status, EmailOutbox.Status.SENT)
+
+    def test_services_queue_instead_of_sending(self):
+        user = User.objects.create_user(username="applicant", email="applicant@example.com", password="testpass123")
+        with mock.patch("django.core.mail.backends.locmem.EmailBackend.send_messages") as send:
+            send_senior_received_email(user)
+        send.assert_not_called()
+        self.assertEqual(EmailOutbox.objects.get().to, ["applicant@example.com"])
+
+    def test_batch_is_sent_over_one_connection_with_constant_queries(self):
+        for i in range(5):
+            enqueue_email("Subject", "Body", [f"user{i}@example.com"])
+        with mock.patch("notifications.outbox.get_connection", wraps=mail.get_connection) as get_connection:
+            with CaptureQueriesContext(connection) as queries:
+                self.assertEqual(drain_outbox(batch_size=10)["sent"], 5)
+        get_connection.assert_called_once()
+        self.assertEqual(len(mail.outbox), 5)
+        small = len(queries)
+        for i in range(20):
+            enqueue_email("Subject", "Body", [f"more{i}@example.com"])
+        with CaptureQueriesContext(connection) as queries:
+            drain_outbox(batch_size=50)
+        self.assertEqual(len(queries), small)
+
+    def test_failures_are_retried_with_backoff_then_marked_failed(self):
+        row = enqueue_email("Subject", "Body", ["user@example.com"])
+        with mock.patch(
+            "django.core.mail.backends.locmem.EmailBackend.send_messages",
+            side_effect=smtplib.SMTPServerDisconnected("gone"),
+        ):
+            with self.assertLogs("notifications.outbox", "WARNING"):
+                self.assertEqual(drain_outbox(), {"sent": 0, "failed": 1})
+            row.refresh_from_db()
+            self.assertEqual((row.status, row.attempts), (EmailOutbox.Status.PENDING, 1))
+            self.assertGreater(row.next_attempt_at, timezone.now())
+            self.assertEqual(drain_outbox(), {"sent": 0, "failed": 0})  # not due yet
+
+            EmailOutbox.objects.update(attempts=4, next_attempt_at=timezone.now() - timedelta(seconds=1))
+            with self.assertLogs("notifications.outbox", "WARNING"):
+                drain_outbox()
+        row.refresh_from_db()
+        self.assertEqual((row.status, row.attempts), (EmailOutbox.Status.FAILED, 5))
+        self.assertIn("SMTPServerDisconnected", row.last_error)
+
+    def test_unreachable_smtp_counts_an_attempt_for_every_claimed_row(self):
+        rows = [enqueue_email("Subject", "Body", [f"user{i}@example.com"]) for i in range(2)]
+        with mock.patch(
+            "django.core.mail.backends.locmem.EmailBackend.open", side_effect=ConnectionRefusedError("refused")
+        ):
+            with self.assertLogs("notifications.outbox", "WARNING"):
+                self.assertEqual(drain_outbox(), {"sent": 0, "failed": 2})
+        for row in rows:
+            row.refresh_from_db()
+            self.assertEqual((row.status, row.attempts), (EmailOutbox.Status.PENDING, 1))
+            self.assertGreater(row.next_attempt_at, timezone.now())
+            self.assertIn("ConnectionRefusedError", row.last_error)
+
+    def test_claimed_rows_are_leased_while_they_are_sent(self):
+        row = enqueue_email("Subject", "Body", ["user@example.com"])
+        claims_during_send = []
+
+        def send_messages(messages):
+            claims_during_send.append(claim_due(10))
+            return len(messages)
+
+        with mock.patch("django.core.mail.backends.locmem.EmailBackend.send_messages", side_effect=send_messages):
+            self.assertEqual(drain_outbox(), {"sent": 1, "failed": 0})
+        self.assertEqual(claims_during_send, [[]])
+        row.refresh_from_db()
+        self.assertEqual(row.status, EmailOutbox.Status.SENT)
+
+    def test_expired_lease_is_claimed_again(self):
+        row = enqueue_email("Subject", "Body", ["user@example.com"])
+        self.assertEqual([r.pk for r in claim_due(10)], [row.pk])
+        self.assertEqual(claim_due(10), [])
+        EmailOutbox.objects.update(next_attempt_at=timezone.now() - timedelta(seconds=1))
+        self.assertEqual([r.pk for r in claim_due(10)], [row.pk])
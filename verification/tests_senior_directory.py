@@ -0,0 +1,65 @@
+"""Tests for the paginated senior directory (GET /api/seniors/)."""
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from verification.models import SeniorFollow, SeniorProfile
+
+
+class SeniorDirectoryTests(TestCase):
+    url = "/api/seniors/"
+
+    def setUp(self):
+        self.client = APIClient()
+        self.viewer = User.objects.create(username="viewer", email="viewer@example.com")
+        self.created = 0
+
+    def _add_seniors(self, count):
+        seniors = []
+        for _ in range(count):
+            i = self.created
+            self.created += 1
+            senior = User.objects.create(
+                username=f"senior{i:03d}", email=f"senior{i}@example.com", is_verified_senior=True
+            )
+            SeniorProfile.objects.create(user=senior, status="approved")
+            SeniorFollow.objects.create(follower=self.viewer, senior=senior)
+            seniors.append(senior)
+        return seniors
+
+    def _get(self, url):
+        self.client.force_authenticate(User.objects.get(pk=self.viewer.pk))
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, response.content)
+        return len(queries), response.json()
+
+    def test_query_count_is_independent_of_page_size(self):
+        self._add_seniors(3)
+        small, _ = self._get(self.url)
+        self._add_seniors(30)
+        large, data = self._get(self.url)
+        self.assertEqual(small, large)
+        self.assertEqual(len(data["results"]), 33)
+        row = data["results"][0]
+        self.assertEqual((row["follower_count"], row["is_followed_by_me"]), (1, True))
+
+    def test_cursor_pages_cover_every_senior_in_username_order(self):
+        self._add_seniors(5)
+        _, page = self._get(f"{self.url}?page_size=2")
+        names = [row["username"] for row in page["results"]]
+        while page["next"]:
+            _, page = self._get(page["next"])
+            names += [row["username"] for row in page["results"]]
+        self.assertEqual(names, [f"senior{i:03d}" for i in range(5)])
+
+    def test_search_and_anonymous_follow_state(self):
+        self._add_seniors(3)
+        SeniorFollow.objects.filter(senior__username="senior001").delete()
+        _, data = self._get(f"{self.url}?search=OR001")
+        self.assertEqual([(r["username"], r["is_followed_by_me"]) for r in data["results"]], [("senior001", False)])
+        self.client.force_authenticate(None)
+        anonymous = self.client.get(self.url).json()["results"]
+        self.assertTrue(all(row["is_followed_by_me"] is None for row in anonymous))
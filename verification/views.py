@@ -25,12 +25,8 @@ class SeniorProfileCreateAPIView(generics.CreateAPIView):
         # Ensure user is set to the authenticated user
         profile = serializer.save(user=self.request.user)
         
-        # Send "received" email immediately
-        try:
-            send_senior_received_email(profile.user)
-        except Exception as e:
-            # Log error but don't fail the request
-            print(f"Failed to send senior received email: {e}")
+        # Queue "received" email; it is sent after commit by the outbox worker
+        send_senior_received_email(profile.user)
 
 
 class SeniorProfileDetailAPIView(generics.RetrieveAPIView):
@@ -64,12 +60,8 @@ class SeniorRegistrationCreateAPIView(generics.CreateAPIView):
         """
         registration = serializer.save()
         
-        # Send "received" email immediately
-        try:
-            send_senior_registration_received_email(registration)
-        except Exception as e:
-            # Log error but don't fail the request
-            print(f"Failed to send senior registration received email: {e}")
+        # Queue "received" email; it is sent after commit by the outbox worker
+        send_senior_registration_received_email(registration)
 
 
 class SeniorRegistrationListAPIView(generics.ListAPIView):